@@ -0,0 +1,61 @@
+"""Add category_ancestor closure table.
+
+Revision ID: 005
+Revises: 004
+
+Creates:
+- category_ancestor: transitive closure of category_parent, one row per
+  (category, ancestor) pair at its shortest depth. Rebuilt by ingest;
+  backfilled here from the existing category_parent rows.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "005"
+down_revision: str = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_ancestor",
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("ancestor_id", sa.UUID(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("category_id", "ancestor_id"),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["categories.id"]),
+    )
+    op.create_index(op.f("ix_category_ancestor_ancestor_id"), "category_ancestor", ["ancestor_id"])
+
+    # Backfill from the current canonical hierarchy
+    op.execute("""
+        INSERT INTO category_ancestor (category_id, ancestor_id, depth)
+        WITH RECURSIVE chain AS (
+            SELECT cp.category_id, cp.parent_id AS ancestor_id, 1 AS depth,
+                   ARRAY[cp.category_id, cp.parent_id] AS path
+            FROM category_parent cp
+
+            UNION ALL
+
+            SELECT ch.category_id, cp.parent_id, ch.depth + 1, ch.path || cp.parent_id
+            FROM chain ch
+            JOIN category_parent cp ON cp.category_id = ch.ancestor_id
+            WHERE NOT cp.parent_id = ANY(ch.path)
+        )
+        SELECT category_id, ancestor_id, MIN(depth)
+        FROM chain
+        -- A category is never its own ancestor (ingest skips it the same way)
+        WHERE ancestor_id <> category_id
+        GROUP BY category_id, ancestor_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_category_ancestor_ancestor_id"), table_name="category_ancestor")
+    op.drop_table("category_ancestor")
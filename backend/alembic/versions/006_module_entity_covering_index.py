@@ -0,0 +1,34 @@
+"""Replace module_entity's module_id index with a covering composite index.
+
+Revision ID: 006
+Revises: 005
+
+Per-module member lookups filter on (module_id, entity_type) and read only
+entity_key, so (module_id, entity_type, entity_key) serves them as index-only
+scans. It also covers plain module_id lookups, making ix_module_entity_module_id
+redundant. bundle_module and module_dependency need no change: their primary
+keys already lead with bundle_id and module_id.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "006"
+down_revision: str = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_module_entity_module_type_key",
+        "module_entity",
+        ["module_id", "entity_type", "entity_key"],
+    )
+    op.drop_index(op.f("ix_module_entity_module_id"), table_name="module_entity")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_module_entity_module_id"), "module_entity", ["module_id"])
+    op.drop_index("ix_module_entity_module_type_key", table_name="module_entity")
@@ -0,0 +1,35 @@
+"""Replace module_entity's entity_key index with a covering membership index.
+
+Revision ID: 007
+Revises: 006
+
+Membership lookups ("which modules contain this entity") filter on
+(entity_key, entity_type) and join on module_id, so
+(entity_key, entity_type) INCLUDE (module_id) serves them as index-only
+scans. It still leads with entity_key, making ix_module_entity_entity_key
+redundant.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "007"
+down_revision: str = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_module_entity_key_type",
+        "module_entity",
+        ["entity_key", "entity_type"],
+        postgresql_include=["module_id"],
+    )
+    op.drop_index(op.f("ix_module_entity_entity_key"), table_name="module_entity")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_module_entity_entity_key"), "module_entity", ["entity_key"])
+    op.drop_index("ix_module_entity_key_type", table_name="module_entity")
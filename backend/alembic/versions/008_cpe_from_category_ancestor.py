@@ -0,0 +1,127 @@
+"""Build category_property_effective from the category_ancestor closure.
+
+Revision ID: 008
+Revises: 007
+
+The view walked category_parent with a recursive CTE carrying path arrays on
+every refresh. category_ancestor (revision 005) already holds each ancestor at
+its shortest depth and is rebuilt by ingest before the view is refreshed, so
+inherited properties become a single join and refresh cost no longer grows
+with the number of inheritance paths. The view's rows are unchanged.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CLOSURE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS category_property_effective AS
+WITH all_properties AS (
+    -- Direct properties (depth = 0)
+    SELECT
+        cp.category_id,
+        cp.property_id,
+        cp.category_id as source_category_id,
+        0 as depth,
+        cp.is_required
+    FROM category_property cp
+
+    UNION ALL
+
+    -- Inherited properties, read from the category_ancestor closure
+    -- (each ancestor at its shortest depth) instead of walking category_parent
+    SELECT
+        ca.category_id,
+        cp.property_id,
+        cp.category_id as source_category_id,
+        ca.depth,
+        cp.is_required
+    FROM category_ancestor ca
+    JOIN category_property cp ON cp.category_id = ca.ancestor_id
+)
+SELECT DISTINCT ON (category_id, property_id)
+    category_id,
+    property_id,
+    source_category_id,
+    depth,
+    is_required
+FROM all_properties
+ORDER BY category_id, property_id, depth;
+"""
+
+RECURSIVE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS category_property_effective AS
+WITH RECURSIVE inheritance_chain AS (
+    -- Base case: direct parents
+    SELECT
+        cp.category_id,
+        cp.parent_id,
+        1 as depth,
+        ARRAY[cp.parent_id] as path
+    FROM category_parent cp
+
+    UNION ALL
+
+    -- Recursive case: grandparents and beyond
+    SELECT
+        ic.category_id,
+        cp.parent_id,
+        ic.depth + 1,
+        ic.path || cp.parent_id
+    FROM inheritance_chain ic
+    JOIN category_parent cp ON cp.category_id = ic.parent_id
+    WHERE NOT cp.parent_id = ANY(ic.path)  -- Prevent cycles
+),
+all_properties AS (
+    -- Direct properties (depth = 0)
+    SELECT
+        cp.category_id,
+        cp.property_id,
+        cp.category_id as source_category_id,
+        0 as depth,
+        cp.is_required
+    FROM category_property cp
+
+    UNION ALL
+
+    -- Inherited properties
+    SELECT
+        ic.category_id,
+        cp.property_id,
+        cp.category_id as source_category_id,
+        ic.depth,
+        cp.is_required
+    FROM inheritance_chain ic
+    JOIN category_property cp ON cp.category_id = ic.parent_id
+)
+SELECT DISTINCT ON (category_id, property_id)
+    category_id,
+    property_id,
+    source_category_id,
+    depth,
+    is_required
+FROM all_properties
+ORDER BY category_id, property_id, depth;
+"""
+
+INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cpe_category_property
+ON category_property_effective (category_id, property_id);
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS category_property_effective;")
+    op.execute(CLOSURE_VIEW_SQL)
+    op.execute(INDEX_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS category_property_effective;")
+    op.execute(RECURSIVE_VIEW_SQL)
+    op.execute(INDEX_SQL)
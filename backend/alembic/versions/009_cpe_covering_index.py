@@ -0,0 +1,41 @@
+"""Cover category_property_effective lookups with its unique index.
+
+Revision ID: 009
+Revises: 008
+
+get_category reads every effective property of one category (property,
+source category, depth, required flag). The unique index on
+(category_id, property_id) already leads with category_id; including the
+other view columns lets that lookup be an index-only scan instead of a heap
+fetch per property, without adding a second index to rebuild on refresh.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "009"
+down_revision: str = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COVERING_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cpe_category_property
+ON category_property_effective (category_id, property_id)
+INCLUDE (source_category_id, depth, is_required);
+"""
+
+PLAIN_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cpe_category_property
+ON category_property_effective (category_id, property_id);
+"""
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_cpe_category_property;")
+    op.execute(COVERING_INDEX_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_cpe_category_property;")
+    op.execute(PLAIN_INDEX_SQL)
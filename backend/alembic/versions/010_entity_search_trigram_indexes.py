@@ -0,0 +1,47 @@
+"""Add trigram indexes for list endpoint search.
+
+Revision ID: 010
+Revises: 009
+
+The list endpoints filter with entity_key ILIKE '%term%' OR label ILIKE
+'%term%'. A leading wildcard cannot use the btree indexes, so every search
+scanned the whole table. A GIN index with gin_trgm_ops on both columns serves
+each ILIKE arm, combined with a BitmapOr. The indexes are migration-only
+(like the category_property_effective view) because they need the pg_trgm
+extension, which SQLModel.metadata.create_all does not install.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Entity tables behind the searchable list endpoints
+ENTITY_TABLES = (
+    "categories",
+    "properties",
+    "subobjects",
+    "templates",
+    "modules_v2",
+    "bundles",
+    "dashboards",
+    "resources",
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    for table in ENTITY_TABLES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_trgm ON {table} "
+            "USING gin (entity_key gin_trgm_ops, label gin_trgm_ops);"
+        )
+
+
+def downgrade() -> None:
+    for table in ENTITY_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_trgm;")
@@ -27,6 +27,11 @@ class Settings(BaseSettings):
     # Media storage
     MEDIA_STORAGE_PATH: str = "/data/media"
 
+    # Rate limit counter storage (limits storage URI). The default keeps counters
+    # per process; point it at shared storage (e.g. redis://host:6379) so limits
+    # hold across workers and replicas
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+
     @property
     def github_repo(self) -> str:
         """Full repository path as owner/repo."""
@@ -1,14 +1,30 @@
-from collections.abc import AsyncGenerator
-from typing import Annotated
+from collections.abc import AsyncGenerator, Sequence
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import Boolean, ColumnElement, Executable, Row, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.operators import OperatorType
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import settings
 
+# asyncpg keeps a per-connection prepared statement cache (default 100 entries).
+# Size it so the hot entity queries stay prepared across requests.
+ASYNCPG_STATEMENT_CACHE_SIZE = 1024
+
+_IS_ASYNCPG = settings.DATABASE_URL.startswith("postgresql+asyncpg")
+
+_connect_args: dict[str, Any] = {}
+if _IS_ASYNCPG:
+    _connect_args["prepared_statement_cache_size"] = ASYNCPG_STATEMENT_CACHE_SIZE
+
 # Create async engine with postgresql+asyncpg:// URL
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG, connect_args=_connect_args)
 
 # Async session factory
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -20,5 +36,70 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def fetch_all(
+    session: AsyncSession, *statements: Executable | None
+) -> list[Sequence[Row[Any]]]:
+    """Run independent read statements on ``session`` and return their rows.
+
+    The statements run one after another on the request's own connection.
+    Fanning them out to extra connections would hold the request connection
+    while waiting on the pool for more, which exhausts it under load.
+    A ``None`` statement yields an empty row list, letting callers skip lookups
+    that do not apply without reshaping the call.
+    """
+    return [
+        (await session.execute(statement)).all() if statement is not None else []
+        for statement in statements
+    ]
+
+
+class _InArray(ColumnElement[bool]):
+    """``column IN values``, rendered as ``column = ANY(:values)`` on PostgreSQL.
+
+    Both forms are built up front and the dialect picks one at compile time.
+    They are part of the cache key, so the values are extracted as parameters
+    of whichever form is rendered.
+    """
+
+    __visit_name__ = "in_array"
+    inherit_cache = True
+    type = Boolean()
+
+    _traverse_internals = [
+        ("in_clause", InternalTraversal.dp_clauseelement),
+        ("any_clause", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: Any, values: Sequence[Any]) -> None:
+        values = list(values)
+        self.in_clause = column.in_(values)
+        self.any_clause = column == any_(literal(values, ARRAY(column.type)))
+
+    def self_group(self, against: OperatorType | None = None) -> ColumnElement[Any]:  # noqa: ARG002
+        # Already a comparison; without this SQLite would render it as "(...) = 1"
+        return self
+
+
+@compiles(_InArray)
+def _compile_in_array(element: _InArray, compiler: SQLCompiler, **kw: Any) -> str:
+    return compiler.process(element.in_clause, **kw)
+
+
+@compiles(_InArray, "postgresql")
+def _compile_in_array_postgresql(element: _InArray, compiler: SQLCompiler, **kw: Any) -> str:
+    return compiler.process(element.any_clause, **kw)
+
+
+def in_array(column: Any, values: Sequence[Any]) -> ColumnElement[bool]:
+    """Filter ``column`` to ``values`` with a single array parameter.
+
+    ``column.in_(values)`` renders one placeholder per value, so each list length
+    is a new statement for asyncpg's prepared statement cache. On PostgreSQL this
+    renders ``column = ANY(:values)`` instead, giving one statement for any
+    number of keys. Other dialects (SQLite in tests) fall back to ``IN``.
+    """
+    return _InArray(column, values)
+
+
 # Type alias for dependency injection
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
@@ -11,9 +11,12 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.responses import Response
 
+from app.config import settings
+
 # Create limiter with IP-based key function
-# Uses X-Forwarded-For if behind proxy, falls back to client IP
-limiter = Limiter(key_func=get_remote_address)
+# Uses X-Forwarded-For if behind proxy, falls back to client IP.
+# Counters live in RATE_LIMIT_STORAGE_URI, so several workers can share them
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI)
 
 
 # Rate limit constants (from CONTEXT.md decisions)
@@ -1,13 +1,14 @@
 from contextlib import asynccontextmanager
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 from sqlmodel import SQLModel, text
 from sqlmodel.ext.asyncio.session import AsyncSession
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 from app.database import async_session_maker, engine, get_session
@@ -36,21 +37,36 @@ from app.services.github import GitHubClient
 from app.services.ingest import sync_repository_v2
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses.
 
     Headers added:
     - Referrer-Policy: origin - prevents capability URL leakage in referrer
     - X-Content-Type-Options: nosniff - prevents MIME sniffing
     - X-Frame-Options: DENY - prevents clickjacking
+
+    Written as plain ASGI rather than on BaseHTTPMiddleware, so responses are
+    passed straight through instead of being relayed via an extra task and
+    memory stream per request.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response: Response = await call_next(request)
-        response.headers["Referrer-Policy"] = "origin"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Referrer-Policy"] = "origin"
+                headers["X-Content-Type-Options"] = "nosniff"
+                headers["X-Frame-Options"] = "DENY"
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 @asynccontextmanager
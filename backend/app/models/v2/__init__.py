@@ -14,8 +14,9 @@ from app.models.v2.category import Category, CategoryBase, CategoryPublic
 # Materialized view
 from app.models.v2.category_property_effective import (
     CATEGORY_PROPERTY_EFFECTIVE_INDEX_SQL,
-    CATEGORY_PROPERTY_EFFECTIVE_REFRESH_SQL,
+    CATEGORY_PROPERTY_EFFECTIVE_SELECT_SQL,
     CATEGORY_PROPERTY_EFFECTIVE_SQL,
+    CATEGORY_PROPERTY_EFFECTIVE_SWAP_SQL,
     DROP_CATEGORY_PROPERTY_EFFECTIVE_SQL,
     CategoryPropertyEffective,
     refresh_category_property_effective,
@@ -47,6 +48,7 @@ from app.models.v2.property import Property, PropertyBase, PropertyPublic
 from app.models.v2.relationships import (
     BundleDashboard,
     BundleModule,
+    CategoryAncestor,
     CategoryParent,
     CategoryProperty,
     CategorySubobject,
@@ -103,6 +105,7 @@ __all__ = [
     "ResourcePublic",
     # Relationship tables
     "CategoryParent",
+    "CategoryAncestor",
     "CategoryProperty",
     "CategorySubobject",
     "SubobjectProperty",
@@ -112,9 +115,10 @@ __all__ = [
     "BundleDashboard",
     # Materialized view
     "CategoryPropertyEffective",
+    "CATEGORY_PROPERTY_EFFECTIVE_SELECT_SQL",
     "CATEGORY_PROPERTY_EFFECTIVE_SQL",
     "CATEGORY_PROPERTY_EFFECTIVE_INDEX_SQL",
-    "CATEGORY_PROPERTY_EFFECTIVE_REFRESH_SQL",
+    "CATEGORY_PROPERTY_EFFECTIVE_SWAP_SQL",
     "DROP_CATEGORY_PROPERTY_EFFECTIVE_SQL",
     "refresh_category_property_effective",
     # Draft models
@@ -15,31 +15,9 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
-# SQL for creating the materialized view
-CATEGORY_PROPERTY_EFFECTIVE_SQL = """
-CREATE MATERIALIZED VIEW IF NOT EXISTS category_property_effective AS
-WITH RECURSIVE inheritance_chain AS (
-    -- Base case: direct parents
-    SELECT
-        cp.category_id,
-        cp.parent_id,
-        1 as depth,
-        ARRAY[cp.parent_id] as path
-    FROM category_parent cp
-
-    UNION ALL
-
-    -- Recursive case: grandparents and beyond
-    SELECT
-        ic.category_id,
-        cp.parent_id,
-        ic.depth + 1,
-        ic.path || cp.parent_id
-    FROM inheritance_chain ic
-    JOIN category_parent cp ON cp.category_id = ic.parent_id
-    WHERE NOT cp.parent_id = ANY(ic.path)  -- Prevent cycles
-),
-all_properties AS (
+# The view's defining query
+CATEGORY_PROPERTY_EFFECTIVE_SELECT_SQL = """
+WITH all_properties AS (
     -- Direct properties (depth = 0)
     SELECT
         cp.category_id,
@@ -51,15 +29,16 @@ all_properties AS (
 
     UNION ALL
 
-    -- Inherited properties
+    -- Inherited properties, read from the category_ancestor closure
+    -- (each ancestor at its shortest depth) instead of walking category_parent
     SELECT
-        ic.category_id,
+        ca.category_id,
         cp.property_id,
         cp.category_id as source_category_id,
-        ic.depth,
+        ca.depth,
         cp.is_required
-    FROM inheritance_chain ic
-    JOIN category_property cp ON cp.category_id = ic.parent_id
+    FROM category_ancestor ca
+    JOIN category_property cp ON cp.category_id = ca.ancestor_id
 )
 SELECT DISTINCT ON (category_id, property_id)
     category_id,
@@ -68,19 +47,37 @@ SELECT DISTINCT ON (category_id, property_id)
     depth,
     is_required
 FROM all_properties
-ORDER BY category_id, property_id, depth;
+ORDER BY category_id, property_id, depth
 """
 
-# SQL for creating the unique index on the view
+# SQL for creating the materialized view
+CATEGORY_PROPERTY_EFFECTIVE_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS category_property_effective AS"
+    f"{CATEGORY_PROPERTY_EFFECTIVE_SELECT_SQL};"
+)
+
+# SQL for creating the unique index on the view. The remaining columns are
+# included so per-category lookups are index-only scans
 CATEGORY_PROPERTY_EFFECTIVE_INDEX_SQL = """
 CREATE UNIQUE INDEX IF NOT EXISTS idx_cpe_category_property
-ON category_property_effective (category_id, property_id);
+ON category_property_effective (category_id, property_id)
+INCLUDE (source_category_id, depth, is_required);
 """
 
-# SQL for refreshing the view concurrently (non-blocking)
-CATEGORY_PROPERTY_EFFECTIVE_REFRESH_SQL = """
-REFRESH MATERIALIZED VIEW CONCURRENTLY category_property_effective;
-"""
+# Statements that rebuild the view under a temporary name and swap it in.
+# Run in one transaction: readers keep using the old copy until the swap
+# commits, and only the DROP/RENAME at the end takes an exclusive lock
+CATEGORY_PROPERTY_EFFECTIVE_SWAP_SQL = (
+    "DROP MATERIALIZED VIEW IF EXISTS category_property_effective_new",
+    "CREATE MATERIALIZED VIEW category_property_effective_new AS"
+    f"{CATEGORY_PROPERTY_EFFECTIVE_SELECT_SQL}",
+    "CREATE UNIQUE INDEX idx_cpe_category_property_new"
+    " ON category_property_effective_new (category_id, property_id)"
+    " INCLUDE (source_category_id, depth, is_required)",
+    "DROP MATERIALIZED VIEW IF EXISTS category_property_effective",
+    "ALTER MATERIALIZED VIEW category_property_effective_new RENAME TO category_property_effective",
+    "ALTER INDEX idx_cpe_category_property_new RENAME TO idx_cpe_category_property",
+)
 
 # SQL for dropping the view (for migrations/cleanup)
 DROP_CATEGORY_PROPERTY_EFFECTIVE_SQL = """
@@ -110,15 +107,18 @@ class CategoryPropertyEffective(SQLModel):
 
 
 async def refresh_category_property_effective(session: "AsyncSession") -> None:
-    """Refresh the materialized view concurrently (non-blocking).
+    """Rebuild the materialized view and atomically swap it in.
 
     This should be called after any changes to category_parent or
     category_property tables to update the computed inheritance.
 
-    Uses CONCURRENTLY to allow reads during refresh. Requires the unique
-    index created by CATEGORY_PROPERTY_EFFECTIVE_INDEX_SQL.
+    Ingest rewrites every canonical row with new ids, so REFRESH ... CONCURRENTLY
+    would diff and replace the whole view row by row. Building a fresh copy and
+    renaming it over the old one does the same work once, leaves no dead
+    tuples, and still lets reads use the old copy until the swap commits.
     """
     from sqlalchemy import text
 
-    await session.execute(text(CATEGORY_PROPERTY_EFFECTIVE_REFRESH_SQL))
+    for statement in CATEGORY_PROPERTY_EFFECTIVE_SWAP_SQL:
+        await session.execute(text(statement))
     await session.commit()
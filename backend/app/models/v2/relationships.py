@@ -6,11 +6,9 @@ JSONB arrays in v1.0.
 
 import uuid
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlmodel import Field, SQLModel
 
-from app.models.v2.enums import EntityType
-
 
 class CategoryParent(SQLModel, table=True):
     """Category inheritance relationship.
@@ -25,6 +23,22 @@ class CategoryParent(SQLModel, table=True):
     parent_id: uuid.UUID = Field(foreign_key="categories.id", primary_key=True)
 
 
+class CategoryAncestor(SQLModel, table=True):
+    """Transitive closure of category inheritance.
+
+    Represents: "category X descends from ancestor Y, depth levels up"
+    One row per (category, ancestor) pair at the shortest depth, excluding
+    the category itself. Rebuilt from category_parent on every ingest so
+    ancestor/descendant lookups are a single indexed join.
+    """
+
+    __tablename__ = "category_ancestor"
+
+    category_id: uuid.UUID = Field(foreign_key="categories.id", primary_key=True)
+    ancestor_id: uuid.UUID = Field(foreign_key="categories.id", primary_key=True, index=True)
+    depth: int
+
+
 class CategoryProperty(SQLModel, table=True):
     """Direct property assignment to a category.
 
@@ -76,11 +90,23 @@ class ModuleEntity(SQLModel, table=True):
     """
 
     __tablename__ = "module_entity"
+    # Cover per-module member lookups (module_id, entity_type) and membership
+    # lookups (entity_key, entity_type) as index-only scans
+    __table_args__ = (
+        Index("ix_module_entity_module_type_key", "module_id", "entity_type", "entity_key"),
+        Index(
+            "ix_module_entity_key_type",
+            "entity_key",
+            "entity_type",
+            postgresql_include=["module_id"],
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    module_id: uuid.UUID = Field(foreign_key="modules_v2.id", index=True)
-    entity_type: EntityType = Field(sa_column=Column(String))  # Stored as string value
-    entity_key: str = Field(index=True)
+    module_id: uuid.UUID = Field(foreign_key="modules_v2.id")
+    # An EntityType value; typed as str because rows always load as plain strings
+    entity_type: str = Field(sa_column=Column(String))
+    entity_key: str
 
 
 class BundleModule(SQLModel, table=True):
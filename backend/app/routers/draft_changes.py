@@ -15,6 +15,7 @@ from typing import cast
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -58,6 +59,9 @@ ENTITY_MODEL_MAP = {
     "resource": Resource,
 }
 
+# Validates a list of DraftChange rows into responses in one call
+_DRAFT_CHANGE_LIST = TypeAdapter(list[DraftChangeResponse])
+
 
 async def validate_v2_capability_token(token: str, session: AsyncSession) -> Draft:
     """Validate capability token and return v2 Draft.
@@ -172,10 +176,11 @@ async def list_draft_changes(
         .order_by(col(DraftChange.created_at))
     )
     result = await session.execute(query)
-    changes = list(result.scalars().all())
+    changes = result.scalars().all()
 
-    return DraftChangesListResponse(
-        changes=[DraftChangeResponse.model_validate(c) for c in changes],
+    # Validate the whole list in one call, then wrap it without re-validating
+    return DraftChangesListResponse.model_construct(
+        changes=_DRAFT_CHANGE_LIST.validate_python(changes, from_attributes=True),
         total=len(changes),
     )
 
@@ -51,6 +51,7 @@ logger = logging.getLogger(__name__)
 
 # Default expiration: 7 days (from v1.0 pattern)
 DEFAULT_EXPIRATION_DAYS = 7
+DEFAULT_EXPIRATION_DELTA = timedelta(days=DEFAULT_EXPIRATION_DAYS)
 
 router = APIRouter(prefix="/drafts", tags=["drafts-v2"])
 
@@ -169,7 +170,7 @@ async def create_draft(
     token = generate_capability_token()
 
     # Calculate expiration
-    expires_at = datetime.utcnow() + timedelta(days=DEFAULT_EXPIRATION_DAYS)
+    expires_at = datetime.utcnow() + DEFAULT_EXPIRATION_DELTA
 
     # Create draft with hashed token
     draft = Draft(
@@ -412,8 +413,13 @@ async def submit_draft(
             f"Current status: {draft.status.value}.",
         )
 
+    # Load changes once; validation and file building reuse them
+    changes_query = select(DraftChange).where(DraftChange.draft_id == draft.id)
+    changes_result = await session.execute(changes_query)
+    changes = list(changes_result.scalars().all())
+
     # Re-validate
-    validation = await validate_draft_v2(draft.id, session)
+    validation = await validate_draft_v2(draft.id, session, changes)
     if not validation.is_valid:
         raise HTTPException(
             status_code=400,
@@ -421,15 +427,10 @@ async def submit_draft(
             f"Errors: {[e.message for e in validation.errors]}",
         )
 
-    # Load changes
-    changes_query = select(DraftChange).where(DraftChange.draft_id == draft.id)
-    changes_result = await session.execute(changes_query)
-    changes = list(changes_result.scalars().all())
-
     if not changes:
         raise HTTPException(status_code=400, detail="Draft has no changes to submit.")
 
-    files = await build_files_from_draft_v2(draft.id, session)
+    files = await build_files_from_draft_v2(draft.id, session, changes)
     if not files:
         raise HTTPException(status_code=400, detail="No files to commit.")
 
@@ -5,7 +5,7 @@ Provides read access to v2.0 schema entities with optional draft context:
 - GET /categories/{entity_key} - Category detail with parents and properties
 - GET /properties - List properties with pagination and draft overlay
 - GET /properties/{entity_key} - Property detail
-- GET /properties/{entity_key}/used-by - Categories using this property
+- GET /properties/{entity_key}/used-by - Categories using this property (paginated)
 - GET /subobjects - List subobjects with pagination
 - GET /templates - List templates with pagination
 - GET /modules/{entity_key} - Module detail with entities and closure
@@ -16,22 +16,30 @@ computation. When draft_id is provided, entities include change_status
 metadata (added/modified/deleted/unchanged).
 """
 
+import heapq
 import json
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse
-from sqlalchemy import text
+from pydantic import TypeAdapter
+from sqlalchemy import StatementLambdaElement, lambda_stmt, text
+from sqlalchemy.orm import aliased
 from sqlmodel import col, select
 
 from app.config import settings
-from app.database import SessionDep
+from app.database import SessionDep, fetch_all, in_array
 from app.dependencies.rate_limit import RATE_LIMITS, limiter
 from app.models.v2 import (
     Bundle,
     BundleModule,
     Category,
+    CategoryAncestor,
     CategoryParent,
     CategoryProperty,
     CategorySubobject,
@@ -62,6 +70,12 @@ from app.schemas.entity import (
     SubobjectProvenance,
     TemplateDetailResponse,
 )
+from app.services.canonical_cache import (
+    CanonicalRow,
+    get_canonical_commit_sha,
+    get_canonical_derived,
+    get_canonical_row,
+)
 from app.services.draft_overlay import DraftContextDep
 from app.services.resource_validation import (
     RESERVED_KEYS_WITH_INTERNAL,
@@ -70,6 +84,79 @@ from app.services.resource_validation import (
 
 router = APIRouter(tags=["entities-v2"])
 
+# Effective properties of a category from the materialized view, with provenance
+_CATEGORY_PROPERTIES_QUERY = text("""
+    SELECT
+        p.entity_key, p.label, cpe.depth, cpe.is_required,
+        src.entity_key as source_category
+    FROM category_property_effective cpe
+    JOIN properties p ON p.id = cpe.property_id
+    JOIN categories c ON c.id = cpe.category_id
+    JOIN categories src ON src.id = cpe.source_category_id
+    WHERE c.entity_key = :entity_key
+    ORDER BY cpe.depth, p.label
+""")
+
+# Same as above, restricted to inherited properties (depth > 0)
+_CATEGORY_INHERITED_PROPERTIES_QUERY = text("""
+    SELECT
+        p.entity_key, p.label, cpe.depth, cpe.is_required,
+        src.entity_key as source_category
+    FROM category_property_effective cpe
+    JOIN properties p ON p.id = cpe.property_id
+    JOIN categories c ON c.id = cpe.category_id
+    JOIN categories src ON src.id = cpe.source_category_id
+    WHERE c.entity_key = :entity_key AND cpe.depth > 0
+    ORDER BY cpe.depth, p.label
+""")
+
+# Keys in a dashboard's effective JSON that are not dynamic property fields
+_DASHBOARD_RESERVED_KEYS = RESERVED_KEYS_WITH_INTERNAL | {"pages"}
+
+# PropertyDetailResponse fields and the effective JSON keys they are read from
+_PROPERTY_DETAIL_KEYS: tuple[tuple[str, str], ...] = (
+    ("entity_key", "entity_key"),
+    ("label", "label"),
+    ("description", "description"),
+    ("datatype", "datatype"),
+    ("cardinality", "cardinality"),
+    # Validation constraints
+    ("allowed_values", "allowed_values"),
+    ("allowed_pattern", "allowed_pattern"),
+    ("allowed_value_list", "allowed_value_list"),
+    ("allowed_value_from_category", "Allows_value_from_category"),
+    # Display configuration
+    ("display_units", "display_units"),
+    ("display_precision", "display_precision"),
+    # Constraints and relationships
+    ("unique_values", "unique_values"),
+    ("has_display_template", "has_display_template_key"),
+    ("change_status", "_change_status"),
+    ("deleted", "_deleted"),
+)
+
+# Values for PropertyDetailResponse fields missing from the effective JSON
+# (entity_key falls back to the requested key)
+_PROPERTY_DETAIL_DEFAULTS: dict[str, Any] = {
+    "label": "",
+    "description": None,
+    "datatype": "Text",
+    "cardinality": "single",
+    "allowed_values": None,
+    "allowed_pattern": None,
+    "allowed_value_list": None,
+    "allowed_value_from_category": None,
+    "display_units": None,
+    "display_precision": None,
+    "unique_values": False,
+    "has_display_template": None,
+    "change_status": None,
+    "deleted": False,
+}
+
+# Validates a draft-supplied list of entity keys
+_ENTITY_KEY_LIST = TypeAdapter(list[str])
+
 
 # -----------------------------------------------------------------------------
 # Membership helper
@@ -85,7 +172,23 @@ async def _get_entity_membership(
 
     Returns (module_keys, bundle_keys) where bundle membership is derived
     transitively: entity → ModuleEntity → Module → BundleModule → Bundle.
+    Membership only depends on canonical data, so results are memoized
+    until the next ingest. The returned lists must not be mutated.
     """
+    membership: tuple[list[str], list[str]] = await get_canonical_derived(
+        session,
+        ("entity_membership", entity_type, entity_key),
+        lambda: _load_entity_membership(session, entity_key, entity_type),
+    )
+    return membership
+
+
+async def _load_entity_membership(
+    session: SessionDep,
+    entity_key: str,
+    entity_type: str,
+) -> tuple[list[str], list[str]]:
+    """Query module and bundle membership for an entity (uncached)."""
     # Module membership: which modules contain this entity
     module_query = (
         select(col(Module.entity_key).label("module_key"))  # type: ignore[var-annotated]
@@ -114,6 +217,316 @@ async def _get_entity_membership(
     return module_keys, bundle_keys
 
 
+async def _load_module_parents(
+    session: SessionDep,
+    categories: list[str],
+) -> tuple[list[str], dict[str, list[str]]]:
+    """Query the ancestors of a module's categories and their module membership.
+
+    Reads the category_ancestor closure table and left-joins module membership
+    onto it, so both come back in one round trip. The categories are bound as
+    one array, so modules of any size share a prepared statement. Ancestors
+    that are themselves among the given categories are left out.
+
+    Returns:
+        (parent_categories sorted by key, {parent_category: [module_key, ...]})
+    """
+    ancestor = aliased(Category)
+    ancestor_query: Any = (
+        select(ancestor.entity_key, col(Module.entity_key).label("module_key"))
+        .distinct()
+        .join(CategoryAncestor, col(CategoryAncestor.ancestor_id) == col(ancestor.id))
+        .join(Category, col(Category.id) == col(CategoryAncestor.category_id))
+        .outerjoin(
+            ModuleEntity,
+            (col(ModuleEntity.entity_key) == col(ancestor.entity_key))
+            & (col(ModuleEntity.entity_type) == "category"),
+        )
+        .outerjoin(Module, col(Module.id) == col(ModuleEntity.module_id))
+        .where(in_array(Category.entity_key, categories))
+        .order_by(ancestor.entity_key, Module.entity_key)
+    )
+    ancestor_result = await session.execute(ancestor_query)
+
+    manual_set = set(categories)
+    parent_categories: list[str] = []
+    membership: defaultdict[str, list[str]] = defaultdict(list)
+    for cat_key, mod_key in ancestor_result:
+        if cat_key in manual_set:
+            continue
+        if not parent_categories or parent_categories[-1] != cat_key:
+            parent_categories.append(cat_key)
+        if mod_key is not None:
+            membership[cat_key].append(mod_key)
+
+    return parent_categories, dict(membership)
+
+
+# -----------------------------------------------------------------------------
+# List item helper
+# -----------------------------------------------------------------------------
+
+
+def _entity_with_status(effective: dict[str, Any], canonical: Any) -> EntityWithStatus:
+    """Build a list item from the overlay of a canonical row.
+
+    The row's own columns back-fill entity_key and label when the stored JSON
+    omits them. Unchanged rows come straight from the database and already
+    match the schema, so the model is constructed directly. Rows a draft
+    modified carry values from a user-supplied patch and are validated.
+    Draft-created entities go through _created_entity instead.
+    """
+    fields = {
+        "entity_key": effective.get("entity_key", canonical.entity_key),
+        "label": effective.get("label", canonical.label),
+        "parents": effective.get("parents"),
+        "change_status": effective.get("_change_status"),
+        "deleted": effective.get("_deleted", False),
+    }
+    if fields["change_status"] == "unchanged":
+        return EntityWithStatus.model_construct(**fields)
+    return EntityWithStatus.model_validate(fields)
+
+
+def _list_columns(model: Any) -> tuple[Any, ...]:
+    """Columns list endpoints read from an entity table.
+
+    List items only need the key, label and stored JSON, so pages select these
+    as plain rows instead of hydrating full ORM entities.
+    """
+    return (model.entity_key, model.label, model.canonical_json)
+
+
+def _list_query(
+    model: Any,
+    *,
+    search: str | None,
+    cursor: str | None,
+    limit: int,
+    where: Any = None,
+) -> StatementLambdaElement:
+    """Build a list endpoint's keyset page query as a cached lambda statement.
+
+    List pages are the hottest selects in the API. Building them with
+    lambda_stmt lets SQLAlchemy skip constructing and cache-keying the
+    statement on every request: the lambdas are analyzed once per code path
+    and only search, cursor and limit are extracted as bound parameters.
+
+    Args:
+        model: Entity table model to list
+        search: Optional case-insensitive substring of entity_key or label
+        cursor: entity_key of the last item on the previous page
+        limit: Page size; limit + 1 rows are fetched to detect has_next
+        where: Optional extra filter clause, built outside the lambdas so
+            its bound values are tracked as part of the cache key
+    """
+    statement = lambda_stmt(lambda: select(*_list_columns(model)).order_by(model.entity_key))
+    if search:
+        pattern = f"%{search}%"
+        statement += lambda s: s.where(
+            col(model.entity_key).ilike(pattern) | col(model.label).ilike(pattern)
+        )
+    if where is not None:
+        statement += lambda s: s.where(where)
+    if cursor:
+        statement += lambda s: s.where(model.entity_key > cursor)
+    # Fetch limit+1 to detect has_next
+    statement += lambda s: s.limit(limit + 1)
+    return statement
+
+
+async def _load_canonical_rows(session: SessionDep, statement: Any) -> list[CanonicalRow]:
+    """Run a select of (id, entity_key, label, canonical_json) as CanonicalRow snapshots.
+
+    The snapshots are detached from the session, so the list can be memoized
+    with get_canonical_derived and fed to the overlay and list item helpers.
+    """
+    result = await session.execute(statement)
+    return [CanonicalRow(*row) for row in result]
+
+
+def _canonical_items(rows: Sequence[Any]) -> list[EntityWithStatus]:
+    """Build unchanged list items from canonical rows when there is no draft.
+
+    Mirrors the unchanged branch of apply_overlay (rows without canonical_json
+    are skipped, "id" stands in for entity_key) but reads the stored JSON in
+    place instead of deep-copying it per row.
+    """
+    items: list[EntityWithStatus] = []
+    for row in rows:
+        data = row.canonical_json
+        if not data:
+            continue
+        items.append(
+            EntityWithStatus.model_construct(
+                entity_key=data.get("entity_key", data.get("id", row.entity_key)),
+                label=data.get("label", row.label),
+                parents=data.get("parents"),
+                change_status="unchanged",
+                deleted=False,
+            )
+        )
+    return items
+
+
+def _created_entity(create: dict) -> EntityWithStatus:
+    """Build a list item from a draft create returned by get_draft_creates.
+
+    The create's fields come from user-supplied replacement_json, so unlike
+    canonical rows it is always validated against the schema.
+    """
+    return EntityWithStatus.model_validate(create)
+
+
+def _merge_draft_creates(
+    items: list[EntityWithStatus], draft_creates: list[dict], limit: int | None = None
+) -> list[EntityWithStatus]:
+    """Merge draft-created entities into a page of canonical list items.
+
+    Canonical rows and draft creates both come from the database ordered by
+    entity_key, so a linear merge keeps the combined list in order without
+    re-sorting it. With a limit the merge stops after that many items, and
+    creates past the cut are never turned into list items.
+    """
+    created = map(_created_entity, draft_creates)
+    return list(islice(heapq.merge(items, created, key=attrgetter("entity_key")), limit))
+
+
+async def _list_page(
+    draft_ctx: DraftContextDep,
+    rows: Sequence[Any],
+    entity_type: str,
+    cursor: str | None,
+    limit: int,
+    include_create: Callable[[dict], bool] | None = None,
+) -> EntityListResponse:
+    """Build one keyset page from canonical rows merged with draft creates.
+
+    rows must be the canonical query ordered by entity_key, after the cursor,
+    fetched with limit + 1. Draft creates after the same cursor are merged in
+    by entity_key and the page is cut at limit, so next_cursor is the last key
+    actually returned and neither source skips entities on the next page.
+    has_next is true if either source has anything beyond the page. Items
+    are already built EntityWithStatus models, so the page wraps them with
+    model_construct instead of re-validating the list.
+
+    Args:
+        draft_ctx: Draft overlay context
+        rows: Canonical rows (up to limit + 1)
+        entity_type: Entity type string (e.g., "category")
+        cursor: entity_key of the last item on the previous page
+        limit: Page size
+        include_create: Optional filter for draft-created entities; when set,
+            all creates after the cursor are loaded and filtered here
+    """
+    # Without a draft there is nothing to overlay or merge
+    if draft_ctx.is_empty:
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        return EntityListResponse.model_construct(
+            items=_canonical_items(rows),
+            next_cursor=rows[-1].entity_key if has_next else None,
+            has_next=has_next,
+        )
+
+    overlays = await draft_ctx.apply_overlay_batch(rows, entity_type)
+    items = [
+        _entity_with_status(effective, row)
+        for row, effective in zip(rows, overlays, strict=True)
+        if effective
+    ]
+
+    draft_creates = await draft_ctx.get_draft_creates(
+        entity_type,
+        after=cursor,
+        limit=None if include_create else limit + 1,
+    )
+    if include_create is not None:
+        draft_creates = [create for create in draft_creates if include_create(create)]
+
+    merged = _merge_draft_creates(items, draft_creates, limit + 1)
+    has_next = len(merged) > limit
+    page = merged[:limit]
+
+    return EntityListResponse.model_construct(
+        items=page,
+        next_cursor=page[-1].entity_key if has_next else None,
+        has_next=has_next,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Detail ETag helper
+# -----------------------------------------------------------------------------
+
+
+async def _check_etag(
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    draft_ctx: DraftContextDep,
+) -> None:
+    """Answer 304 Not Modified when the client already has this detail response.
+
+    A detail response only changes when canonical data is re-ingested or the
+    draft's changes are edited, so the ETag is built from the served commit SHA
+    and the draft version. The entity itself is identified by the URL, so
+    endpoints call this only after resolving it; an unknown key still gets its
+    404. Raises HTTPException(304) on a match; otherwise sets the ETag on the
+    response.
+    No ETag is sent before the first ingest or for an unknown draft.
+    """
+    commit_sha = await get_canonical_commit_sha(session)
+    draft_version = await draft_ctx.get_version()
+    if commit_sha is None or draft_version is None:
+        return
+
+    etag = f'W/"{commit_sha}-{draft_version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def _unchanged_effective(canonical: CanonicalRow | None) -> dict | None:
+    """Effective JSON of a canonical entity when no draft is attached.
+
+    Matches what apply_overlay returns for an entity without draft changes, but
+    copies only the top level instead of deep-copying canonical_json. Detail
+    endpoints read the effective JSON without mutating it, so the shared nested
+    values of the cached row are safe to hand out.
+    """
+    if canonical is None or not canonical.canonical_json:
+        return None
+    effective = {**canonical.canonical_json, "_change_status": "unchanged"}
+    if "entity_key" not in effective and "id" in effective:
+        effective["entity_key"] = effective["id"]
+    return effective
+
+
+async def _get_effective(
+    session: SessionDep,
+    draft_ctx: DraftContextDep,
+    model: Any,
+    entity_type: str,
+    entity_key: str,
+) -> tuple[CanonicalRow | None, dict | None]:
+    """Look up a canonical entity and apply the draft overlay to it.
+
+    Without a draft the overlay is skipped and the canonical JSON is returned
+    as unchanged.
+
+    Returns:
+        Tuple of (canonical row or None, effective JSON or None)
+    """
+    canonical = await get_canonical_row(session, model, entity_key)
+    if draft_ctx.is_empty:
+        return canonical, _unchanged_effective(canonical)
+    effective = await draft_ctx.apply_overlay(canonical, entity_type, entity_key)
+    return canonical, effective
+
+
 # -----------------------------------------------------------------------------
 # Ontology Version endpoint
 # -----------------------------------------------------------------------------
@@ -172,57 +585,19 @@ async def list_categories(
 
     Rate limited to 100/minute per IP.
     """
-    # Query canonical categories
-    query = select(Category).order_by(Category.entity_key)
-
-    if search:
-        query = query.where(
-            col(Category.entity_key).ilike(f"%{search}%") | col(Category.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Category.entity_key > cursor)
-
-    # Fetch limit+1 to detect has_next
-    query = query.limit(limit + 1)
+    query = _list_query(Category, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    categories = list(result.scalars().all())
+    categories = result.all()
 
-    # Check if there are more results
-    has_next = len(categories) > limit
-    if has_next:
-        categories = categories[:limit]
-
-    # Apply draft overlay to each category
-    items: list[EntityWithStatus] = []
-    for cat in categories:
-        effective = await draft_ctx.apply_overlay(cat, "category", cat.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    # Include draft-created categories
-    draft_creates = await draft_ctx.get_draft_creates("category")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
-
-    # Re-sort by entity_key after merging draft creates
-    items.sort(key=lambda x: x.entity_key)
-
-    # Recalculate cursor after sorting
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, categories, "category", cursor=cursor, limit=limit)
 
 
 @router.get("/categories/{entity_key}", response_model=CategoryDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_category(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -234,157 +609,166 @@ async def get_category(
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical category
-    query = select(Category).where(Category.entity_key == entity_key)
-    result = await session.execute(query)
-    category = result.scalar_one_or_none()
-
-    # Check for draft-created category if not in canonical
-    effective = await draft_ctx.apply_overlay(category, "category", entity_key)
+    category, effective = await _get_effective(session, draft_ctx, Category, "category", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    # Get parent category keys
-    # First check if draft overlay has modified parents (effective JSON takes priority)
-    if "parents" in effective and effective.get("_change_status") in ("modified", "added"):
-        # Draft has modified parents - use effective JSON
-        parents = effective.get("parents", [])
-    elif category:
-        # No draft parent changes - use canonical relationship table
-        parent_query = (
-            select(Category.entity_key)
-            .join(CategoryParent, col(CategoryParent.parent_id) == col(Category.id))
-            .where(CategoryParent.category_id == category.id)
-        )
-        parent_result = await session.execute(parent_query)
-        parents = [row[0] for row in parent_result.all()]
-    else:
-        # Draft-created category - extract parents from effective JSON if present
-        parents = effective.get("parents", [])
+    await _check_etag(request, response, session, draft_ctx)
 
-    # Get properties with provenance
-    properties: list[PropertyProvenance] = []
     change_status = effective.get("_change_status")
+    draft_modified = change_status in ("modified", "added")
 
     # If draft has modified or created this category, use the effective JSON for
-    # direct properties (the materialized view only has canonical state)
-    has_draft_property_changes = change_status in ("modified", "added") and (
+    # parents, direct properties and subobjects (the materialized view and the
+    # relationship tables only have canonical state)
+    use_draft_parents = category is None or (draft_modified and "parents" in effective)
+    has_draft_property_changes = draft_modified and (
         "required_properties" in effective or "optional_properties" in effective
     )
+    has_draft_subobject_changes = draft_modified and (
+        "required_subobjects" in effective or "optional_subobjects" in effective
+    )
+
+    # Canonical lookups that depend on the category id
+    parent_query: Any = None
+    props_query: Any = None
+    subobject_query: Any = None
+    if category:
+        if not use_draft_parents:
+            parent_query = (
+                select(Category.entity_key)
+                .join(CategoryParent, col(CategoryParent.parent_id) == col(Category.id))
+                .where(CategoryParent.category_id == category.id)
+            )
+        # With draft property changes only inherited properties (depth > 0) come
+        # from the materialized view
+        props_query = (
+            _CATEGORY_INHERITED_PROPERTIES_QUERY
+            if has_draft_property_changes
+            else _CATEGORY_PROPERTIES_QUERY
+        ).bindparams(entity_key=entity_key)
+        if not has_draft_subobject_changes:
+            subobject_query = (
+                select(Subobject.entity_key, Subobject.label, CategorySubobject.is_required)
+                .join(CategorySubobject, col(CategorySubobject.subobject_id) == col(Subobject.id))
+                .where(CategorySubobject.category_id == category.id)
+                .order_by(Subobject.label)
+            )
+
+    # Modules containing any descendant category, for inherited module membership.
+    # Keyed by entity_key alone, so it does not need the category id.
+    descendant = aliased(Category)
+    ancestor = aliased(Category)
+    descendant_keys_query = (
+        select(descendant.entity_key)
+        .join(CategoryAncestor, col(CategoryAncestor.category_id) == col(descendant.id))
+        .join(ancestor, col(ancestor.id) == col(CategoryAncestor.ancestor_id))
+        .where(ancestor.entity_key == entity_key)
+    )
+    desc_membership_query: Any = (
+        select(ModuleEntity.entity_key, col(Module.entity_key).label("module_key"))
+        .join(Module, col(Module.id) == col(ModuleEntity.module_id))
+        .where(
+            col(ModuleEntity.entity_key).in_(descendant_keys_query),
+            ModuleEntity.entity_type == "category",
+        )
+    )
+
+    # All four read canonical tables (and the materialized view) only, so the
+    # rows are memoized until the next ingest. The key records which lookups
+    # this draft state needs.
+    (
+        parent_rows,
+        property_rows,
+        subobject_rows,
+        desc_membership_rows,
+    ) = await get_canonical_derived(
+        session,
+        (
+            "category_detail",
+            entity_key,
+            parent_query is not None,
+            None if props_query is None else ("inherited" if has_draft_property_changes else "all"),
+            subobject_query is not None,
+        ),
+        lambda: fetch_all(
+            session, parent_query, props_query, subobject_query, desc_membership_query
+        ),
+    )
+
+    # Get parent category keys
+    parents = effective.get("parents", []) if use_draft_parents else [key for (key,) in parent_rows]
+
+    # Get properties with provenance
+    properties: list[PropertyProvenance] = []
 
     if has_draft_property_changes:
         # Build direct properties from effective JSON
-        for prop_key in effective.get("required_properties", []):
-            properties.append(
-                PropertyProvenance(
-                    entity_key=prop_key,
-                    label=prop_key,
+        for is_required, prop_keys in (
+            (True, effective.get("required_properties", ())),
+            (False, effective.get("optional_properties", ())),
+        ):
+            properties.extend(
+                PropertyProvenance.model_construct(
+                    entity_key=k,
+                    label=k,
                     is_direct=True,
                     is_inherited=False,
-                    is_required=True,
-                    source_category=entity_key,
-                    inheritance_depth=0,
-                )
-            )
-        for prop_key in effective.get("optional_properties", []):
-            properties.append(
-                PropertyProvenance(
-                    entity_key=prop_key,
-                    label=prop_key,
-                    is_direct=True,
-                    is_inherited=False,
-                    is_required=False,
+                    is_required=is_required,
                     source_category=entity_key,
                     inheritance_depth=0,
                 )
+                for k in prop_keys
             )
         # Also add inherited properties from canonical (depth > 0)
-        if category:
-            inherited_query = text("""
-                SELECT p.entity_key, p.label, cpe.depth, cpe.is_required,
-                       src.entity_key as source_category
-                FROM category_property_effective cpe
-                JOIN properties p ON p.id = cpe.property_id
-                JOIN categories c ON c.id = cpe.category_id
-                JOIN categories src ON src.id = cpe.source_category_id
-                WHERE c.entity_key = :entity_key AND cpe.depth > 0
-                ORDER BY cpe.depth, p.label
-            """)
-            inherited_result = await session.execute(inherited_query, {"entity_key": entity_key})
-            for row in inherited_result.fetchall():
-                properties.append(
-                    PropertyProvenance(
-                        entity_key=row[0],
-                        label=row[1],
-                        is_direct=False,
-                        is_inherited=True,
-                        is_required=row[3],
-                        source_category=row[4],
-                        inheritance_depth=row[2],
-                    )
-                )
-    elif category:
-        # No draft property changes - use canonical materialized view
-        props_query = text("""
-            SELECT
-                p.entity_key, p.label, cpe.depth, cpe.is_required,
-                src.entity_key as source_category
-            FROM category_property_effective cpe
-            JOIN properties p ON p.id = cpe.property_id
-            JOIN categories c ON c.id = cpe.category_id
-            JOIN categories src ON src.id = cpe.source_category_id
-            WHERE c.entity_key = :entity_key
-            ORDER BY cpe.depth, p.label
-        """)
-        props_result = await session.execute(props_query, {"entity_key": entity_key})
-
-        for row in props_result.fetchall():
-            properties.append(
-                PropertyProvenance(
-                    entity_key=row[0],
-                    label=row[1],
-                    is_direct=(row[2] == 0),
-                    is_inherited=(row[2] > 0),
-                    is_required=row[3],
-                    source_category=row[4],
-                    inheritance_depth=row[2],
-                )
+        properties.extend(
+            PropertyProvenance.model_construct(
+                entity_key=prop_key,
+                label=label,
+                is_direct=False,
+                is_inherited=True,
+                is_required=is_required,
+                source_category=source_category,
+                inheritance_depth=depth,
+            )
+            for prop_key, label, depth, is_required, source_category in property_rows
+        )
+    else:
+        # No draft property changes - use canonical materialized view. The rows
+        # come straight from typed SQL columns, so they skip re-validation
+        properties = [
+            PropertyProvenance.model_construct(
+                entity_key=prop_key,
+                label=label,
+                is_direct=depth == 0,
+                is_inherited=depth > 0,
+                is_required=is_required,
+                source_category=source_category,
+                inheritance_depth=depth,
             )
+            for prop_key, label, depth, is_required, source_category in property_rows
+        ]
 
     # Get subobjects assigned to this category
     subobjects: list[SubobjectProvenance] = []
 
-    # Same pattern: use effective JSON if draft modified subobjects
-    has_draft_subobject_changes = change_status in ("modified", "added") and (
-        "required_subobjects" in effective or "optional_subobjects" in effective
-    )
-
     if has_draft_subobject_changes:
-        for sub_key in effective.get("required_subobjects", []):
-            subobjects.append(
-                SubobjectProvenance(entity_key=sub_key, label=sub_key, is_required=True)
-            )
-        for sub_key in effective.get("optional_subobjects", []):
-            subobjects.append(
-                SubobjectProvenance(entity_key=sub_key, label=sub_key, is_required=False)
-            )
-    elif category:
-        subobject_query = (
-            select(Subobject.entity_key, Subobject.label, CategorySubobject.is_required)
-            .join(CategorySubobject, col(CategorySubobject.subobject_id) == col(Subobject.id))
-            .where(CategorySubobject.category_id == category.id)
-            .order_by(Subobject.label)
+        subobjects = [
+            SubobjectProvenance.model_construct(entity_key=k, label=k, is_required=True)
+            for k in effective.get("required_subobjects", ())
+        ]
+        subobjects.extend(
+            SubobjectProvenance.model_construct(entity_key=k, label=k, is_required=False)
+            for k in effective.get("optional_subobjects", ())
         )
-        subobject_result = await session.execute(subobject_query)
-        for row in subobject_result.fetchall():
-            subobjects.append(
-                SubobjectProvenance(
-                    entity_key=row[0],
-                    label=row[1],
-                    is_required=row[2],
-                )
+    else:
+        subobjects = [
+            SubobjectProvenance.model_construct(
+                entity_key=sub_key, label=label, is_required=is_required
             )
+            for sub_key, label, is_required in subobject_rows
+        ]
 
     # Module membership: manual (directly listed) + inherited (via child categories)
     from app.schemas.entity import CategoryModuleMembership
@@ -398,56 +782,13 @@ async def get_category(
         module_membership.append(CategoryModuleMembership(module_key=mod_key, membership="manual"))
         all_module_keys.add(mod_key)
 
-    # 2. Inherited membership: find descendant categories via BFS down the tree,
-    #    then check which modules contain those descendants
-    # BFS downward: find categories whose parent is this category (or its descendants)
-    visited: set[str] = {entity_key}
-    pending = [entity_key]
-
-    while pending:
-        batch = pending
-        pending = []
-        # Find children: categories whose parent_id matches categories in batch
-        child_query = (
-            select(Category.entity_key, CategoryParent.category_id)
-            .join(CategoryParent, col(CategoryParent.category_id) == col(Category.id))
-            .where(
-                col(CategoryParent.parent_id).in_(
-                    select(Category.id).where(col(Category.entity_key).in_(batch))
-                )
+    # 2. Inherited membership: modules that contain any descendant category
+    for desc_key, mod_key in desc_membership_rows:
+        if mod_key not in all_module_keys:
+            module_membership.append(
+                CategoryModuleMembership(module_key=mod_key, membership="inherited", via=desc_key)
             )
-        )
-        child_result = await session.execute(child_query)
-        for row in child_result.fetchall():
-            child_key = row[0]
-            if child_key not in visited:
-                visited.add(child_key)
-                pending.append(child_key)
-
-    # Remove self from descendants
-    descendant_keys = visited - {entity_key}
-
-    if descendant_keys:
-        # Check which descendants are in modules
-        desc_membership_query: Any = (
-            select(ModuleEntity.entity_key, col(Module.entity_key).label("module_key"))
-            .join(Module, col(Module.id) == col(ModuleEntity.module_id))
-            .where(
-                col(ModuleEntity.entity_key).in_(list(descendant_keys)),
-                ModuleEntity.entity_type == "category",
-            )
-        )
-        desc_result = await session.execute(desc_membership_query)
-        for row in desc_result.fetchall():
-            desc_key = row[0]
-            mod_key = row[1]
-            if mod_key not in all_module_keys:
-                module_membership.append(
-                    CategoryModuleMembership(
-                        module_key=mod_key, membership="inherited", via=desc_key
-                    )
-                )
-                all_module_keys.add(mod_key)
+            all_module_keys.add(mod_key)
 
     # Bundle membership from all modules
     bundle_keys: list[str] = []
@@ -503,52 +844,19 @@ async def list_properties(
 
     Rate limited to 100/minute per IP.
     """
-    # Query canonical properties
-    query = select(Property).order_by(Property.entity_key)
-
-    if search:
-        query = query.where(
-            col(Property.entity_key).ilike(f"%{search}%") | col(Property.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Property.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Property, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    properties = list(result.scalars().all())
-
-    has_next = len(properties) > limit
-    if has_next:
-        properties = properties[:limit]
-
-    # Apply draft overlay to each property
-    items: list[EntityWithStatus] = []
-    for prop in properties:
-        effective = await draft_ctx.apply_overlay(prop, "property", prop.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
+    properties = result.all()
 
-    # Include draft-created properties
-    draft_creates = await draft_ctx.get_draft_creates("property")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
-
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, properties, "property", cursor=cursor, limit=limit)
 
 
 @router.get("/properties/{entity_key}", response_model=PropertyDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_property(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -559,57 +867,45 @@ async def get_property(
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical property
-    query = select(Property).where(Property.entity_key == entity_key)
-    result = await session.execute(query)
-    prop = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(prop, "property", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Property, "property", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Property not found")
 
-    return PropertyDetailResponse(
-        entity_key=effective.get("entity_key", entity_key),
-        label=effective.get("label", ""),
-        description=effective.get("description"),
-        datatype=effective.get("datatype", "Text"),
-        cardinality=effective.get("cardinality", "single"),
-        # Validation constraints
-        allowed_values=effective.get("allowed_values"),
-        allowed_pattern=effective.get("allowed_pattern"),
-        allowed_value_list=effective.get("allowed_value_list"),
-        allowed_value_from_category=effective.get("Allows_value_from_category"),
-        # Display configuration
-        display_units=effective.get("display_units"),
-        display_precision=effective.get("display_precision"),
-        # Constraints and relationships
-        unique_values=effective.get("unique_values", False),
-        has_display_template=effective.get("has_display_template_key"),
-        change_status=effective.get("_change_status"),
-        deleted=effective.get("_deleted", False),
+    await _check_etag(request, response, session, draft_ctx)
+
+    payload = {"entity_key": entity_key, **_PROPERTY_DETAIL_DEFAULTS}
+    payload.update(
+        {field: effective[key] for field, key in _PROPERTY_DETAIL_KEYS if key in effective}
     )
+    # Canonical JSON already matches the schema; values a draft changed are
+    # user input and are validated
+    if payload["change_status"] == "unchanged":
+        return PropertyDetailResponse.model_construct(**payload)
+    return PropertyDetailResponse.model_validate(payload)
 
 
-@router.get("/properties/{entity_key}/used-by", response_model=list[EntityWithStatus])
+@router.get("/properties/{entity_key}/used-by", response_model=EntityListResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_property_used_by(
     request: Request,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
-) -> list[EntityWithStatus]:
+    cursor: str | None = Query(
+        None, description="Last entity_key from previous page for pagination"
+    ),
+    limit: int = Query(50, ge=1, le=200, description="Max items per page"),
+) -> EntityListResponse:
     """Get categories that use this property (QRY-05).
 
-    Returns list of categories that have this property assigned
+    Returns paginated list of categories that have this property assigned
     (directly or inherited), with draft change status.
 
     Rate limited to 200/minute per IP.
     """
-    # Verify property exists
-    prop_query = select(Property).where(Property.entity_key == entity_key)
-    prop_result = await session.execute(prop_query)
-    prop = prop_result.scalar_one_or_none()
+    # Verify property exists (served from the canonical row cache on repeats)
+    prop = await get_canonical_row(session, Property, entity_key)
 
     if not prop:
         # Check if draft-created
@@ -617,26 +913,55 @@ async def get_property_used_by(
         if not effective:
             raise HTTPException(status_code=404, detail="Property not found")
         # Draft-created property - no canonical categories use it yet
-        return []
+        return EntityListResponse(items=[], next_cursor=None, has_next=False)
 
     # Query categories that use this property via category_property join
     query = (
-        select(Category)
+        select(Category.id, Category.entity_key, Category.label, Category.canonical_json)
         .join(CategoryProperty, col(CategoryProperty.category_id) == col(Category.id))
         .where(CategoryProperty.property_id == prop.id)
         .order_by(Category.entity_key)
     )
-    result = await session.execute(query)
-    categories = result.scalars().all()
+
+    if cursor:
+        query = query.where(Category.entity_key > cursor)
+
+    # Fetch limit+1 to detect has_next
+    query = query.limit(limit + 1)
+
+    categories = await get_canonical_derived(
+        session,
+        ("property_used_by", entity_key, cursor, limit),
+        lambda: _load_canonical_rows(session, query),
+    )
+
+    has_next = len(categories) > limit
+    if has_next:
+        categories = categories[:limit]
+
+    # Without a draft there is nothing to overlay or merge
+    if draft_ctx.is_empty:
+        return EntityListResponse.model_construct(
+            items=_canonical_items(categories),
+            next_cursor=categories[-1].entity_key if has_next else None,
+            has_next=has_next,
+        )
 
     # Apply draft overlay to each category
-    items: list[EntityWithStatus] = []
-    for cat in categories:
-        effective = await draft_ctx.apply_overlay(cat, "category", cat.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
+    overlays = await draft_ctx.apply_overlay_batch(categories, "category")
+    items = [
+        _entity_with_status(effective, cat)
+        for cat, effective in zip(categories, overlays, strict=True)
+        if effective
+    ]
 
-    return items
+    next_cursor = categories[-1].entity_key if has_next else None
+
+    return EntityListResponse.model_construct(
+        items=items,
+        next_cursor=next_cursor,
+        has_next=has_next,
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -662,50 +987,19 @@ async def list_subobjects(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Subobject).order_by(Subobject.entity_key)
-
-    if search:
-        query = query.where(
-            col(Subobject.entity_key).ilike(f"%{search}%")
-            | col(Subobject.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Subobject.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Subobject, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    subobjects = list(result.scalars().all())
-
-    has_next = len(subobjects) > limit
-    if has_next:
-        subobjects = subobjects[:limit]
+    subobjects = result.all()
 
-    items: list[EntityWithStatus] = []
-    for sub in subobjects:
-        effective = await draft_ctx.apply_overlay(sub, "subobject", sub.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    draft_creates = await draft_ctx.get_draft_creates("subobject")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
-
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, subobjects, "subobject", cursor=cursor, limit=limit)
 
 
 @router.get("/subobjects/{entity_key}", response_model=SubobjectDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_subobject(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -716,16 +1010,13 @@ async def get_subobject(
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical subobject
-    query = select(Subobject).where(Subobject.entity_key == entity_key)
-    result = await session.execute(query)
-    subobj = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(subobj, "subobject", entity_key)
+    subobj, effective = await _get_effective(session, draft_ctx, Subobject, "subobject", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Subobject not found")
 
+    await _check_etag(request, response, session, draft_ctx)
+
     # Get properties
     required_properties: list[SubobjectPropertyInfo] = []
     optional_properties: list[SubobjectPropertyInfo] = []
@@ -739,34 +1030,28 @@ async def get_subobject(
     if has_draft_properties:
         # Use properties from effective JSON (draft changes take precedence)
         # Build a property label lookup for better display
+        required_keys = effective.get("required_properties", ())
+        optional_keys = effective.get("optional_properties", ())
         prop_labels: dict[str, str] = {}
-        all_prop_keys = list(effective.get("required_properties", [])) + list(
-            effective.get("optional_properties", [])
-        )
-        if all_prop_keys:
+        if required_keys or optional_keys:
             label_query = select(Property.entity_key, Property.label).where(
-                col(Property.entity_key).in_(all_prop_keys)
+                in_array(col(Property.entity_key), [*required_keys, *optional_keys])
             )
             label_result = await session.execute(label_query)
-            for row in label_result.fetchall():
-                prop_labels[row[0]] = row[1]
-
-        for prop_key in effective.get("required_properties", []):
-            required_properties.append(
-                SubobjectPropertyInfo(
-                    entity_key=prop_key,
-                    label=prop_labels.get(prop_key, prop_key),
-                    is_required=True,
-                )
+            prop_labels = dict(label_result.tuples().all())
+
+        required_properties = [
+            SubobjectPropertyInfo.model_construct(
+                entity_key=k, label=prop_labels.get(k, k), is_required=True
             )
-        for prop_key in effective.get("optional_properties", []):
-            optional_properties.append(
-                SubobjectPropertyInfo(
-                    entity_key=prop_key,
-                    label=prop_labels.get(prop_key, prop_key),
-                    is_required=False,
-                )
+            for k in required_keys
+        ]
+        optional_properties = [
+            SubobjectPropertyInfo.model_construct(
+                entity_key=k, label=prop_labels.get(k, k), is_required=False
             )
+            for k in optional_keys
+        ]
     elif subobj:
         # No draft changes to properties - query canonical from database
         props_query = (
@@ -776,26 +1061,26 @@ async def get_subobject(
             .order_by(Property.label)
         )
         props_result = await session.execute(props_query)
-        for row in props_result.fetchall():
+        for prop_key, label, is_required in props_result:
             prop_info = SubobjectPropertyInfo(
-                entity_key=row[0],
-                label=row[1],
-                is_required=row[2],
+                entity_key=prop_key,
+                label=label,
+                is_required=is_required,
             )
-            if row[2]:
+            if is_required:
                 required_properties.append(prop_info)
             else:
                 optional_properties.append(prop_info)
     else:
         # Draft-created subobject with no property fields
-        for prop_key in effective.get("required_properties", []):
-            required_properties.append(
-                SubobjectPropertyInfo(entity_key=prop_key, label=prop_key, is_required=True)
-            )
-        for prop_key in effective.get("optional_properties", []):
-            optional_properties.append(
-                SubobjectPropertyInfo(entity_key=prop_key, label=prop_key, is_required=False)
-            )
+        required_properties = [
+            SubobjectPropertyInfo.model_construct(entity_key=k, label=k, is_required=True)
+            for k in effective.get("required_properties", ())
+        ]
+        optional_properties = [
+            SubobjectPropertyInfo.model_construct(entity_key=k, label=k, is_required=False)
+            for k in effective.get("optional_properties", ())
+        ]
 
     return SubobjectDetailResponse(
         entity_key=effective.get("entity_key", entity_key),
@@ -823,10 +1108,8 @@ async def get_subobject_used_by(
 
     Rate limited to 200/minute per IP.
     """
-    # Verify subobject exists
-    sub_query = select(Subobject).where(Subobject.entity_key == entity_key)
-    sub_result = await session.execute(sub_query)
-    subobj = sub_result.scalar_one_or_none()
+    # Verify subobject exists (served from the canonical row cache on repeats)
+    subobj = await get_canonical_row(session, Subobject, entity_key)
 
     if not subobj:
         effective = await draft_ctx.apply_overlay(None, "subobject", entity_key)
@@ -835,19 +1118,25 @@ async def get_subobject_used_by(
         return []
 
     query = (
-        select(Category)
+        select(Category.id, Category.entity_key, Category.label, Category.canonical_json)
         .join(CategorySubobject, col(CategorySubobject.category_id) == col(Category.id))
         .where(CategorySubobject.subobject_id == subobj.id)
         .order_by(Category.entity_key)
     )
-    result = await session.execute(query)
-    categories = result.scalars().all()
+    categories = await get_canonical_derived(
+        session, ("subobject_used_by", entity_key), lambda: _load_canonical_rows(session, query)
+    )
 
-    items: list[EntityWithStatus] = []
-    for cat in categories:
-        effective = await draft_ctx.apply_overlay(cat, "category", cat.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
+    # Without a draft there is nothing to overlay or merge
+    if draft_ctx.is_empty:
+        return _canonical_items(categories)
+
+    overlays = await draft_ctx.apply_overlay_batch(categories, "category")
+    items = [
+        _entity_with_status(effective, cat)
+        for cat, effective in zip(categories, overlays, strict=True)
+        if effective
+    ]
 
     return items
 
@@ -875,49 +1164,19 @@ async def list_templates(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Template).order_by(Template.entity_key)
-
-    if search:
-        query = query.where(
-            col(Template.entity_key).ilike(f"%{search}%") | col(Template.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Template.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Template, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    templates = list(result.scalars().all())
-
-    has_next = len(templates) > limit
-    if has_next:
-        templates = templates[:limit]
-
-    items: list[EntityWithStatus] = []
-    for tmpl in templates:
-        effective = await draft_ctx.apply_overlay(tmpl, "template", tmpl.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
+    templates = result.all()
 
-    draft_creates = await draft_ctx.get_draft_creates("template")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
-
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, templates, "template", cursor=cursor, limit=limit)
 
 
 @router.get("/templates/{entity_key:path}", response_model=TemplateDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_template(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -928,16 +1187,13 @@ async def get_template(
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical template
-    query = select(Template).where(Template.entity_key == entity_key)
-    result = await session.execute(query)
-    tmpl = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(tmpl, "template", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Template, "template", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Template not found")
 
+    await _check_etag(request, response, session, draft_ctx)
+
     # Module and bundle membership
     module_keys, bundle_keys = await _get_entity_membership(session, entity_key, "template")
 
@@ -977,49 +1233,19 @@ async def list_modules(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Module).order_by(Module.entity_key)
-
-    if search:
-        query = query.where(
-            col(Module.entity_key).ilike(f"%{search}%") | col(Module.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Module.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Module, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    modules = list(result.scalars().all())
-
-    has_next = len(modules) > limit
-    if has_next:
-        modules = modules[:limit]
-
-    items: list[EntityWithStatus] = []
-    for mod in modules:
-        effective = await draft_ctx.apply_overlay(mod, "module", mod.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    draft_creates = await draft_ctx.get_draft_creates("module")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
+    modules = result.all()
 
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, modules, "module", cursor=cursor, limit=limit)
 
 
 @router.get("/modules/{entity_key}", response_model=ModuleDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_module(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -1027,83 +1253,52 @@ async def get_module(
     """Get module detail with categories, dashboards, and parent categories.
 
     Modules store only manually-picked categories and dashboards.
-    Parent categories are computed on-the-fly by walking the category
-    inheritance graph, showing what OntologySync will auto-include.
+    Parent categories are all ancestors of those categories, read from the
+    category_ancestor closure table, showing what OntologySync will auto-include.
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical module
-    query = select(Module).where(Module.entity_key == entity_key)
-    result = await session.execute(query)
-    module = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(module, "module", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Module, "module", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Module not found")
 
+    await _check_etag(request, response, session, draft_ctx)
+
+    change_status = effective.get("_change_status")
     categories: list[str] = effective.get("categories", [])
-    dashboards: list[str] = effective.get("dashboards", [])
+    if change_status != "unchanged":
+        # A draft's category list is user input; check it before it keys the
+        # derived cache and the parents query
+        categories = _ENTITY_KEY_LIST.validate_python(categories)
 
-    # Compute parent categories on-the-fly via BFS over category_parent table
+    # Parent categories: every ancestor of the module's categories, with the
+    # modules each one already belongs to
     parent_categories: list[str] = []
-    if categories:
-        manual_set = set(categories)
-        visited: set[str] = set(categories)
-        pending = list(categories)
-
-        while pending:
-            batch = pending
-            pending = []
-            # Look up parent keys for this batch
-            cat_query = (
-                select(Category.entity_key, CategoryParent.parent_id)
-                .join(CategoryParent, col(CategoryParent.category_id) == col(Category.id))
-                .where(col(Category.entity_key).in_(batch))
-            )
-            cat_result = await session.execute(cat_query)
-
-            parent_ids = [row[1] for row in cat_result.fetchall()]
-            if parent_ids:
-                parent_query = select(Category.entity_key).where(col(Category.id).in_(parent_ids))
-                parent_result = await session.execute(parent_query)
-                for (parent_key,) in parent_result.fetchall():
-                    if parent_key not in visited:
-                        visited.add(parent_key)
-                        pending.append(parent_key)
-
-        parent_categories = sorted(visited - manual_set)
-
-    # Compute module membership for parent categories
     parent_category_membership: dict[str, list[str]] = {}
-    if parent_categories:
-        membership_query: Any = (
-            select(ModuleEntity.entity_key, col(Module.entity_key).label("module_key"))
-            .join(Module, col(Module.id) == col(ModuleEntity.module_id))
-            .where(
-                col(ModuleEntity.entity_key).in_(parent_categories),
-                ModuleEntity.entity_type == "category",
-            )
+    if categories:
+        parent_categories, parent_category_membership = await get_canonical_derived(
+            session,
+            ("module_parents", tuple(sorted(set(categories)))),
+            lambda: _load_module_parents(session, categories),
         )
-        membership_result = await session.execute(membership_query)
-        for row in membership_result.fetchall():
-            cat_key = row[0]
-            mod_key = row[1]
-            if cat_key not in parent_category_membership:
-                parent_category_membership[cat_key] = []
-            parent_category_membership[cat_key].append(mod_key)
-
-    return ModuleDetailResponse(
-        entity_key=effective.get("entity_key", entity_key),
-        label=effective.get("label", ""),
-        description=effective.get("description"),
-        categories=categories,
-        dashboards=dashboards,
-        parent_categories=parent_categories,
-        parent_category_membership=parent_category_membership,
-        change_status=effective.get("_change_status"),
-        deleted=effective.get("_deleted", False),
-    )
+
+    fields = {
+        "entity_key": effective.get("entity_key", entity_key),
+        "label": effective.get("label", ""),
+        "description": effective.get("description"),
+        "categories": categories,
+        "dashboards": effective.get("dashboards", []),
+        "parent_categories": parent_categories,
+        "parent_category_membership": parent_category_membership,
+        "change_status": change_status,
+        "deleted": effective.get("_deleted", False),
+    }
+    # Canonical JSON already matches the schema; values a draft changed are
+    # user input and are validated
+    if change_status == "unchanged":
+        return ModuleDetailResponse.model_construct(**fields)
+    return ModuleDetailResponse.model_validate(fields)
 
 
 # -----------------------------------------------------------------------------
@@ -1129,49 +1324,19 @@ async def list_bundles(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Bundle).order_by(Bundle.entity_key)
-
-    if search:
-        query = query.where(
-            col(Bundle.entity_key).ilike(f"%{search}%") | col(Bundle.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Bundle.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Bundle, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    bundles = list(result.scalars().all())
-
-    has_next = len(bundles) > limit
-    if has_next:
-        bundles = bundles[:limit]
-
-    items: list[EntityWithStatus] = []
-    for bnd in bundles:
-        effective = await draft_ctx.apply_overlay(bnd, "bundle", bnd.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    draft_creates = await draft_ctx.get_draft_creates("bundle")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
+    bundles = result.all()
 
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, bundles, "bundle", cursor=cursor, limit=limit)
 
 
 @router.get("/bundles/{entity_key}", response_model=BundleDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_bundle(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -1183,37 +1348,33 @@ async def get_bundle(
 
     Rate limited to 200/minute per IP.
     """
-    # Get canonical bundle
-    query = select(Bundle).where(Bundle.entity_key == entity_key)
-    result = await session.execute(query)
-    bundle = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(bundle, "bundle", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Bundle, "bundle", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Bundle not found")
 
-    # Get direct modules
-    modules: list[str] = []
-    change_status = effective.get("_change_status")
+    await _check_etag(request, response, session, draft_ctx)
 
     # Check if effective JSON has draft-modified modules
     # (if "modules" key exists in effective and status is modified or added)
+    change_status = effective.get("_change_status")
     if change_status in ("modified", "added") and "modules" in effective:
         # Use modules from effective JSON (draft changes take precedence)
-        modules = effective.get("modules", [])
-    elif bundle:
-        # No draft changes to modules - query canonical from database
+        modules: list[str] = effective.get("modules", [])
+    else:
+        # No draft changes to modules - use canonical from database. Looked up
+        # by bundle key and memoized until the next ingest
         module_query = (
             select(Module.entity_key)
             .join(BundleModule, col(BundleModule.module_id) == col(Module.id))
-            .where(BundleModule.bundle_id == bundle.id)
+            .join(Bundle, col(Bundle.id) == col(BundleModule.bundle_id))
+            .where(Bundle.entity_key == entity_key)
             .order_by(Module.entity_key)
         )
-        module_result = await session.execute(module_query)
-        modules = [row[0] for row in module_result.fetchall()]
-    else:
-        modules = []
+        (module_rows,) = await get_canonical_derived(
+            session, ("bundle_modules", entity_key), lambda: fetch_all(session, module_query)
+        )
+        modules = [key for (key,) in module_rows]
 
     return BundleDetailResponse(
         entity_key=effective.get("entity_key", entity_key),
@@ -1248,50 +1409,19 @@ async def list_dashboards(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Dashboard).order_by(Dashboard.entity_key)
-
-    if search:
-        query = query.where(
-            col(Dashboard.entity_key).ilike(f"%{search}%")
-            | col(Dashboard.label).ilike(f"%{search}%")
-        )
-
-    if cursor:
-        query = query.where(Dashboard.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(Dashboard, search=search, cursor=cursor, limit=limit)
 
     result = await session.execute(query)
-    dashboards = list(result.scalars().all())
-
-    has_next = len(dashboards) > limit
-    if has_next:
-        dashboards = dashboards[:limit]
-
-    items: list[EntityWithStatus] = []
-    for dash in dashboards:
-        effective = await draft_ctx.apply_overlay(dash, "dashboard", dash.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    draft_creates = await draft_ctx.get_draft_creates("dashboard")
-    for create in draft_creates:
-        items.append(EntityWithStatus.model_validate(create))
+    dashboards = result.all()
 
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
-    )
+    return await _list_page(draft_ctx, dashboards, "dashboard", cursor=cursor, limit=limit)
 
 
 @router.get("/dashboards/{entity_key}", response_model=DashboardDetailResponse)
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_dashboard(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -1300,15 +1430,13 @@ async def get_dashboard(
 
     Rate limited to 200/minute per IP.
     """
-    query = select(Dashboard).where(Dashboard.entity_key == entity_key)
-    result = await session.execute(query)
-    dashboard = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(dashboard, "dashboard", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Dashboard, "dashboard", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Dashboard not found")
 
+    await _check_etag(request, response, session, draft_ctx)
+
     # Extract pages from canonical_json (stored in effective after overlay)
     pages_data = effective.get("pages", [])
     pages = [
@@ -1316,8 +1444,7 @@ async def get_dashboard(
     ]
 
     # Extract dynamic fields (Category:Dashboard properties)
-    dashboard_reserved = RESERVED_KEYS_WITH_INTERNAL | {"pages"}
-    dynamic_fields = {k: v for k, v in effective.items() if k not in dashboard_reserved}
+    dynamic_fields = {k: v for k, v in effective.items() if k not in _DASHBOARD_RESERVED_KEYS}
 
     # Module and bundle membership
     module_keys, bundle_keys = await _get_entity_membership(session, entity_key, "dashboard")
@@ -1359,48 +1486,33 @@ async def list_resources(
 
     Rate limited to 100/minute per IP.
     """
-    query = select(Resource).order_by(Resource.entity_key)
-
-    if search:
-        query = query.where(
-            col(Resource.entity_key).ilike(f"%{search}%") | col(Resource.label).ilike(f"%{search}%")
-        )
-
-    if category:
-        query = query.where(text("CAST(category_keys AS jsonb) @> CAST(:cats AS jsonb)")).params(
-            cats=json.dumps([category])
-        )
-    if cursor:
-        query = query.where(Resource.entity_key > cursor)
-
-    query = query.limit(limit + 1)
+    query = _list_query(
+        Resource,
+        search=search,
+        cursor=cursor,
+        limit=limit,
+        where=(
+            text("CAST(category_keys AS jsonb) @> CAST(:cats AS jsonb)").bindparams(
+                cats=json.dumps([category])
+            )
+            if category
+            else None
+        ),
+    )
 
     result = await session.execute(query)
-    resources = list(result.scalars().all())
-
-    has_next = len(resources) > limit
-    if has_next:
-        resources = resources[:limit]
-
-    items: list[EntityWithStatus] = []
-    for res in resources:
-        effective = await draft_ctx.apply_overlay(res, "resource", res.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
-
-    # Include draft-created resources (filter by category if specified)
-    draft_creates = await draft_ctx.get_draft_creates("resource")
-    for create in draft_creates:
-        if category is None or category in get_entity_categories(create):
-            items.append(EntityWithStatus.model_validate(create))
-
-    items.sort(key=lambda x: x.entity_key)
-    next_cursor = items[-1].entity_key if has_next and items else None
-
-    return EntityListResponse(
-        items=items,
-        next_cursor=next_cursor,
-        has_next=has_next,
+    resources = result.all()
+
+    return await _list_page(
+        draft_ctx,
+        resources,
+        "resource",
+        cursor=cursor,
+        limit=limit,
+        # Draft-created resources only match when they belong to the category
+        include_create=(
+            (lambda create: category in get_entity_categories(create)) if category else None
+        ),
     )
 
 
@@ -1408,6 +1520,7 @@ async def list_resources(
 @limiter.limit(RATE_LIMITS["entity_read"])
 async def get_resource(
     request: Request,
+    response: Response,
     entity_key: str,
     session: SessionDep,
     draft_ctx: DraftContextDep,
@@ -1418,15 +1531,13 @@ async def get_resource(
 
     Rate limited to 200/minute per IP.
     """
-    query = select(Resource).where(Resource.entity_key == entity_key)
-    result = await session.execute(query)
-    resource = result.scalar_one_or_none()
-
-    effective = await draft_ctx.apply_overlay(resource, "resource", entity_key)
+    _, effective = await _get_effective(session, draft_ctx, Resource, "resource", entity_key)
 
     if not effective:
         raise HTTPException(status_code=404, detail="Resource not found")
 
+    await _check_etag(request, response, session, draft_ctx)
+
     # Extract dynamic fields (everything except reserved keys)
     dynamic_fields = {k: v for k, v in effective.items() if k not in RESERVED_KEYS_WITH_INTERNAL}
 
@@ -1466,10 +1577,8 @@ async def get_category_resources(
 
     Rate limited to 200/minute per IP.
     """
-    # Verify category exists
-    cat_query = select(Category).where(Category.entity_key == entity_key)
-    cat_result = await session.execute(cat_query)
-    category = cat_result.scalar_one_or_none()
+    # Verify category exists (served from the canonical row cache on repeats)
+    category = await get_canonical_row(session, Category, entity_key)
 
     if not category:
         # Check if draft-created category
@@ -1479,30 +1588,32 @@ async def get_category_resources(
 
     # Query resources that include this category (ARRAY contains)
     query = (
-        select(Resource)
+        select(Resource.id, Resource.entity_key, Resource.label, Resource.canonical_json)
         .where(text("CAST(category_keys AS jsonb) @> CAST(:cats AS jsonb)"))
         .params(cats=json.dumps([entity_key]))
         .order_by(Resource.entity_key)
     )
-    result = await session.execute(query)
-    resources = result.scalars().all()
+    resources = await get_canonical_derived(
+        session, ("category_resources", entity_key), lambda: _load_canonical_rows(session, query)
+    )
+
+    # Without a draft there is nothing to overlay or merge
+    if draft_ctx.is_empty:
+        return _canonical_items(resources)
 
     # Apply draft overlay to each resource
-    items: list[EntityWithStatus] = []
-    for res in resources:
-        effective = await draft_ctx.apply_overlay(res, "resource", res.entity_key)
-        if effective:
-            items.append(EntityWithStatus.model_validate(effective))
+    overlays = await draft_ctx.apply_overlay_batch(resources, "resource")
+    items = [
+        _entity_with_status(effective, res)
+        for res, effective in zip(resources, overlays, strict=True)
+        if effective
+    ]
 
     # Include draft-created resources for this category
     draft_creates = await draft_ctx.get_draft_creates("resource")
-    for create in draft_creates:
-        if entity_key in get_entity_categories(create):
-            items.append(EntityWithStatus.model_validate(create))
-
-    items.sort(key=lambda x: x.entity_key)
-
-    return items
+    return _merge_draft_creates(
+        items, [c for c in draft_creates if entity_key in get_entity_categories(c)]
+    )
 
 
 @router.get("/media")
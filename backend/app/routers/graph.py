@@ -9,9 +9,10 @@ Endpoints:
 - GET /graph/module/{module_key} - Module-scoped graph
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from app.schemas.graph import GraphResponse
+from app.services.canonical_cache import get_canonical_derived
 from app.services.draft_overlay import DraftContextDep
 from app.services.graph_query import GraphQueryService
 
@@ -21,12 +22,14 @@ router = APIRouter(prefix="/graph", tags=["graph"])
 @router.get("/full", response_model=GraphResponse)
 async def get_full_ontology_graph(
     draft_ctx: DraftContextDep,
-) -> GraphResponse:
+) -> GraphResponse | Response:
     """Get the full ontology graph with all entities (GRP-05).
 
     Returns all categories, properties, subobjects, and templates with their
     relationships. Bundles are excluded. Modules are represented via hull
-    membership on nodes.
+    membership on nodes. Without a draft the graph depends only on canonical
+    data, so it is memoized until the next ingest as encoded JSON; repeat
+    requests skip response validation and serialization of the whole graph.
 
     Args:
         draft_ctx: Draft context from query param (via DraftContextDep)
@@ -35,6 +38,16 @@ async def get_full_ontology_graph(
         GraphResponse with all entities and relationships
     """
     service = GraphQueryService(draft_ctx.session, draft_ctx)
+    if draft_ctx.is_empty:
+
+        async def load_json() -> bytes:
+            graph = await service.get_full_ontology_graph()
+            return graph.model_dump_json().encode()
+
+        content: bytes = await get_canonical_derived(
+            draft_ctx.session, ("full_graph_json",), load_json
+        )
+        return Response(content=content, media_type="application/json")
     return await service.get_full_ontology_graph()
 
 
@@ -5,13 +5,16 @@ drafts with change rows. Each push creates a NEW draft.
 """
 
 import logging
+from collections import defaultdict
+from collections.abc import Collection, Mapping
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Request
+from sqlalchemy import literal, union_all
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.database import SessionDep
+from app.database import SessionDep, in_array
 from app.dependencies.capability import (
     build_capability_url,
     generate_capability_token,
@@ -42,6 +45,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/mediawiki", tags=["mediawiki"])
 
 DEFAULT_EXPIRATION_DAYS = 7
+DEFAULT_EXPIRATION_DELTA = timedelta(days=DEFAULT_EXPIRATION_DAYS)
 
 # Map entity_type to model class
 ENTITY_MODELS = {
@@ -53,19 +57,35 @@ ENTITY_MODELS = {
     "template": Template,
 }
 
+# Map MediaWiki push action to ChangeType
+ACTION_CHANGE_TYPES = {
+    "create": ChangeType.CREATE,
+    "modify": ChangeType.UPDATE,
+    "delete": ChangeType.DELETE,
+}
+
 
-async def entity_exists(
+async def existing_entity_keys(
     session: AsyncSession,
-    entity_type: str,
-    entity_key: str,
-) -> bool:
-    """Check if entity exists in canonical tables."""
-    model = ENTITY_MODELS.get(entity_type)
-    if not model:
-        return False
-    # All entity models have entity_key
-    result = await session.execute(select(model).where(model.entity_key == entity_key))  # type: ignore[attr-defined]
-    return result.scalars().first() is not None
+    keys_by_type: Mapping[str, Collection[str]],
+) -> set[tuple[str, str]]:
+    """Return which (entity_type, entity_key) pairs exist in the canonical tables.
+
+    The per-type lookups are combined with UNION ALL, so a push touching
+    several entity types still costs one round trip.
+    """
+    lookups = [
+        # All entity models have entity_key
+        select(literal(entity_type), model.entity_key).where(  # type: ignore[attr-defined]
+            in_array(model.entity_key, list(keys))  # type: ignore[attr-defined]
+        )
+        for entity_type, keys in keys_by_type.items()
+        if (model := ENTITY_MODELS.get(entity_type)) is not None
+    ]
+    if not lookups:
+        return set()
+    result = await session.execute(union_all(*lookups))
+    return {(entity_type, entity_key) for entity_type, entity_key in result}
 
 
 @router.post("/import", response_model=MediaWikiImportResponse, status_code=201)
@@ -96,10 +116,16 @@ async def import_from_mediawiki(
         HTTPException 400: If entity existence check fails
         HTTPException 422: If payload validation fails
     """
+    # Look up every change's entity in one query rather than one per change
+    keys_by_type: defaultdict[str, set[str]] = defaultdict(set)
+    for change in payload.changes:
+        keys_by_type[change.entity_type].add(change.entity_key)
+    existing = await existing_entity_keys(session, keys_by_type)
+
     # Validate entity existence for each change
     errors = []
     for i, change in enumerate(payload.changes):
-        exists = await entity_exists(session, change.entity_type, change.entity_key)
+        exists = (change.entity_type, change.entity_key) in existing
 
         if change.action in ("modify", "delete") and not exists:
             errors.append(
@@ -118,10 +144,10 @@ async def import_from_mediawiki(
 
     # Get current ontology version for base_commit_sha
     version_result = await session.execute(
-        select(OntologyVersion).order_by(col(OntologyVersion.created_at).desc())
+        select(OntologyVersion.commit_sha).order_by(col(OntologyVersion.created_at).desc()).limit(1)
     )
-    current_version = version_result.scalars().first()
-    if not current_version:
+    base_commit_sha = version_result.scalar_one_or_none()
+    if base_commit_sha is None:
         raise HTTPException(status_code=500, detail="No ontology version found. Run ingest first.")
 
     # Generate capability token
@@ -130,34 +156,31 @@ async def import_from_mediawiki(
     # Create draft
     draft = Draft(
         capability_hash=hash_token(token),
-        base_commit_sha=current_version.commit_sha,
+        base_commit_sha=base_commit_sha,
         status=DraftStatus.DRAFT,
         source=DraftSource.MEDIAWIKI_PUSH,
         title=f"MediaWiki import: {payload.comment[:100]}",
         description=f"From {payload.wiki_url} by {payload.user}",
-        expires_at=datetime.utcnow() + timedelta(days=DEFAULT_EXPIRATION_DAYS),
+        expires_at=datetime.utcnow() + DEFAULT_EXPIRATION_DELTA,
     )
     session.add(draft)
-    await session.flush()  # Get draft.id
 
-    # Create draft_change rows
+    # Create draft_change rows. Ids are generated client-side, so the draft
+    # and all of its changes go out in one flush, with the changes inserted
+    # as a single batch
+    draft_changes = []
     for change in payload.changes:
-        # Map action to ChangeType
-        change_type = {
-            "create": ChangeType.CREATE,
-            "modify": ChangeType.UPDATE,
-            "delete": ChangeType.DELETE,
-        }[change.action]
-
-        draft_change = DraftChange(
-            draft_id=draft.id,
-            change_type=change_type,
-            entity_type=change.entity_type,
-            entity_key=change.entity_key,
-            patch=change.patch if change.action == "modify" else None,
-            replacement_json=change.entity if change.action == "create" else None,
+        draft_changes.append(
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ACTION_CHANGE_TYPES[change.action],
+                entity_type=change.entity_type,
+                entity_key=change.entity_key,
+                patch=change.patch if change.action == "modify" else None,
+                replacement_json=change.entity if change.action == "create" else None,
+            )
         )
-        session.add(draft_change)
+    session.add_all(draft_changes)
 
     await session.commit()
 
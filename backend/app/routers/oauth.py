@@ -5,11 +5,12 @@ OAuth tokens are held in session temporarily, never persisted.
 """
 
 import logging
+import time
 from datetime import datetime
 from urllib.parse import quote
 
 from authlib.integrations.base_client.errors import OAuthError
-from authlib.integrations.starlette_client import OAuth
+from authlib.integrations.starlette_client import OAuth, StarletteOAuth2App
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -36,6 +37,30 @@ logger = logging.getLogger(__name__)
 # OAuth client - registration happens on startup when settings available
 oauth = OAuth()
 
+# The registered GitHub client, kept so requests skip Authlib's registry lookup.
+# None until register_oauth_client runs (OAuth not configured)
+_github_client: StarletteOAuth2App | None = None
+
+
+# Error shown by the frontend when PR creation fails unexpectedly, pre-quoted
+_UNEXPECTED_PR_ERROR = quote("Unexpected error creating PR")
+
+
+def _frontend_redirect(draft_token: str, param: str, quoted_value: str) -> RedirectResponse:
+    """Redirect back to the frontend with the PR outcome in the query string.
+
+    Args:
+        draft_token: Draft capability token the flow was started for
+        param: Query parameter the frontend reads ("pr_url" or "pr_error")
+        quoted_value: Parameter value, already percent-encoded
+
+    Returns:
+        RedirectResponse to the frontend
+    """
+    return RedirectResponse(
+        url=f"{settings.FRONTEND_URL}/?draft_token={draft_token}&{param}={quoted_value}"
+    )
+
 
 def register_oauth_client(settings: Settings) -> None:
     """Register GitHub OAuth client with Authlib.
@@ -45,7 +70,8 @@ def register_oauth_client(settings: Settings) -> None:
     Args:
         settings: Application settings with OAuth credentials
     """
-    oauth.register(
+    global _github_client
+    _github_client = oauth.register(
         name="github",
         client_id=settings.GITHUB_CLIENT_ID,
         client_secret=settings.GITHUB_CLIENT_SECRET,
@@ -56,6 +82,20 @@ def register_oauth_client(settings: Settings) -> None:
     )
 
 
+def _get_github_client() -> StarletteOAuth2App:
+    """Return the registered GitHub OAuth client.
+
+    Raises:
+        HTTPException: 503 if OAuth not configured
+    """
+    if _github_client is None:
+        raise HTTPException(
+            status_code=503,
+            detail="GitHub OAuth not configured. Set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET environment variables.",
+        )
+    return _github_client
+
+
 router = APIRouter(prefix="/oauth", tags=["oauth"])
 
 
@@ -84,15 +124,12 @@ async def github_login(
         HTTPException: 503 if OAuth not configured
     """
     # Check if OAuth is configured
-    if not oauth._clients:
-        raise HTTPException(
-            status_code=503,
-            detail="GitHub OAuth not configured. Set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET environment variables.",
-        )
+    github = _get_github_client()
 
-    # Store draft_token and optional params in session for retrieval after OAuth callback
+    # Store draft_token and optional params in session for retrieval after OAuth callback.
+    # Timestamps are epoch seconds, which keeps the signed session cookie short
     request.session["pending_draft_token"] = draft_token
-    request.session["oauth_initiated_at"] = datetime.utcnow().isoformat()
+    request.session["oauth_initiated_at"] = time.time()
     if pr_title:
         request.session["pending_pr_title"] = pr_title
     if user_comment:
@@ -102,7 +139,7 @@ async def github_login(
     redirect_uri = f"{settings.BACKEND_URL}/api/v1/oauth/github/callback"
 
     # Redirect to GitHub authorization
-    return await oauth.github.authorize_redirect(request, redirect_uri)
+    return await github.authorize_redirect(request, redirect_uri)
 
 
 async def create_pr_from_draft(
@@ -147,24 +184,24 @@ async def create_pr_from_draft(
             detail=f"Draft must be validated before submitting. Current status: {draft.status.value}",
         )
 
+    # Load changes once; validation and file building reuse them
+    changes_query = select(DraftChange).where(DraftChange.draft_id == draft.id)
+    changes_result = await session.execute(changes_query)
+    changes = list(changes_result.scalars().all())
+
     # Re-validate before creating PR
-    validation = await validate_draft_v2(draft.id, session)
+    validation = await validate_draft_v2(draft.id, session, changes)
     if not validation.is_valid:
         raise HTTPException(
             status_code=400,
             detail=f"Draft validation failed. Errors: {[e.message for e in validation.errors]}",
         )
 
-    # Load changes
-    changes_query = select(DraftChange).where(DraftChange.draft_id == draft.id)
-    changes_result = await session.execute(changes_query)
-    changes = list(changes_result.scalars().all())
-
     if not changes:
         raise HTTPException(status_code=400, detail="Draft has no changes to submit.")
 
     # Build files from draft using v2 service
-    files = await build_files_from_draft_v2(draft.id, session)
+    files = await build_files_from_draft_v2(draft.id, session, changes)
     if not files:
         raise HTTPException(status_code=400, detail="No files to commit.")
 
@@ -228,10 +265,12 @@ async def github_callback(request: Request, session: AsyncSession = Depends(get_
 
     Raises:
         HTTPException: 400 if OAuth fails or no pending draft found
+        HTTPException: 503 if OAuth not configured
     """
     # Exchange authorization code for access token
+    github = _get_github_client()
     try:
-        token = await oauth.github.authorize_access_token(request)
+        token = await github.authorize_access_token(request)
     except OAuthError as e:
         raise HTTPException(
             status_code=400,
@@ -248,10 +287,11 @@ async def github_callback(request: Request, session: AsyncSession = Depends(get_
 
     pr_title = request.session.pop("pending_pr_title", None)
     user_comment = request.session.pop("pending_user_comment", None)
+    request.session.pop("oauth_initiated_at", None)
 
-    # Store access_token and completion time in session
-    request.session["github_access_token"] = token["access_token"]
-    request.session["oauth_completed_at"] = datetime.utcnow().isoformat()
+    # The access token is used once, below, and never read from the session
+    # again, so it is not stored there. With the pending keys popped the
+    # session is empty and the cookie is cleared instead of re-signed
 
     # Create PR from draft
     try:
@@ -259,17 +299,12 @@ async def github_callback(request: Request, session: AsyncSession = Depends(get_
             draft_token, token["access_token"], session, pr_title, user_comment
         )
         # Success - redirect with PR URL (use query param format that frontend expects)
-        redirect_url = f"{settings.FRONTEND_URL}/?draft_token={draft_token}&pr_url={quote(pr_url)}"
-        return RedirectResponse(url=redirect_url)
+        return _frontend_redirect(draft_token, "pr_url", quote(pr_url))
     except HTTPException as e:
         # Handle known errors
         logger.warning(f"PR creation failed: {e.detail}")
-        redirect_url = (
-            f"{settings.FRONTEND_URL}/?draft_token={draft_token}&pr_error={quote(str(e.detail))}"
-        )
-        return RedirectResponse(url=redirect_url)
+        return _frontend_redirect(draft_token, "pr_error", quote(str(e.detail)))
     except Exception as e:
         # Handle unexpected errors
         logger.error(f"Unexpected error creating PR: {e}")
-        redirect_url = f"{settings.FRONTEND_URL}/?draft_token={draft_token}&pr_error={quote('Unexpected error creating PR')}"
-        return RedirectResponse(url=redirect_url)
+        return _frontend_redirect(draft_token, "pr_error", _UNEXPECTED_PR_ERROR)
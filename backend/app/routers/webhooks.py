@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
 
-async def verify_github_signature(request: Request) -> bytes:
+async def verify_github_signature(request: Request) -> bytes | bytearray:
     """Verify GitHub webhook signature and return raw body.
 
     Uses HMAC-SHA256 with constant-time comparison to prevent timing attacks.
@@ -29,7 +29,7 @@ async def verify_github_signature(request: Request) -> bytes:
         request: FastAPI request object
 
     Returns:
-        Raw request body bytes
+        Raw request body
 
     Raises:
         HTTPException: 403 if signature is missing or invalid
@@ -42,16 +42,15 @@ async def verify_github_signature(request: Request) -> bytes:
     if not signature_header:
         raise HTTPException(status_code=403, detail="Missing signature header")
 
-    body = await request.body()
+    # Hash each chunk as it arrives, so the digest is ready once the body is in
+    # and needs no separate pass over the buffered payload
+    mac = hmac.new(settings.GITHUB_WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+    body = bytearray()
+    async for chunk in request.stream():
+        mac.update(chunk)
+        body += chunk
 
-    expected_signature = (
-        "sha256="
-        + hmac.new(
-            settings.GITHUB_WEBHOOK_SECRET.encode("utf-8"),
-            body,
-            hashlib.sha256,
-        ).hexdigest()
-    )
+    expected_signature = "sha256=" + mac.hexdigest()
 
     if not hmac.compare_digest(expected_signature, signature_header):
         raise HTTPException(status_code=403, detail="Invalid signature")
@@ -87,14 +86,17 @@ async def github_webhook(
     """
     # Verify signature and get raw body
     body = await verify_github_signature(request)
-    payload = json.loads(body)
 
-    # Check event type
+    # Check event type before parsing, so ignored events are never decoded
     event_type = request.headers.get("x-github-event", "unknown")
 
     if event_type != "push":
         return {"status": "ignored", "event": event_type}
 
+    # Drop the raw bytes once parsed so only one copy of the payload is held
+    payload = json.loads(body)
+    del body
+
     # Extract changed files for logging
     changed_files: set[str] = set()
     for commit in payload.get("commits", []):
@@ -0,0 +1,190 @@
+"""In-process cache for canonical entity rows.
+
+Canonical tables are only rewritten by ingest (sync_repository_v2), which
+records a completed OntologyVersion once the new data and mat view are in
+place. Ingest may run in another worker process or replica, so each request's
+first cache lookup compares the latest completed version with the one the
+cache was filled under and drops the cache if it changed. Cached entries are
+stamped with a generation counter that invalidation bumps, so a lookup never
+returns a row from a previous ingest - even one stored by a request that raced
+the sync.
+
+Provides:
+- CanonicalRow snapshots (id, entity_key, label, canonical_json) keyed by
+  (table, entity_key), bounded by an LRU
+- The commit SHA of the canonical data currently served (for ETags)
+- get_canonical_derived() to memoize lookups computed only from canonical
+  tables (membership, hierarchy), bounded by an LRU
+- invalidate_canonical_cache() for an in-process ingest to call after committing
+"""
+
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.v2 import IngestStatus, OntologyVersion
+
+# Max cached rows across all entity tables
+_MAX_ROWS = 10_000
+
+# Max cached derived lookups
+_MAX_DERIVED = 1024
+
+
+class CanonicalRow(NamedTuple):
+    """Detached snapshot of the canonical columns detail endpoints read.
+
+    Exposes the same attribute names as the SQLModel tables, so it can be
+    passed anywhere a canonical entity is expected (e.g. apply_overlay).
+    canonical_json is shared between requests and must not be mutated.
+    """
+
+    id: uuid.UUID
+    entity_key: str
+    label: str
+    canonical_json: dict
+
+
+# Key in AsyncSession.info marking a session whose version check is done
+_CHECKED_INFO_KEY = "canonical_cache_checked"
+
+_generation = 0
+_rows: OrderedDict[tuple[int, str, str], CanonicalRow] = OrderedDict()
+_commit_sha: tuple[int, str] | None = None
+_derived: OrderedDict[tuple[int, Hashable], Any] = OrderedDict()
+# Id of the latest completed OntologyVersion when the cache was last checked
+_version_id: uuid.UUID | None = None
+
+
+async def _check_version(session: AsyncSession) -> None:
+    """Drop the cache if an ingest completed since it was last checked.
+
+    Runs one query per session (i.e. per request); later lookups on the same
+    session skip it. Also records the commit SHA of the latest version.
+    """
+    global _version_id, _commit_sha
+    if session.info.get(_CHECKED_INFO_KEY):
+        return
+    session.info[_CHECKED_INFO_KEY] = True
+
+    query = (
+        select(OntologyVersion.id, OntologyVersion.commit_sha)
+        .where(OntologyVersion.ingest_status == IngestStatus.COMPLETED)
+        .order_by(col(OntologyVersion.created_at).desc())
+        .limit(1)
+    )
+    latest = (await session.execute(query)).one_or_none()
+    version_id = latest.id if latest is not None else None
+    if version_id != _version_id:
+        invalidate_canonical_cache()
+        _version_id = version_id
+    if latest is not None:
+        _commit_sha = (_generation, latest.commit_sha)
+
+
+async def get_canonical_row(
+    session: AsyncSession,
+    model: Any,
+    entity_key: str,
+) -> CanonicalRow | None:
+    """Look up a canonical entity by entity_key, serving repeats from memory.
+
+    Args:
+        session: Async database session used on a cache miss
+        model: Entity table model (Category, Property, ...)
+        entity_key: Entity key to look up
+
+    Returns:
+        CanonicalRow snapshot, or None if the entity is not in canonical.
+        Misses are not cached.
+    """
+    await _check_version(session)
+    generation = _generation
+    key = (generation, model.__tablename__, entity_key)
+
+    row = _rows.get(key)
+    if row is not None:
+        _rows.move_to_end(key)
+        return row
+
+    result = await session.execute(select(model).where(model.entity_key == entity_key))
+    entity = result.scalar_one_or_none()
+    if entity is None:
+        return None
+
+    row = CanonicalRow(
+        id=entity.id,
+        entity_key=entity.entity_key,
+        label=entity.label,
+        canonical_json=entity.canonical_json,
+    )
+    # Only store if no ingest finished while the query was in flight
+    if generation == _generation:
+        _rows[key] = row
+        if len(_rows) > _MAX_ROWS:
+            _rows.popitem(last=False)
+    return row
+
+
+async def get_canonical_derived(
+    session: AsyncSession, key: Hashable, load: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Memoize a value computed only from canonical tables.
+
+    Args:
+        session: Async database session, used to check for a newer ingest
+        key: Hashable key identifying the lookup and its arguments; include a
+             distinct tag per lookup so different helpers never collide
+        load: Coroutine factory that computes the value on a miss
+
+    Returns:
+        The cached or freshly loaded value. It is shared between requests and
+        must not be mutated.
+    """
+    await _check_version(session)
+    generation = _generation
+    cache_key = (generation, key)
+
+    if cache_key in _derived:
+        _derived.move_to_end(cache_key)
+        return _derived[cache_key]
+
+    value = await load()
+    # Only store if no ingest finished while the lookup was in flight
+    if generation == _generation:
+        _derived[cache_key] = value
+        if len(_derived) > _MAX_DERIVED:
+            _derived.popitem(last=False)
+    return value
+
+
+async def get_canonical_commit_sha(session: AsyncSession) -> str | None:
+    """Get the commit SHA of the latest completed ingest.
+
+    Read by the per-request version check, so it moves forward as soon as any
+    process completes an ingest.
+
+    Returns:
+        Commit SHA, or None if nothing has been ingested yet
+    """
+    await _check_version(session)
+    if _commit_sha is None or _commit_sha[0] != _generation:
+        return None
+    return _commit_sha[1]
+
+
+def invalidate_canonical_cache() -> None:
+    """Drop all cached canonical rows, derived lookups and the commit SHA.
+
+    Called by an in-process ingest once new canonical data (including the mat
+    view) is in place, and by the version check when another process ingested.
+    """
+    global _generation, _commit_sha
+    _generation += 1
+    _rows.clear()
+    _derived.clear()
+    _commit_sha = None
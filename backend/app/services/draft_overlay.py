@@ -6,16 +6,50 @@ computation ensures frontend never performs draft merging.
 """
 
 import uuid
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Annotated, Any, cast
 
 import jsonpatch
 from fastapi import Depends, Query
+from sqlalchemy import text
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.database import SessionDep
-from app.models.v2 import ChangeType, DraftChange
+from app.models.v2 import ChangeType, Draft, DraftChange
+from app.schemas.entity import ChangeStatus
+
+# Raw SQL used by inherited property computation
+_CANONICAL_PARENTS_BY_ID_QUERY = text("""
+    SELECT c.entity_key
+    FROM category_parent cp
+    JOIN categories c ON c.id = cp.parent_id
+    WHERE cp.category_id = :category_id
+""")
+
+_CANONICAL_PARENTS_BY_KEY_QUERY = text("""
+    SELECT c2.entity_key
+    FROM categories c
+    JOIN category_parent cp ON cp.category_id = c.id
+    JOIN categories c2 ON c2.id = cp.parent_id
+    WHERE c.entity_key = :entity_key
+""")
+
+_DIRECT_PROPERTIES_BY_ID_QUERY = text("""
+    SELECT p.entity_key, p.label, cp.is_required
+    FROM category_property cp
+    JOIN properties p ON p.id = cp.property_id
+    WHERE cp.category_id = :category_id
+""")
+
+_DIRECT_PROPERTIES_BY_KEY_QUERY = text("""
+    SELECT p.entity_key, p.label, cp.is_required
+    FROM category_property cp
+    JOIN properties p ON p.id = cp.property_id
+    JOIN categories c ON c.id = cp.category_id
+    WHERE c.entity_key = :entity_key
+""")
 
 
 class DraftOverlayService:
@@ -45,6 +79,16 @@ class DraftOverlayService:
         self.session = session
         self.draft_id = draft_id
         self._draft_changes: dict[str, DraftChange] | None = None
+        self._draft_creates: dict[tuple[str, str | None, int | None], list[DraftChange]] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        """True when there is no draft, so every overlay would be a no-op.
+
+        List endpoints check this first to skip apply_overlay,
+        get_draft_creates and the re-sort entirely.
+        """
+        return self.draft_id is None
 
     async def _load_draft_changes(self) -> dict[str, DraftChange]:
         """Load all changes for this draft, keyed by '{entity_type}:{entity_key}'.
@@ -101,9 +145,72 @@ class DraftOverlayService:
             cached/shared data.
         """
         changes = await self._load_draft_changes()
-        change_key = f"{entity_type}:{entity_key}"
-        draft_change = changes.get(change_key)
+        return self._apply_change(canonical, changes.get(f"{entity_type}:{entity_key}"))
+
+    async def apply_overlay_batch(
+        self,
+        canonicals: Sequence[Any],
+        entity_type: str,
+    ) -> list[dict | None]:
+        """Apply draft changes to a page of canonical entities of one type.
+
+        Same result as calling apply_overlay for each entity, but the draft's
+        changes are resolved once for the whole page.
+
+        Args:
+            canonicals: SQLModel instances with entity_key and canonical_json
+            entity_type: Entity type string (e.g., "category", "property")
+
+        Returns:
+            Effective entity dicts (or None) in the same order as canonicals
+        """
+        changes = await self._load_draft_changes()
+        return [
+            self._apply_change(canonical, changes.get(f"{entity_type}:{canonical.entity_key}"))
+            for canonical in canonicals
+        ]
+
+    async def get_change_status(
+        self,
+        canonical: object | None,
+        entity_type: str,
+        entity_key: str,
+    ) -> ChangeStatus | None:
+        """Get the _change_status apply_overlay would report for one entity.
+
+        For callers that only need the status (e.g. graph nodes). Without a
+        draft every canonical entity is unchanged, so the status is read off the
+        row instead of deep-copying its canonical_json.
+        """
+        if self.is_empty:
+            return "unchanged" if getattr(canonical, "canonical_json", None) else None
+        effective = await self.apply_overlay(canonical, entity_type, entity_key)
+        return effective.get("_change_status") if effective else None
+
+    async def get_change_statuses(
+        self,
+        canonicals: Sequence[Any],
+        entity_type: str,
+    ) -> list[ChangeStatus | None]:
+        """Get the change status of each entity in a page, like get_change_status.
 
+        Returns:
+            Change statuses (or None) in the same order as canonicals
+        """
+        if self.is_empty:
+            return [
+                "unchanged" if getattr(canonical, "canonical_json", None) else None
+                for canonical in canonicals
+            ]
+        effectives = await self.apply_overlay_batch(canonicals, entity_type)
+        return [effective.get("_change_status") if effective else None for effective in effectives]
+
+    def _apply_change(
+        self,
+        canonical: object | None,
+        draft_change: DraftChange | None,
+    ) -> dict | None:
+        """Compute the effective JSON for one entity given its draft change, if any."""
         # No draft context or no changes for this entity
         if not draft_change:
             if canonical is not None:
@@ -183,31 +290,55 @@ class DraftOverlayService:
 
         return None
 
-    async def get_draft_creates(self, entity_type: str) -> list[dict]:
-        """Get all CREATE changes for an entity type.
+    async def get_draft_creates(
+        self,
+        entity_type: str,
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Get CREATE changes for an entity type.
 
         Used for list queries to include draft-created entities
         alongside canonical entities.
 
         Args:
             entity_type: Entity type to filter (e.g., "category", "property")
+            after: Only return entities whose entity_key sorts after this key
+                   (pagination cursor)
+            limit: Maximum number of entities to return
 
         Returns:
-            List of replacement_json dicts with _change_status="added"
+            List of replacement_json dicts with _change_status="added",
+            ordered by entity_key
         """
         if not self.draft_id:
             return []
 
-        # Query draft changes for this entity type with CREATE change type
-        query = (
-            select(DraftChange)
-            .where(DraftChange.draft_id == self.draft_id)
-            .where(DraftChange.change_type == ChangeType.CREATE)
-            .where(DraftChange.entity_type == entity_type)
-        )
-        result = await self.session.execute(query)
-        changes = result.scalars().all()
-
+        # Graph builders ask for the same creates several times per request, so
+        # the rows are memoized for the lifetime of this service instance
+        cache_key = (entity_type, after, limit)
+        changes = self._draft_creates.get(cache_key)
+        if changes is None:
+            # Query draft changes for this entity type with CREATE change type
+            query = (
+                select(DraftChange)
+                .where(DraftChange.draft_id == self.draft_id)
+                .where(DraftChange.change_type == ChangeType.CREATE)
+                .where(DraftChange.entity_type == entity_type)
+                .order_by(DraftChange.entity_key)
+            )
+            if after is not None:
+                query = query.where(DraftChange.entity_key > after)
+            if limit is not None:
+                query = query.limit(limit)
+            result = await self.session.execute(query)
+            changes = self._draft_creates[cache_key] = list(result.scalars().all())
+
+        return self._create_entities(changes)
+
+    @staticmethod
+    def _create_entities(changes: Sequence[DraftChange]) -> list[dict]:
+        """Build list entities from CREATE changes, keeping their order."""
         creates = []
         for change in changes:
             if change.replacement_json:
@@ -224,6 +355,26 @@ class DraftOverlayService:
 
         return creates
 
+    async def get_version(self) -> str | None:
+        """Get a token that changes whenever this draft's changes do.
+
+        Every draft change write bumps Draft.modified_at, so the draft ID plus
+        that timestamp identifies the current set of changes.
+
+        Returns:
+            "0" when there is no draft context, the version token for an
+            existing draft, or None if the draft does not exist
+        """
+        if self.draft_id is None:
+            return "0"
+
+        query = select(Draft.modified_at).where(Draft.id == self.draft_id)
+        result = await self.session.execute(query)
+        modified_at = result.scalar_one_or_none()
+        if modified_at is None:
+            return None
+        return f"{self.draft_id.hex}.{modified_at:%Y%m%d%H%M%S%f}"
+
     async def is_deleted(self, entity_type: str, entity_key: str) -> bool:
         """Check if an entity is deleted in the draft.
 
@@ -276,8 +427,6 @@ class DraftOverlayService:
 
             Returns empty list if no draft context or no parent changes in draft.
         """
-        from sqlalchemy import text
-
         # No draft context - caller should use canonical query
         if not self.draft_id:
             return []
@@ -305,16 +454,10 @@ class DraftOverlayService:
         # Get canonical parents list
         canonical_parents: list[str] = []
         if canonical_category_id:
-            canonical_parents_query = text("""
-                SELECT c.entity_key
-                FROM category_parent cp
-                JOIN categories c ON c.id = cp.parent_id
-                WHERE cp.category_id = :category_id
-            """)
             result = await session.execute(
-                canonical_parents_query, {"category_id": canonical_category_id}
+                _CANONICAL_PARENTS_BY_ID_QUERY, {"category_id": canonical_category_id}
             )
-            canonical_parents = [row[0] for row in result.fetchall()]
+            canonical_parents = list(result.scalars())
 
         # Apply patch to get effective parents
         canonical_json = {"parents": canonical_parents}
@@ -360,15 +503,10 @@ class DraftOverlayService:
                     )
                     if any(op.get("path", "").startswith("/parents") for op in parent_patch):
                         # Get canonical grandparents
-                        gp_query = text("""
-                            SELECT c2.entity_key
-                            FROM categories c
-                            JOIN category_parent cp ON cp.category_id = c.id
-                            JOIN categories c2 ON c2.id = cp.parent_id
-                            WHERE c.entity_key = :entity_key
-                        """)
-                        gp_result = await session.execute(gp_query, {"entity_key": parent_key})
-                        canonical_grandparents = [row[0] for row in gp_result.fetchall()]
+                        gp_result = await session.execute(
+                            _CANONICAL_PARENTS_BY_KEY_QUERY, {"entity_key": parent_key}
+                        )
+                        canonical_grandparents = list(gp_result.scalars())
 
                         try:
                             gp_patch = jsonpatch.JsonPatch(parent_patch)
@@ -378,26 +516,16 @@ class DraftOverlayService:
                             grandparent_keys = canonical_grandparents
                     else:
                         # No parent changes in this category's patch
-                        gp_query = text("""
-                            SELECT c2.entity_key
-                            FROM categories c
-                            JOIN category_parent cp ON cp.category_id = c.id
-                            JOIN categories c2 ON c2.id = cp.parent_id
-                            WHERE c.entity_key = :entity_key
-                        """)
-                        gp_result = await session.execute(gp_query, {"entity_key": parent_key})
-                        grandparent_keys = [row[0] for row in gp_result.fetchall()]
+                        gp_result = await session.execute(
+                            _CANONICAL_PARENTS_BY_KEY_QUERY, {"entity_key": parent_key}
+                        )
+                        grandparent_keys = list(gp_result.scalars())
                 else:
                     # No draft change for this parent - use canonical
-                    gp_query = text("""
-                        SELECT c2.entity_key
-                        FROM categories c
-                        JOIN category_parent cp ON cp.category_id = c.id
-                        JOIN categories c2 ON c2.id = cp.parent_id
-                        WHERE c.entity_key = :entity_key
-                    """)
-                    gp_result = await session.execute(gp_query, {"entity_key": parent_key})
-                    grandparent_keys = [row[0] for row in gp_result.fetchall()]
+                    gp_result = await session.execute(
+                        _CANONICAL_PARENTS_BY_KEY_QUERY, {"entity_key": parent_key}
+                    )
+                    grandparent_keys = list(gp_result.scalars())
 
                 if grandparent_keys:
                     await walk_parents(grandparent_keys, depth + 1)
@@ -410,23 +538,17 @@ class DraftOverlayService:
 
         # Get direct properties for the category itself (depth=0)
         if canonical_category_id:
-            direct_props_query = text("""
-                SELECT p.entity_key, p.label, cp.is_required
-                FROM category_property cp
-                JOIN properties p ON p.id = cp.property_id
-                WHERE cp.category_id = :category_id
-            """)
             direct_result = await session.execute(
-                direct_props_query, {"category_id": canonical_category_id}
+                _DIRECT_PROPERTIES_BY_ID_QUERY, {"category_id": canonical_category_id}
             )
-            for row in direct_result.fetchall():
+            for prop_key, label, is_required in direct_result:
                 properties.append(
                     {
-                        "entity_key": row[0],
-                        "label": row[1],
+                        "entity_key": prop_key,
+                        "label": label,
                         "is_direct": True,
                         "is_inherited": False,
-                        "is_required": row[2],
+                        "is_required": is_required,
                         "source_category": category_entity_key,
                         "inheritance_depth": 0,
                     }
@@ -435,24 +557,17 @@ class DraftOverlayService:
         # Get properties from each ancestor
         for ancestor_key, depth in ancestors.items():
             # Get ancestor's direct properties
-            ancestor_props_query = text("""
-                SELECT p.entity_key, p.label, cp.is_required
-                FROM category_property cp
-                JOIN properties p ON p.id = cp.property_id
-                JOIN categories c ON c.id = cp.category_id
-                WHERE c.entity_key = :entity_key
-            """)
             ancestor_result = await session.execute(
-                ancestor_props_query, {"entity_key": ancestor_key}
+                _DIRECT_PROPERTIES_BY_KEY_QUERY, {"entity_key": ancestor_key}
             )
-            for row in ancestor_result.fetchall():
+            for prop_key, label, is_required in ancestor_result:
                 properties.append(
                     {
-                        "entity_key": row[0],
-                        "label": row[1],
+                        "entity_key": prop_key,
+                        "label": label,
                         "is_direct": False,
                         "is_inherited": True,
-                        "is_required": row[2],
+                        "is_required": is_required,
                         "source_category": ancestor_key,
                         "inheritance_depth": depth,
                     }
@@ -228,6 +228,24 @@ class GitHubClient:
         data = await self._request("GET", url)
         return cast(str, data["tree"]["sha"])
 
+    async def get_branch_head(self, owner: str, repo: str, branch: str = "main") -> tuple[str, str]:
+        """Get the head commit SHA of a branch and that commit's tree SHA.
+
+        One request in place of get_branch_sha followed by get_commit_tree_sha.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name (default: "main")
+
+        Returns:
+            Tuple of (commit SHA, tree SHA)
+        """
+        url = f"/repos/{owner}/{repo}/branches/{branch}"
+        data = await self._request("GET", url)
+        commit = data["commit"]
+        return cast(str, commit["sha"]), cast(str, commit["commit"]["tree"]["sha"])
+
     async def create_tree(self, owner: str, repo: str, files: list[dict], base_tree: str) -> str:
         """Create a new git tree with files.
 
@@ -382,24 +400,21 @@ class GitHubClient:
             # Create temporary GitHubClient instance
             temp_client = GitHubClient(client)
 
-            # 1. Get latest commit SHA from base branch
-            base_sha = await temp_client.get_branch_sha(owner, repo, base_branch)
-
-            # 2. Get tree SHA from base commit
-            base_tree_sha = await temp_client.get_commit_tree_sha(owner, repo, base_sha)
+            # 1. Get latest commit SHA and its tree SHA from base branch
+            base_sha, base_tree_sha = await temp_client.get_branch_head(owner, repo, base_branch)
 
-            # 3. Create new tree with files
+            # 2. Create new tree with files (contents inline, so no per-file blob requests)
             new_tree_sha = await temp_client.create_tree(owner, repo, files, base_tree_sha)
 
-            # 4. Create commit
+            # 3. Create commit
             new_commit_sha = await temp_client.create_commit(
                 owner, repo, commit_message, new_tree_sha, base_sha
             )
 
-            # 5. Create branch
+            # 4. Create branch
             await temp_client.create_branch(owner, repo, branch_name, new_commit_sha)
 
-            # 6. Create pull request
+            # 5. Create pull request
             pr = await temp_client.create_pull_request(
                 owner, repo, pr_title, pr_body, branch_name, base_branch
             )
@@ -7,6 +7,7 @@ for change status badges (GRP-04).
 """
 
 import uuid
+from collections import defaultdict
 from typing import Any
 
 from sqlalchemy import text
@@ -31,6 +32,158 @@ from app.schemas.graph import GraphEdge, GraphNode, GraphResponse
 from app.services.draft_overlay import DraftOverlayService
 from app.services.resource_validation import get_entity_categories
 
+# Rows fetched per round trip when streaming whole-table scans
+_STREAM_CHUNK_SIZE = 1000
+
+# Raw SQL used by the graph queries
+
+# Ancestors and descendants of a category up to :max_depth, each at its nearest
+# depth, read from the category_ancestor closure table rather than walked
+_CATEGORY_NEIGHBORHOOD_QUERY = text("""
+    WITH start_cat AS (
+        SELECT c.id, c.entity_key, c.label
+        FROM categories c WHERE c.entity_key = :entity_key
+    ),
+    neighborhood AS (
+        SELECT id, entity_key, label, 0 as depth FROM start_cat
+
+        UNION ALL
+
+        -- Ancestors (parents, grandparents, etc.)
+        SELECT c.id, c.entity_key, c.label, ca.depth
+        FROM start_cat s
+        JOIN category_ancestor ca ON ca.category_id = s.id
+        JOIN categories c ON c.id = ca.ancestor_id
+        WHERE ca.depth <= :max_depth
+
+        UNION ALL
+
+        -- Descendants (children, grandchildren, etc.)
+        SELECT c.id, c.entity_key, c.label, ca.depth
+        FROM start_cat s
+        JOIN category_ancestor ca ON ca.ancestor_id = s.id
+        JOIN categories c ON c.id = ca.category_id
+        WHERE ca.depth <= :max_depth
+    )
+    -- A category in a cycle is both ancestor and descendant; keep its nearest depth
+    SELECT DISTINCT ON (id) id, entity_key, label, depth
+    FROM neighborhood ORDER BY id, depth
+""")
+
+# Whether walking up from a category revisits a node
+_CATEGORY_CYCLE_CHECK_QUERY = text("""
+    WITH RECURSIVE cycle_check AS (
+        SELECT c.id, ARRAY[c.id] as path, false as has_cycle
+        FROM categories c WHERE c.entity_key = :entity_key
+
+        UNION ALL
+
+        SELECT c.id, cc.path || c.id, c.id = ANY(cc.path)
+        FROM categories c
+        JOIN category_parent cp ON cp.parent_id = c.id
+        JOIN cycle_check cc ON cc.id = cp.category_id
+        WHERE array_length(cc.path, 1) < :max_depth + 5 AND NOT cc.has_cycle
+    )
+    SELECT EXISTS(SELECT 1 FROM cycle_check WHERE has_cycle) as has_cycles
+""")
+
+# Categories that directly use a property
+_PROPERTY_CATEGORIES_QUERY = text("""
+    SELECT c.entity_key, c.label
+    FROM categories c
+    JOIN category_property cp ON cp.category_id = c.id
+    JOIN properties p ON p.id = cp.property_id
+    WHERE p.entity_key = :property_key
+""")
+
+# Ancestors of the seed categories less than :max_depth levels up, excluding
+# the seeds, read from the category_ancestor closure table.
+# Seeds are joined rather than matched with = ANY / != ALL so the planner sees
+# their cardinality and can hash antijoin them out
+_SEED_ANCESTORS_QUERY = text("""
+    WITH seeds(k) AS (
+        SELECT DISTINCT unnest(CAST(:category_keys AS text[]))
+    )
+    SELECT DISTINCT a.entity_key
+    FROM seeds s
+    JOIN categories c ON c.entity_key = s.k
+    JOIN category_ancestor ca ON ca.category_id = c.id
+    JOIN categories a ON a.id = ca.ancestor_id
+    LEFT JOIN seeds x ON x.k = a.entity_key
+    WHERE ca.depth < :max_depth AND x.k IS NULL
+""")
+
+# Categories that directly reference a subobject
+_SUBOBJECT_CATEGORIES_QUERY = text("""
+    SELECT c.entity_key, c.label
+    FROM categories c
+    JOIN category_subobject cs ON cs.category_id = c.id
+    JOIN subobjects s ON s.id = cs.subobject_id
+    WHERE s.entity_key = :subobject_key
+""")
+
+# Every canonical category -> property edge
+_CATEGORY_PROPERTY_EDGES_QUERY = text("""
+    SELECT c.entity_key as category_key, p.entity_key as property_key
+    FROM category_property cp
+    JOIN categories c ON c.id = cp.category_id
+    JOIN properties p ON p.id = cp.property_id
+""")
+
+# Every canonical subobject -> property edge
+_SUBOBJECT_PROPERTY_EDGES_QUERY = text("""
+    SELECT s.entity_key as subobject_key, p.entity_key as property_key
+    FROM subobject_property sp
+    JOIN subobjects s ON s.id = sp.subobject_id
+    JOIN properties p ON p.id = sp.property_id
+""")
+
+# Parent edges with both ends inside the given categories
+_CATEGORY_PARENT_EDGES_QUERY = text("""
+    SELECT c.entity_key as child_key, p.entity_key as parent_key
+    FROM categories c
+    JOIN category_parent cp ON cp.category_id = c.id
+    JOIN categories p ON p.id = cp.parent_id
+    WHERE c.entity_key = ANY(:entity_keys)
+      AND p.entity_key = ANY(:entity_keys)
+""")
+
+# Whether walking up from any of the given categories revisits a node
+_SUBGRAPH_CYCLE_QUERY = text("""
+    WITH RECURSIVE ancestors AS (
+        SELECT c.id, c.entity_key, ARRAY[c.id] as path, false as has_cycle
+        FROM categories c
+        WHERE c.entity_key = ANY(:entity_keys)
+
+        UNION ALL
+
+        SELECT p.id, p.entity_key, a.path || p.id, p.id = ANY(a.path)
+        FROM categories p
+        JOIN category_parent cp ON cp.parent_id = p.id
+        JOIN ancestors a ON a.id = cp.category_id
+        WHERE array_length(a.path, 1) < 50 AND NOT a.has_cycle
+    )
+    SELECT EXISTS(SELECT 1 FROM ancestors WHERE has_cycle) as has_cycles
+""")
+
+# Properties directly assigned to any of the given categories
+_CATEGORIES_PROPERTIES_QUERY = text("""
+    SELECT DISTINCT p.entity_key, p.label, c.entity_key as category_key
+    FROM properties p
+    JOIN category_property cp ON cp.property_id = p.id
+    JOIN categories c ON c.id = cp.category_id
+    WHERE c.entity_key = ANY(:category_keys)
+""")
+
+# Properties of any of the given subobjects
+_SUBOBJECTS_PROPERTIES_QUERY = text("""
+    SELECT s.entity_key as subobject_key, p.entity_key as property_key
+    FROM subobject_property sp
+    JOIN subobjects s ON s.id = sp.subobject_id
+    JOIN properties p ON p.id = sp.property_id
+    WHERE s.entity_key = ANY(:subobject_keys)
+""")
+
 
 class GraphQueryService:
     """Service for graph traversal queries supporting visualization.
@@ -129,57 +282,8 @@ class GraphQueryService:
         # Execute recursive CTEs for neighborhood traversal
         # Uses separate CTEs for ancestors and descendants (PostgreSQL limitation)
         # Path array prevents infinite loops from circular inheritance
-        cte_query = text("""
-            WITH RECURSIVE
-            -- Base: starting category
-            start_cat AS (
-                SELECT c.id, c.entity_key, c.label
-                FROM categories c WHERE c.entity_key = :entity_key
-            ),
-            -- Ancestors (parents, grandparents, etc.)
-            ancestors AS (
-                SELECT c.id, c.entity_key, c.label, 1 as depth, ARRAY[c.id] as path
-                FROM categories c
-                JOIN category_parent cp ON cp.parent_id = c.id
-                JOIN start_cat s ON s.id = cp.category_id
-
-                UNION ALL
-
-                SELECT c.id, c.entity_key, c.label, a.depth + 1, a.path || c.id
-                FROM categories c
-                JOIN category_parent cp ON cp.parent_id = c.id
-                JOIN ancestors a ON a.id = cp.category_id
-                WHERE a.depth < :max_depth AND NOT c.id = ANY(a.path)
-            ),
-            -- Descendants (children, grandchildren, etc.)
-            descendants AS (
-                SELECT c.id, c.entity_key, c.label, 1 as depth, ARRAY[c.id] as path
-                FROM categories c
-                JOIN category_parent cp ON cp.category_id = c.id
-                JOIN start_cat s ON s.id = cp.parent_id
-
-                UNION ALL
-
-                SELECT c.id, c.entity_key, c.label, d.depth + 1, d.path || c.id
-                FROM categories c
-                JOIN category_parent cp ON cp.category_id = c.id
-                JOIN descendants d ON d.id = cp.parent_id
-                WHERE d.depth < :max_depth AND NOT c.id = ANY(d.path)
-            ),
-            -- Combine all nodes
-            neighborhood AS (
-                SELECT id, entity_key, label, 0 as depth FROM start_cat
-                UNION
-                SELECT id, entity_key, label, depth FROM ancestors
-                UNION
-                SELECT id, entity_key, label, depth FROM descendants
-            )
-            SELECT DISTINCT ON (id) id, entity_key, label, depth
-            FROM neighborhood ORDER BY id, depth
-        """)
-
         result = await self.session.execute(
-            cte_query, {"entity_key": entity_key, "max_depth": depth}
+            _CATEGORY_NEIGHBORHOOD_QUERY, {"entity_key": entity_key, "max_depth": depth}
         )
         rows = result.fetchall()
 
@@ -239,11 +343,9 @@ class GraphQueryService:
             category = categories_by_key.get(row.entity_key)
 
             # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(category, "category", row.entity_key)
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
+            change_status = await self.draft_overlay.get_change_status(
+                category, "category", row.entity_key
+            )
 
             nodes.append(
                 GraphNode(
@@ -303,24 +405,8 @@ class GraphQueryService:
 
         # Check for cycles by looking for duplicate nodes in original CTE
         # (if any path contained a cycle, the CTE would have been truncated)
-        cycle_check_query = text("""
-            WITH RECURSIVE cycle_check AS (
-                SELECT c.id, ARRAY[c.id] as path, false as has_cycle
-                FROM categories c WHERE c.entity_key = :entity_key
-
-                UNION ALL
-
-                SELECT c.id, cc.path || c.id, c.id = ANY(cc.path)
-                FROM categories c
-                JOIN category_parent cp ON cp.parent_id = c.id
-                JOIN cycle_check cc ON cc.id = cp.category_id
-                WHERE array_length(cc.path, 1) < :max_depth + 5 AND NOT cc.has_cycle
-            )
-            SELECT EXISTS(SELECT 1 FROM cycle_check WHERE has_cycle) as has_cycles
-        """)
-
         cycle_result = await self.session.execute(
-            cycle_check_query, {"entity_key": entity_key, "max_depth": depth}
+            _CATEGORY_CYCLE_CHECK_QUERY, {"entity_key": entity_key, "max_depth": depth}
         )
         cycle_row = cycle_result.fetchone()
         has_cycles = bool(cycle_row and cycle_row.has_cycles)
@@ -375,14 +461,9 @@ class GraphQueryService:
             )
 
         # Get categories that use this property via category_property relationship
-        category_query = text("""
-            SELECT c.entity_key, c.label
-            FROM categories c
-            JOIN category_property cp ON cp.category_id = c.id
-            JOIN properties p ON p.id = cp.property_id
-            WHERE p.entity_key = :property_key
-        """)
-        result = await self.session.execute(category_query, {"property_key": entity_key})
+        result = await self.session.execute(
+            _PROPERTY_CATEGORIES_QUERY, {"property_key": entity_key}
+        )
         category_rows = result.fetchall()
 
         # Collect category keys
@@ -390,38 +471,17 @@ class GraphQueryService:
 
         # At depth > 1, include parent categories
         if depth > 1 and category_keys:
-            parent_query = text("""
-                WITH RECURSIVE ancestors AS (
-                    SELECT c.id, c.entity_key, c.label, 1 as depth
-                    FROM categories c
-                    WHERE c.entity_key = ANY(:category_keys)
-
-                    UNION ALL
-
-                    SELECT p.id, p.entity_key, p.label, a.depth + 1
-                    FROM categories p
-                    JOIN category_parent cp ON cp.parent_id = p.id
-                    JOIN ancestors a ON a.id = cp.category_id
-                    WHERE a.depth < :max_depth
-                )
-                SELECT DISTINCT entity_key, label FROM ancestors
-            """)
             result = await self.session.execute(
-                parent_query, {"category_keys": category_keys, "max_depth": depth}
+                _SEED_ANCESTORS_QUERY, {"category_keys": category_keys, "max_depth": depth}
             )
-            parent_rows = result.fetchall()
-            for row in parent_rows:
-                if row.entity_key not in category_keys:
-                    category_keys.append(row.entity_key)
+            category_keys.extend(row.entity_key for row in result)
 
         # Build nodes list
         nodes: list[GraphNode] = []
 
         # Add property as center node
         prop_module_membership = await self._get_module_membership([entity_key], "property")
-        effective = await self.draft_overlay.apply_overlay(prop, "property", entity_key)
-        change_status = effective.get("_change_status") if effective else None
-
+        change_status = await self.draft_overlay.get_change_status(prop, "property", entity_key)
         nodes.append(
             GraphNode(
                 id=entity_key,
@@ -440,10 +500,8 @@ class GraphQueryService:
             result = await self.session.execute(categories_query)
             categories = result.scalars().all()
 
-            for cat in categories:
-                effective = await self.draft_overlay.apply_overlay(cat, "category", cat.entity_key)
-                change_status = effective.get("_change_status") if effective else None
-
+            change_statuses = await self.draft_overlay.get_change_statuses(categories, "category")
+            for cat, change_status in zip(categories, change_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=cat.entity_key,
@@ -521,52 +579,26 @@ class GraphQueryService:
             )
 
         # Find categories that reference this subobject via junction table
-        ref_cat_query = text("""
-            SELECT c.entity_key, c.label
-            FROM categories c
-            JOIN category_subobject cs ON cs.category_id = c.id
-            JOIN subobjects s ON s.id = cs.subobject_id
-            WHERE s.entity_key = :subobject_key
-        """)
-        result = await self.session.execute(ref_cat_query, {"subobject_key": entity_key})
+        result = await self.session.execute(
+            _SUBOBJECT_CATEGORIES_QUERY, {"subobject_key": entity_key}
+        )
         referencing_category_rows = result.fetchall()
 
         category_keys = [row.entity_key for row in referencing_category_rows]
 
         # At depth > 1, include parent categories
         if depth > 1 and category_keys:
-            parent_query = text("""
-                WITH RECURSIVE ancestors AS (
-                    SELECT c.id, c.entity_key, c.label, 1 as depth
-                    FROM categories c
-                    WHERE c.entity_key = ANY(:category_keys)
-
-                    UNION ALL
-
-                    SELECT p.id, p.entity_key, p.label, a.depth + 1
-                    FROM categories p
-                    JOIN category_parent cp ON cp.parent_id = p.id
-                    JOIN ancestors a ON a.id = cp.category_id
-                    WHERE a.depth < :max_depth
-                )
-                SELECT DISTINCT entity_key, label FROM ancestors
-            """)
             result = await self.session.execute(
-                parent_query, {"category_keys": category_keys, "max_depth": depth}
+                _SEED_ANCESTORS_QUERY, {"category_keys": category_keys, "max_depth": depth}
             )
-            parent_rows = result.fetchall()
-            for row in parent_rows:
-                if row.entity_key not in category_keys:
-                    category_keys.append(row.entity_key)
+            category_keys.extend(row.entity_key for row in result)
 
         # Build nodes list
         nodes: list[GraphNode] = []
 
         # Add subobject as center node
         subobj_module_membership = await self._get_module_membership([entity_key], "subobject")
-        effective = await self.draft_overlay.apply_overlay(subobj, "subobject", entity_key)
-        change_status = effective.get("_change_status") if effective else None
-
+        change_status = await self.draft_overlay.get_change_status(subobj, "subobject", entity_key)
         nodes.append(
             GraphNode(
                 id=entity_key,
@@ -585,10 +617,8 @@ class GraphQueryService:
             result = await self.session.execute(categories_query)
             categories = result.scalars().all()
 
-            for cat in categories:
-                effective = await self.draft_overlay.apply_overlay(cat, "category", cat.entity_key)
-                change_status = effective.get("_change_status") if effective else None
-
+            change_statuses = await self.draft_overlay.get_change_statuses(categories, "category")
+            for cat, change_status in zip(categories, change_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=cat.entity_key,
@@ -673,9 +703,7 @@ class GraphQueryService:
         nodes: list[GraphNode] = []
 
         # Add template as center node
-        effective = await self.draft_overlay.apply_overlay(template, "template", entity_key)
-        change_status = effective.get("_change_status") if effective else None
-
+        change_status = await self.draft_overlay.get_change_status(template, "template", entity_key)
         nodes.append(
             GraphNode(
                 id=entity_key,
@@ -709,7 +737,7 @@ class GraphQueryService:
                     .limit(10)  # Limit for performance
                 )
                 result = await self.session.execute(other_templates_query)
-                other_template_keys = [row[0] for row in result.fetchall()]
+                other_template_keys = list(result.scalars())
 
                 if other_template_keys:
                     # Get template data
@@ -724,12 +752,10 @@ class GraphQueryService:
                         other_template_keys, "template"
                     )
 
-                    for tmpl in other_templates:
-                        effective = await self.draft_overlay.apply_overlay(
-                            tmpl, "template", tmpl.entity_key
-                        )
-                        change_status = effective.get("_change_status") if effective else None
-
+                    change_statuses = await self.draft_overlay.get_change_statuses(
+                        other_templates, "template"
+                    )
+                    for tmpl, change_status in zip(other_templates, change_statuses, strict=True):
                         nodes.append(
                             GraphNode(
                                 id=tmpl.entity_key,
@@ -817,9 +843,9 @@ class GraphQueryService:
         edges: list[GraphEdge] = []
 
         # Add dashboard as center node
-        effective = await self.draft_overlay.apply_overlay(dashboard, "dashboard", entity_key)
-        change_status = effective.get("_change_status") if effective else None
-
+        change_status = await self.draft_overlay.get_change_status(
+            dashboard, "dashboard", entity_key
+        )
         nodes.append(
             GraphNode(
                 id=entity_key,
@@ -841,14 +867,12 @@ class GraphQueryService:
         connected_modules = result.scalars().all()
 
         # Add module nodes
-        for module in connected_modules:
-            module_effective = await self.draft_overlay.apply_overlay(
-                module, "module", module.entity_key
-            )
-            module_change_status = (
-                module_effective.get("_change_status") if module_effective else None
-            )
-
+        module_change_statuses = await self.draft_overlay.get_change_statuses(
+            connected_modules, "module"
+        )
+        for module, module_change_status in zip(
+            connected_modules, module_change_statuses, strict=True
+        ):
             nodes.append(
                 GraphNode(
                     id=module.entity_key,
@@ -916,41 +940,11 @@ class GraphQueryService:
             edges: list[GraphEdge] = []
 
             # Check if draft resource has categories
-            draft_categories = get_entity_categories(draft_match)
-
-            for draft_category_key in draft_categories:
-                cat_query = select(Category).where(Category.entity_key == draft_category_key)
-                cat_result = await self.session.execute(cat_query)
-                category = cat_result.scalar_one_or_none()
-
-                if category:
-                    cat_effective = await self.draft_overlay.apply_overlay(
-                        category, "category", draft_category_key
-                    )
-                    cat_change_status = (
-                        cat_effective.get("_change_status") if cat_effective else None
-                    )
-                    cat_module_membership = await self._get_module_membership(
-                        [draft_category_key], "category"
-                    )
-
-                    nodes.append(
-                        GraphNode(
-                            id=draft_category_key,
-                            label=category.label,
-                            entity_type="category",
-                            depth=1,
-                            modules=cat_module_membership.get(draft_category_key, []),
-                            change_status=cat_change_status,
-                        )
-                    )
-                    edges.append(
-                        GraphEdge(
-                            source=draft_category_key,
-                            target=entity_key,
-                            edge_type="category_resource",
-                        )
-                    )
+            category_nodes, category_edges = await self._get_resource_category_nodes(
+                entity_key, get_entity_categories(draft_match)
+            )
+            nodes.extend(category_nodes)
+            edges.extend(category_edges)
 
             return GraphResponse(nodes=nodes, edges=edges, has_cycles=False)
 
@@ -959,9 +953,7 @@ class GraphQueryService:
         edges_list: list[GraphEdge] = []
 
         # Add resource as center node
-        effective = await self.draft_overlay.apply_overlay(resource, "resource", entity_key)
-        change_status = effective.get("_change_status") if effective else None
-
+        change_status = await self.draft_overlay.get_change_status(resource, "resource", entity_key)
         nodes_list.append(
             GraphNode(
                 id=entity_key,
@@ -974,38 +966,62 @@ class GraphQueryService:
         )
 
         # Get parent categories via resource.category_keys
-        for cat_key in resource.category_keys:
-            category_query = select(Category).where(Category.entity_key == cat_key)
-            result = await self.session.execute(category_query)
-            parent_category = result.scalar_one_or_none()
-
-            if parent_category:
-                cat_effective = await self.draft_overlay.apply_overlay(
-                    parent_category, "category", cat_key
-                )
-                cat_change_status = cat_effective.get("_change_status") if cat_effective else None
-                cat_module_membership = await self._get_module_membership([cat_key], "category")
+        category_nodes, category_edges = await self._get_resource_category_nodes(
+            entity_key, resource.category_keys
+        )
+        nodes_list.extend(category_nodes)
+        edges_list.extend(category_edges)
 
-                nodes_list.append(
-                    GraphNode(
-                        id=cat_key,
-                        label=parent_category.label,
-                        entity_type="category",
-                        depth=1,
-                        modules=cat_module_membership.get(cat_key, []),
-                        change_status=cat_change_status,
-                    )
-                )
+        return GraphResponse(nodes=nodes_list, edges=edges_list, has_cycles=False)
 
-                edges_list.append(
-                    GraphEdge(
-                        source=cat_key,
-                        target=entity_key,
-                        edge_type="category_resource",
-                    )
-                )
+    async def _get_resource_category_nodes(
+        self,
+        resource_key: str,
+        category_keys: list[str],
+    ) -> tuple[list[GraphNode], list[GraphEdge]]:
+        """Get category nodes and edges for a resource's categories.
 
-        return GraphResponse(nodes=nodes_list, edges=edges_list, has_cycles=False)
+        Categories, their draft overlay and their module membership are each
+        loaded once for the whole list rather than once per category. Keys
+        without a canonical category are skipped.
+
+        Args:
+            resource_key: Resource entity key the edges point to
+            category_keys: Category entity keys in display order
+
+        Returns:
+            Tuple of (category nodes, category_resource edges)
+        """
+        if not category_keys:
+            return [], []
+
+        categories_query = select(Category).where(col(Category.entity_key).in_(category_keys))
+        result = await self.session.execute(categories_query)
+        categories_by_key = {category.entity_key: category for category in result.scalars()}
+        categories = [categories_by_key[key] for key in category_keys if key in categories_by_key]
+        if not categories:
+            return [], []
+
+        found_keys = [category.entity_key for category in categories]
+        change_statuses = await self.draft_overlay.get_change_statuses(categories, "category")
+        module_membership = await self._get_module_membership(found_keys, "category")
+
+        nodes = [
+            GraphNode(
+                id=category.entity_key,
+                label=category.label,
+                entity_type="category",
+                depth=1,
+                modules=module_membership.get(category.entity_key, []),
+                change_status=change_status,
+            )
+            for category, change_status in zip(categories, change_statuses, strict=True)
+        ]
+        edges = [
+            GraphEdge(source=key, target=resource_key, edge_type="category_resource")
+            for key in found_keys
+        ]
+        return nodes, edges
 
     async def get_full_ontology_graph(self) -> GraphResponse:
         """Get the full ontology graph with all entities (GRP-05).
@@ -1032,11 +1048,13 @@ class GraphQueryService:
             cat_module_membership = await self._get_module_membership(category_keys, "category")
 
             # Compute draft overlay once per category (avoids 4x repeated calls)
-            category_overlays: dict[str, dict | None] = {}
-            for cat in categories:
-                category_overlays[cat.entity_key] = await self.draft_overlay.apply_overlay(
-                    cat, "category", cat.entity_key
+            category_overlays: dict[str, dict | None] = dict(
+                zip(
+                    category_keys,
+                    await self.draft_overlay.apply_overlay_batch(categories, "category"),
+                    strict=True,
                 )
+            )
 
             for cat in categories:
                 effective = category_overlays[cat.entity_key]
@@ -1108,12 +1126,8 @@ class GraphQueryService:
         if property_keys:
             prop_module_membership = await self._get_module_membership(property_keys, "property")
 
-            for prop in properties:
-                effective = await self.draft_overlay.apply_overlay(
-                    prop, "property", prop.entity_key
-                )
-                change_status = effective.get("_change_status") if effective else None
-
+            prop_statuses = await self.draft_overlay.get_change_statuses(properties, "property")
+            for prop, change_status in zip(properties, prop_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=prop.entity_key,
@@ -1136,15 +1150,9 @@ class GraphQueryService:
 
             # Get property edges (category -> property) with draft awareness
             # Build canonical edges from junction table
-            property_edge_query = text("""
-                SELECT c.entity_key as category_key, p.entity_key as property_key
-                FROM category_property cp
-                JOIN categories c ON c.id = cp.category_id
-                JOIN properties p ON p.id = cp.property_id
-            """)
-            result = await self.session.execute(property_edge_query)
+            result = await self.session.execute(_CATEGORY_PROPERTY_EDGES_QUERY)
             canonical_prop_edges: set[tuple[str, str]] = set()
-            for row in result.fetchall():
+            for row in result:
                 canonical_prop_edges.add((row.category_key, row.property_key))
 
             # Compute effective edges from cached category overlays
@@ -1173,12 +1181,8 @@ class GraphQueryService:
                 subobject_keys, "subobject"
             )
 
-            for subobj in subobjects:
-                effective = await self.draft_overlay.apply_overlay(
-                    subobj, "subobject", subobj.entity_key
-                )
-                change_status = effective.get("_change_status") if effective else None
-
+            subobj_statuses = await self.draft_overlay.get_change_statuses(subobjects, "subobject")
+            for subobj, change_status in zip(subobjects, subobj_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=subobj.entity_key,
@@ -1210,14 +1214,8 @@ class GraphQueryService:
                     effective_sub_edges.add((cat.entity_key, sub_key))
 
         # Get subobject -> property edges
-        subobject_property_edge_query = text("""
-            SELECT s.entity_key as subobject_key, p.entity_key as property_key
-            FROM subobject_property sp
-            JOIN subobjects s ON s.id = sp.subobject_id
-            JOIN properties p ON p.id = sp.property_id
-        """)
-        result = await self.session.execute(subobject_property_edge_query)
-        for row in result.fetchall():
+        result = await self.session.execute(_SUBOBJECT_PROPERTY_EDGES_QUERY)
+        for row in result:
             edges.append(
                 GraphEdge(
                     source=row.subobject_key,
@@ -1241,12 +1239,8 @@ class GraphQueryService:
                 template_keys, "template"
             )
 
-            for template in templates:
-                effective = await self.draft_overlay.apply_overlay(
-                    template, "template", template.entity_key
-                )
-                change_status = effective.get("_change_status") if effective else None
-
+            template_statuses = await self.draft_overlay.get_change_statuses(templates, "template")
+            for template, change_status in zip(templates, template_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=template.entity_key,
@@ -1269,12 +1263,10 @@ class GraphQueryService:
         dashboard_keys = [d.entity_key for d in dashboards]
 
         if dashboard_keys:
-            for dashboard in dashboards:
-                effective = await self.draft_overlay.apply_overlay(
-                    dashboard, "dashboard", dashboard.entity_key
-                )
-                change_status = effective.get("_change_status") if effective else None
-
+            dashboard_statuses = await self.draft_overlay.get_change_statuses(
+                dashboards, "dashboard"
+            )
+            for dashboard, change_status in zip(dashboards, dashboard_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=dashboard.entity_key,
@@ -1305,12 +1297,8 @@ class GraphQueryService:
         pre_resource_node_ids = {n.id for n in nodes}
 
         if resource_keys:
-            for resource in resources:
-                effective = await self.draft_overlay.apply_overlay(
-                    resource, "resource", resource.entity_key
-                )
-                change_status = effective.get("_change_status") if effective else None
-
+            resource_statuses = await self.draft_overlay.get_change_statuses(resources, "resource")
+            for resource, change_status in zip(resources, resource_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=resource.entity_key,
@@ -1468,38 +1456,35 @@ class GraphQueryService:
         if not module:
             raise ValueError(f"Module '{module_key}' not found")
 
-        # Get all category entity_keys in this module
+        # Get all category entity_keys in this module together with their
+        # category rows (None for keys without a canonical category)
         # entity_type is stored as string value (e.g., "category")
-        membership_query = select(ModuleEntity.entity_key).where(
-            ModuleEntity.module_id == module.id,
-            ModuleEntity.entity_type == "category",
+        membership_query = (
+            select(ModuleEntity.entity_key, Category)
+            .outerjoin(Category, col(Category.entity_key) == col(ModuleEntity.entity_key))
+            .where(
+                ModuleEntity.module_id == module.id,
+                ModuleEntity.entity_type == "category",
+            )
         )
         result = await self.session.execute(membership_query)
-        entity_keys = [row[0] for row in result.fetchall()]
+        entity_keys: list[str] = []
+        categories: list[Category] = []
+        for entity_key, category in result:
+            entity_keys.append(entity_key)
+            if category is not None:
+                categories.append(category)
 
         if not entity_keys:
             return GraphResponse(nodes=[], edges=[], has_cycles=False)
 
-        # Get category data for all module entities
-        categories_query = select(Category).where(col(Category.entity_key).in_(entity_keys))
-        result = await self.session.execute(categories_query)
-        categories = result.scalars().all()
-
         # Batch load module membership (categories may belong to multiple modules)
         module_membership = await self._get_module_membership(entity_keys, "category")
 
         # Build nodes with draft overlay applied
         nodes: list[GraphNode] = []
-        for category in categories:
-            # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(
-                category, "category", category.entity_key
-            )
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
-
+        change_statuses = await self.draft_overlay.get_change_statuses(categories, "category")
+        for category, change_status in zip(categories, change_statuses, strict=True):
             nodes.append(
                 GraphNode(
                     id=category.entity_key,
@@ -1606,36 +1591,33 @@ class GraphQueryService:
         result = await self.session.execute(query)
 
         # Build direct membership: module_key → set of manual category keys
-        module_to_manual_cats: dict[str, set[str]] = {}
-        direct_membership: dict[str, list[str]] = {}
-        for row in result.fetchall():
-            cat_key = row.entity_key
-            mod_key = row.module_key
-            if cat_key not in direct_membership:
-                direct_membership[cat_key] = []
+        module_to_manual_cats: defaultdict[str, set[str]] = defaultdict(set)
+        direct_membership: defaultdict[str, list[str]] = defaultdict(list)
+        for cat_key, mod_key in result:
             direct_membership[cat_key].append(mod_key)
-            if mod_key not in module_to_manual_cats:
-                module_to_manual_cats[mod_key] = set()
             module_to_manual_cats[mod_key].add(cat_key)
 
         if entity_type != "category" or not module_to_manual_cats:
-            return direct_membership
+            return dict(direct_membership)
 
         # Expand: for each module, walk UP from its manual categories to find
         # all parent categories, and add those to the module's membership too.
-        # Load full parent graph once
-        parent_query = select(
-            Category.entity_key,
-            CategoryParent.parent_id,
-        ).join(CategoryParent, col(CategoryParent.category_id) == col(Category.id))
-        parent_result = await self.session.execute(parent_query)
+        # Load full parent graph once, streamed so rows are decoded in chunks
+        # rather than buffered all at once
+        parent_query = (
+            select(
+                Category.entity_key,
+                CategoryParent.parent_id,
+            )
+            .join(CategoryParent, col(CategoryParent.category_id) == col(Category.id))
+            .execution_options(yield_per=_STREAM_CHUNK_SIZE)
+        )
+        parent_result = await self.session.stream(parent_query)
 
         # Build child→parent_ids and parent_id→parent_key mappings
-        child_to_parent_ids: dict[str, list] = {}
-        for row in parent_result.fetchall():
-            if row[0] not in child_to_parent_ids:
-                child_to_parent_ids[row[0]] = []
-            child_to_parent_ids[row[0]].append(row[1])
+        child_to_parent_ids: defaultdict[str, list] = defaultdict(list)
+        async for child_key, parent_id in parent_result:
+            child_to_parent_ids[child_key].append(parent_id)
 
         # Resolve parent IDs to keys
         all_parent_ids = set()
@@ -1648,8 +1630,8 @@ class GraphQueryService:
                 col(Category.id).in_(list(all_parent_ids))
             )
             id_result = await self.session.execute(id_query)
-            for row in id_result.fetchall():
-                parent_id_to_key[str(row[0])] = row[1]
+            for parent_id, parent_key in id_result:
+                parent_id_to_key[str(parent_id)] = parent_key
 
         # For each module, BFS up from manual categories
         expanded_membership: dict[str, list[str]] = dict(direct_membership)
@@ -1710,7 +1692,7 @@ class GraphQueryService:
         bundle_result = await self.session.execute(bundle_query)
 
         module_to_bundles: dict[str, list[str]] = {}
-        for row in bundle_result.fetchall():
+        for row in bundle_result:
             if row.module_key not in module_to_bundles:
                 module_to_bundles[row.module_key] = []
             if row.bundle_key not in module_to_bundles[row.module_key]:
@@ -1745,17 +1727,9 @@ class GraphQueryService:
         if not entity_keys:
             return []
 
-        # Use raw SQL for clarity with self-join on categories
-        edge_query = text("""
-            SELECT c.entity_key as child_key, p.entity_key as parent_key
-            FROM categories c
-            JOIN category_parent cp ON cp.category_id = c.id
-            JOIN categories p ON p.id = cp.parent_id
-            WHERE c.entity_key = ANY(:entity_keys)
-              AND p.entity_key = ANY(:entity_keys)
-        """)
-
-        result = await self.session.execute(edge_query, {"entity_keys": entity_keys})
+        result = await self.session.execute(
+            _CATEGORY_PARENT_EDGES_QUERY, {"entity_keys": entity_keys}
+        )
         rows = result.fetchall()
 
         return [
@@ -1843,24 +1817,7 @@ class GraphQueryService:
             return False
 
         # For each entity, trace ancestors looking for cycles
-        cycle_query = text("""
-            WITH RECURSIVE ancestors AS (
-                SELECT c.id, c.entity_key, ARRAY[c.id] as path, false as has_cycle
-                FROM categories c
-                WHERE c.entity_key = ANY(:entity_keys)
-
-                UNION ALL
-
-                SELECT p.id, p.entity_key, a.path || p.id, p.id = ANY(a.path)
-                FROM categories p
-                JOIN category_parent cp ON cp.parent_id = p.id
-                JOIN ancestors a ON a.id = cp.category_id
-                WHERE array_length(a.path, 1) < 50 AND NOT a.has_cycle
-            )
-            SELECT EXISTS(SELECT 1 FROM ancestors WHERE has_cycle) as has_cycles
-        """)
-
-        result = await self.session.execute(cycle_query, {"entity_keys": entity_keys})
+        result = await self.session.execute(_SUBGRAPH_CYCLE_QUERY, {"entity_keys": entity_keys})
         row = result.fetchone()
         return bool(row and row.has_cycles)
 
@@ -1884,15 +1841,9 @@ class GraphQueryService:
             return [], []
 
         # Get properties for categories via category_property relationship
-        property_query = text("""
-            SELECT DISTINCT p.entity_key, p.label, c.entity_key as category_key
-            FROM properties p
-            JOIN category_property cp ON cp.property_id = p.id
-            JOIN categories c ON c.id = cp.category_id
-            WHERE c.entity_key = ANY(:category_keys)
-        """)
-
-        result = await self.session.execute(property_query, {"category_keys": category_keys})
+        result = await self.session.execute(
+            _CATEGORIES_PROPERTIES_QUERY, {"category_keys": category_keys}
+        )
         rows = result.fetchall()
 
         if not rows:
@@ -1921,11 +1872,9 @@ class GraphQueryService:
             prop = properties_by_key.get(row.entity_key)
 
             # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(prop, "property", row.entity_key)
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
+            change_status = await self.draft_overlay.get_change_status(
+                prop, "property", row.entity_key
+            )
 
             nodes.append(
                 GraphNode(
@@ -1951,6 +1900,36 @@ class GraphQueryService:
 
         return nodes, edges
 
+    async def _get_module_members(
+        self,
+        module_id: uuid.UUID,
+        model: Any,
+        entity_type: str,
+    ) -> list[Any]:
+        """Get the canonical entities of one type that belong to a module.
+
+        Joins the entity table onto module_entity, so membership and entity
+        rows come back in one query.
+
+        Args:
+            module_id: Module database ID
+            model: Entity table model (Property, Subobject, ...)
+            entity_type: Entity type string stored in module_entity
+
+        Returns:
+            Entities of that type listed in the module
+        """
+        query = (
+            select(model)
+            .join(ModuleEntity, col(ModuleEntity.entity_key) == col(model.entity_key))
+            .where(
+                ModuleEntity.module_id == module_id,
+                ModuleEntity.entity_type == entity_type,
+            )
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars())
+
     async def _get_module_property_nodes(
         self,
         module_id: uuid.UUID,
@@ -1968,35 +1947,21 @@ class GraphQueryService:
         Returns:
             Tuple of (property nodes, empty edges list)
         """
-        # Get property entity_keys in this module
-        membership_query = select(ModuleEntity.entity_key).where(
-            ModuleEntity.module_id == module_id,
-            ModuleEntity.entity_type == "property",
-        )
-        result = await self.session.execute(membership_query)
-        property_keys = [row[0] for row in result.fetchall()]
+        # Get the properties in this module
+        properties = await self._get_module_members(module_id, Property, "property")
 
-        if not property_keys:
+        if not properties:
             return [], []
 
-        # Get property data
-        properties_query = select(Property).where(col(Property.entity_key).in_(property_keys))
-        result = await self.session.execute(properties_query)
-        properties = result.scalars().all()
+        property_keys = [entity.entity_key for entity in properties]
 
         # Batch load module membership for properties
         property_module_membership = await self._get_module_membership(property_keys, "property")
 
         # Build property nodes with draft overlay
         nodes: list[GraphNode] = []
-        for prop in properties:
-            # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(prop, "property", prop.entity_key)
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
-
+        change_statuses = await self.draft_overlay.get_change_statuses(properties, "property")
+        for prop, change_status in zip(properties, change_statuses, strict=True):
             nodes.append(
                 GraphNode(
                     id=prop.entity_key,
@@ -2083,14 +2048,10 @@ class GraphQueryService:
             seen_subobjects.add(subobj.entity_key)
 
             # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(
+            change_status = await self.draft_overlay.get_change_status(
                 subobj, "subobject", subobj.entity_key
             )
 
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
-
             nodes.append(
                 GraphNode(
                     id=subobj.entity_key,
@@ -2116,15 +2077,8 @@ class GraphQueryService:
                     )
 
         # Get subobject -> property edges and property nodes
-        subobject_property_query = text("""
-            SELECT s.entity_key as subobject_key, p.entity_key as property_key
-            FROM subobject_property sp
-            JOIN subobjects s ON s.id = sp.subobject_id
-            JOIN properties p ON p.id = sp.property_id
-            WHERE s.entity_key = ANY(:subobject_keys)
-        """)
         result = await self.session.execute(
-            subobject_property_query, {"subobject_keys": list(seen_subobjects)}
+            _SUBOBJECTS_PROPERTIES_QUERY, {"subobject_keys": list(seen_subobjects)}
         )
         subobject_property_rows = result.fetchall()
 
@@ -2153,14 +2107,8 @@ class GraphQueryService:
                 list(property_keys_for_subobjects), "property"
             )
 
-            for prop in properties:
-                effective = await self.draft_overlay.apply_overlay(
-                    prop, "property", prop.entity_key
-                )
-                change_status = None
-                if effective:
-                    change_status = effective.get("_change_status")
-
+            change_statuses = await self.draft_overlay.get_change_statuses(properties, "property")
+            for prop, change_status in zip(properties, change_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=prop.entity_key,
@@ -2191,37 +2139,21 @@ class GraphQueryService:
         Returns:
             Tuple of (subobject nodes, empty edges list)
         """
-        # Get subobject entity_keys in this module
-        membership_query = select(ModuleEntity.entity_key).where(
-            ModuleEntity.module_id == module_id,
-            ModuleEntity.entity_type == "subobject",
-        )
-        result = await self.session.execute(membership_query)
-        subobject_keys = [row[0] for row in result.fetchall()]
+        # Get the subobjects in this module
+        subobjects = await self._get_module_members(module_id, Subobject, "subobject")
 
-        if not subobject_keys:
+        if not subobjects:
             return [], []
 
-        # Get subobject data
-        subobjects_query = select(Subobject).where(col(Subobject.entity_key).in_(subobject_keys))
-        result = await self.session.execute(subobjects_query)
-        subobjects = result.scalars().all()
+        subobject_keys = [entity.entity_key for entity in subobjects]
 
         # Batch load module membership for subobjects
         subobject_module_membership = await self._get_module_membership(subobject_keys, "subobject")
 
         # Build subobject nodes with draft overlay
         nodes: list[GraphNode] = []
-        for subobj in subobjects:
-            # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(
-                subobj, "subobject", subobj.entity_key
-            )
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
-
+        change_statuses = await self.draft_overlay.get_change_statuses(subobjects, "subobject")
+        for subobj, change_status in zip(subobjects, change_statuses, strict=True):
             nodes.append(
                 GraphNode(
                     id=subobj.entity_key,
@@ -2235,15 +2167,8 @@ class GraphQueryService:
 
         # Get subobject -> property edges
         edges: list[GraphEdge] = []
-        subobject_property_query = text("""
-            SELECT s.entity_key as subobject_key, p.entity_key as property_key
-            FROM subobject_property sp
-            JOIN subobjects s ON s.id = sp.subobject_id
-            JOIN properties p ON p.id = sp.property_id
-            WHERE s.entity_key = ANY(:subobject_keys)
-        """)
         result = await self.session.execute(
-            subobject_property_query, {"subobject_keys": subobject_keys}
+            _SUBOBJECTS_PROPERTIES_QUERY, {"subobject_keys": subobject_keys}
         )
         subobject_property_rows = result.fetchall()
 
@@ -2272,14 +2197,8 @@ class GraphQueryService:
                 list(property_keys_for_subobjects), "property"
             )
 
-            for prop in properties:
-                effective = await self.draft_overlay.apply_overlay(
-                    prop, "property", prop.entity_key
-                )
-                change_status = None
-                if effective:
-                    change_status = effective.get("_change_status")
-
+            change_statuses = await self.draft_overlay.get_change_statuses(properties, "property")
+            for prop, change_status in zip(properties, change_statuses, strict=True):
                 nodes.append(
                     GraphNode(
                         id=prop.entity_key,
@@ -2310,37 +2229,21 @@ class GraphQueryService:
         Returns:
             List of template nodes (no edges)
         """
-        # Get template entity_keys in this module
-        membership_query = select(ModuleEntity.entity_key).where(
-            ModuleEntity.module_id == module_id,
-            ModuleEntity.entity_type == "template",
-        )
-        result = await self.session.execute(membership_query)
-        template_keys = [row[0] for row in result.fetchall()]
+        # Get the templates in this module
+        templates = await self._get_module_members(module_id, Template, "template")
 
-        if not template_keys:
+        if not templates:
             return []
 
-        # Get template data
-        templates_query = select(Template).where(col(Template.entity_key).in_(template_keys))
-        result = await self.session.execute(templates_query)
-        templates = result.scalars().all()
+        template_keys = [entity.entity_key for entity in templates]
 
         # Batch load module membership for templates
         template_module_membership = await self._get_module_membership(template_keys, "template")
 
         # Build template nodes with draft overlay
         nodes: list[GraphNode] = []
-        for template in templates:
-            # Apply draft overlay to get effective data with change_status
-            effective = await self.draft_overlay.apply_overlay(
-                template, "template", template.entity_key
-            )
-
-            change_status = None
-            if effective:
-                change_status = effective.get("_change_status")
-
+        change_statuses = await self.draft_overlay.get_change_statuses(templates, "template")
+        for template, change_status in zip(templates, change_statuses, strict=True):
             nodes.append(
                 GraphNode(
                     id=template.entity_key,
@@ -6,6 +6,7 @@ import logging
 import shutil
 import tempfile
 import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,7 @@ from app.models.v2 import (
     BundleDashboard,
     BundleModule,
     Category,
+    CategoryAncestor,
     CategoryParent,
     CategoryProperty,
     CategorySubobject,
@@ -40,6 +42,7 @@ from app.models.v2 import (
     # Mat view refresh
     refresh_category_property_effective,
 )
+from app.services.canonical_cache import invalidate_canonical_cache
 from app.services.parsers import EntityParser, ParsedEntities, PendingRelationship
 from app.services.parsers.wikitext_parser import (
     parse_dashboard_annotations,
@@ -200,6 +203,7 @@ class IngestService:
         await self._session.execute(delete(SubobjectProperty))
         await self._session.execute(delete(CategorySubobject))
         await self._session.execute(delete(CategoryProperty))
+        await self._session.execute(delete(CategoryAncestor))
         await self._session.execute(delete(CategoryParent))
 
         # 2. Delete entities (order doesn't matter after relationships cleared)
@@ -212,9 +216,6 @@ class IngestService:
         await self._session.execute(delete(Property))
         await self._session.execute(delete(Category))
 
-        # 3. Delete previous OntologyVersion (only keep latest)
-        await self._session.execute(delete(OntologyVersion))
-
     async def insert_entities(self, parsed: ParsedEntities) -> None:
         """Insert all parsed entities into database."""
         self._session.add_all(parsed.categories)
@@ -260,6 +261,8 @@ class IngestService:
             for d in (await self._session.execute(select(Dashboard))).scalars().all()
         }
 
+        category_parents: dict[uuid.UUID, list[uuid.UUID]] = {}
+
         for rel in pending:
             if rel.type == "category_parent":
                 cat_id = categories.get(rel.source_key)
@@ -271,6 +274,7 @@ class IngestService:
                             parent_id=parent_id,
                         )
                     )
+                    category_parents.setdefault(cat_id, []).append(parent_id)
                 else:
                     self._warnings.append(
                         f"Unresolved parent: {rel.source_key} -> {rel.target_key}"
@@ -327,15 +331,11 @@ class IngestService:
             elif rel.type == "module_entity":
                 module_id = modules.get(rel.source_key)
                 if module_id:
-                    # Convert enum to value string for storage
-                    entity_type = rel.extra["entity_type"]
-                    entity_type_value = (
-                        entity_type.value if hasattr(entity_type, "value") else entity_type
-                    )
                     self._session.add(
                         ModuleEntity(
                             module_id=module_id,
-                            entity_type=entity_type_value,
+                            # EntityType is a StrEnum: str() yields the stored value
+                            entity_type=str(rel.extra["entity_type"]),
                             entity_key=rel.target_key,
                         )
                     )
@@ -387,6 +387,35 @@ class IngestService:
                         f"Unresolved bundle_dashboard: {rel.source_key} -> {rel.target_key}"
                     )
 
+        self._insert_category_ancestors(category_parents)
+
+    def _insert_category_ancestors(self, parents: dict[uuid.UUID, list[uuid.UUID]]) -> None:
+        """Insert the transitive closure of category_parent into category_ancestor.
+
+        Walks up breadth-first from each category, so every ancestor is
+        recorded at its shortest depth; already-seen categories stop cycles.
+        """
+        for category_id, direct_parents in parents.items():
+            seen = {category_id}
+            frontier = direct_parents
+            depth = 1
+            while frontier:
+                next_frontier: list[uuid.UUID] = []
+                for ancestor_id in frontier:
+                    if ancestor_id in seen:
+                        continue
+                    seen.add(ancestor_id)
+                    self._session.add(
+                        CategoryAncestor(
+                            category_id=category_id,
+                            ancestor_id=ancestor_id,
+                            depth=depth,
+                        )
+                    )
+                    next_frontier.extend(parents.get(ancestor_id, ()))
+                frontier = next_frontier
+                depth += 1
+
     async def refresh_mat_view(self) -> None:
         """Refresh materialized view in separate transaction."""
         await refresh_category_property_effective(self._session)
@@ -531,15 +560,6 @@ async def sync_repository_v2(
         await service.resolve_and_insert_relationships(parsed.relationships)
         logger.info("Inserted relationships")
 
-        version = OntologyVersion(
-            commit_sha=commit_sha,
-            ingest_status=IngestStatus.COMPLETED,
-            entity_counts=parsed.entity_counts(),
-            warnings=service._warnings if service._warnings else None,
-            ingested_at=datetime.utcnow(),
-        )
-        session.add(version)
-
         await session.commit()
 
         # 6. Refresh mat view (must be separate transaction)
@@ -547,9 +567,28 @@ async def sync_repository_v2(
             await service.refresh_mat_view()
             logger.info("Refreshed category_property_effective mat view")
         except Exception as e:
+            # Clear the failed transaction so the version can still be recorded
+            await session.rollback()
             logger.warning("Mat view refresh failed (non-blocking): %s", e)
             service._warnings.append(f"Mat view refresh failed: {e}")
 
+        # Record the version only now: every process's canonical cache, and the
+        # detail ETags, switch over to the new commit when they see it, so it
+        # must not appear before the mat view is rebuilt. The previous version
+        # is replaced in the same transaction (only the latest is kept), so a
+        # version row exists throughout the rebuild
+        await session.execute(delete(OntologyVersion))
+        version = OntologyVersion(
+            commit_sha=commit_sha,
+            ingest_status=IngestStatus.COMPLETED,
+            entity_counts=parsed.entity_counts(),
+            warnings=service._warnings if service._warnings else None,
+            ingested_at=datetime.utcnow(),
+        )
+        session.add(version)
+        await session.commit()
+        invalidate_canonical_cache()
+
         duration = time.time() - start_time
         logger.info(
             "v2.0 sync complete in %.2fs: %s, %d warnings",
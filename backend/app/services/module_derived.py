@@ -26,6 +26,35 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.v2 import Category, ChangeType, DraftChange, Property, Resource, Subobject
 from app.services.resource_validation import get_entity_categories
 
+# Raw SQL for per-category member lookups
+
+# All effective properties of a category (direct and inherited)
+_PROPERTY_KEYS_QUERY = text("""
+    SELECT p.entity_key
+    FROM category_property_effective cpe
+    JOIN properties p ON p.id = cpe.property_id
+    JOIN categories c ON c.id = cpe.category_id
+    WHERE c.entity_key = :entity_key
+""")
+
+# Inherited properties of a category only (depth > 0)
+_INHERITED_PROPERTY_KEYS_QUERY = text("""
+    SELECT p.entity_key
+    FROM category_property_effective cpe
+    JOIN properties p ON p.id = cpe.property_id
+    JOIN categories c ON c.id = cpe.category_id
+    WHERE c.entity_key = :entity_key AND cpe.depth > 0
+""")
+
+# Canonical subobjects of a category
+_SUBOBJECT_KEYS_QUERY = text("""
+    SELECT s.entity_key
+    FROM category_subobject cs
+    JOIN subobjects s ON s.id = cs.subobject_id
+    JOIN categories c ON c.id = cs.category_id
+    WHERE c.entity_key = :entity_key
+""")
+
 
 async def compute_module_derived_entities(
     session: AsyncSession,
@@ -247,9 +276,9 @@ async def _get_category_resources(
     # Uses Python filtering for SQLite compatibility in tests.
     query = select(Resource.entity_key, Resource.category_keys)
     result = await session.execute(query)
-    for row in result.all():
-        if category_key in (row[1] or []):
-            resources.add(row[0])
+    for entity_key, category_keys in result.all():
+        if category_key in (category_keys or []):
+            resources.add(entity_key)
 
     # Include draft-created resources for this category
     for key, change in draft_changes.items():
@@ -329,16 +358,10 @@ async def _get_category_members(
         subobjects.update(effective.get("optional_subobjects", []))
 
         # Also add inherited properties from canonical (depth > 0)
-        inherited_query = text("""
-            SELECT p.entity_key
-            FROM category_property_effective cpe
-            JOIN properties p ON p.id = cpe.property_id
-            JOIN categories c ON c.id = cpe.category_id
-            WHERE c.entity_key = :entity_key AND cpe.depth > 0
-        """)
-        inherited_result = await session.execute(inherited_query, {"entity_key": category_key})
-        for row in inherited_result.fetchall():
-            properties.add(row[0])
+        inherited_result = await session.execute(
+            _INHERITED_PROPERTY_KEYS_QUERY, {"entity_key": category_key}
+        )
+        properties.update(inherited_result.scalars())
 
         # Draft-aware parent inheritance
         effective_parents = effective.get("parents", [])
@@ -352,28 +375,12 @@ async def _get_category_members(
         effective = category.canonical_json
 
         # No draft changes — use canonical materialized view
-        props_query = text("""
-            SELECT p.entity_key
-            FROM category_property_effective cpe
-            JOIN properties p ON p.id = cpe.property_id
-            JOIN categories c ON c.id = cpe.category_id
-            WHERE c.entity_key = :entity_key
-        """)
-        props_result = await session.execute(props_query, {"entity_key": category_key})
-        for row in props_result.fetchall():
-            properties.add(row[0])
+        props_result = await session.execute(_PROPERTY_KEYS_QUERY, {"entity_key": category_key})
+        properties.update(props_result.scalars())
 
         # Canonical subobjects
-        subs_query = text("""
-            SELECT s.entity_key
-            FROM category_subobject cs
-            JOIN subobjects s ON s.id = cs.subobject_id
-            JOIN categories c ON c.id = cs.category_id
-            WHERE c.entity_key = :entity_key
-        """)
-        subs_result = await session.execute(subs_query, {"entity_key": category_key})
-        for row in subs_result.fetchall():
-            subobjects.add(row[0])
+        subs_result = await session.execute(_SUBOBJECT_KEYS_QUERY, {"entity_key": category_key})
+        subobjects.update(subs_result.scalars())
 
         subobjects.update(effective.get("required_subobjects", []))
         subobjects.update(effective.get("optional_subobjects", []))
@@ -19,6 +19,15 @@ from app.models.v2 import (
 )
 from app.services.resource_validation import get_entity_categories
 
+# Module JSON keys listing member entities, with the entity type recorded for each
+_MODULE_MEMBER_KEYS = (
+    ("categories", EntityType.CATEGORY),
+    ("properties", EntityType.PROPERTY),
+    ("subobjects", EntityType.SUBOBJECT),
+    ("templates", EntityType.TEMPLATE),
+    ("resources", EntityType.RESOURCE),
+)
+
 
 @dataclass
 class PendingRelationship:
@@ -260,49 +269,17 @@ class EntityParser:
 
         relationships: list[PendingRelationship] = []
 
-        # Extract category memberships
-        for cat_key in content.get("categories", []):
-            relationships.append(
-                PendingRelationship(
-                    type="module_entity",
-                    source_key=entity_key,
-                    target_key=cat_key,
-                    extra={"entity_type": EntityType.CATEGORY},
-                )
-            )
-
-        # Extract property memberships
-        for prop_key in content.get("properties", []):
-            relationships.append(
-                PendingRelationship(
-                    type="module_entity",
-                    source_key=entity_key,
-                    target_key=prop_key,
-                    extra={"entity_type": EntityType.PROPERTY},
-                )
-            )
-
-        # Extract subobject memberships
-        for sub_key in content.get("subobjects", []):
-            relationships.append(
-                PendingRelationship(
-                    type="module_entity",
-                    source_key=entity_key,
-                    target_key=sub_key,
-                    extra={"entity_type": EntityType.SUBOBJECT},
-                )
-            )
-
-        # Extract template memberships
-        for tmpl_key in content.get("templates", []):
-            relationships.append(
-                PendingRelationship(
-                    type="module_entity",
-                    source_key=entity_key,
-                    target_key=tmpl_key,
-                    extra={"entity_type": EntityType.TEMPLATE},
+        # Extract entity memberships, one module_entity row per listed key
+        for content_key, entity_type in _MODULE_MEMBER_KEYS:
+            for member_key in content.get(content_key, []):
+                relationships.append(
+                    PendingRelationship(
+                        type="module_entity",
+                        source_key=entity_key,
+                        target_key=member_key,
+                        extra={"entity_type": entity_type},
+                    )
                 )
-            )
 
         # Extract dashboard memberships
         for dash_key in content.get("dashboards", []):
@@ -314,17 +291,6 @@ class EntityParser:
                 )
             )
 
-        # Extract resource memberships
-        for res_key in content.get("resources", []):
-            relationships.append(
-                PendingRelationship(
-                    type="module_entity",
-                    source_key=entity_key,
-                    target_key=res_key,
-                    extra={"entity_type": EntityType.RESOURCE},
-                )
-            )
-
         return module, relationships
 
     def parse_bundle(
@@ -5,14 +5,17 @@ structured PR bodies with categorized changes and semver suggestions.
 """
 
 import json
+from collections import defaultdict
+from collections.abc import Collection
 from copy import deepcopy
 from datetime import datetime
 from uuid import UUID
 
 import jsonpatch
-from sqlmodel import col, select
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.database import in_array
 from app.models.v2 import (
     Bundle,
     Category,
@@ -68,23 +71,26 @@ ENTITY_EXTENSIONS = {
 }
 
 
-async def get_canonical_json(
+async def get_canonical_jsons(
     session: AsyncSession,
     entity_type: str,
-    entity_key: str,
-) -> dict | None:
-    """Get canonical JSON for an entity."""
+    entity_keys: Collection[str],
+) -> dict[str, dict]:
+    """Get canonical JSON for several entities of one type, keyed by entity_key.
+
+    Entities missing from canonical are left out.
+    """
     model = ENTITY_MODELS.get(entity_type)
-    if not model:
-        return None
+    if not model or not entity_keys:
+        return {}
 
-    # All entity models have entity_key
-    result = await session.execute(select(model).where(col(model.entity_key) == entity_key))  # type: ignore[attr-defined]
-    entity = result.scalar_one_or_none()
-    if entity and hasattr(entity, "canonical_json"):
-        canonical: dict = entity.canonical_json
-        return canonical
-    return None
+    # All entity models have entity_key and canonical_json
+    result = await session.execute(
+        select(model.entity_key, model.canonical_json).where(  # type: ignore[attr-defined]
+            in_array(model.entity_key, list(entity_keys))  # type: ignore[attr-defined]
+        )
+    )
+    return dict(result.tuples().all())
 
 
 def _clean_entity_json(entity_json: dict) -> dict:
@@ -149,6 +155,7 @@ def _append_dashboard_subpages(
 async def build_files_from_draft_v2(
     draft_id: UUID,
     session: AsyncSession,
+    changes: list[DraftChange] | None = None,
 ) -> list[dict[str, str | bool]]:
     """Build list of files from v2 draft changes for PR creation.
 
@@ -160,14 +167,26 @@ async def build_files_from_draft_v2(
     Args:
         draft_id: UUID of the draft
         session: Database session
+        changes: The draft's changes, if the caller has already loaded them
 
     Returns:
         List of dicts with "path" and "content" keys (or "delete": True for deletions)
     """
-    # Load all draft changes
-    query = select(DraftChange).where(DraftChange.draft_id == draft_id)
-    result = await session.execute(query)
-    changes = list(result.scalars().all())
+    # Load all draft changes, unless the caller already has them
+    if changes is None:
+        query = select(DraftChange).where(DraftChange.draft_id == draft_id)
+        result = await session.execute(query)
+        changes = list(result.scalars().all())
+
+    # Load the canonical JSON every UPDATE patches, one query per entity type
+    update_keys: defaultdict[str, list[str]] = defaultdict(list)
+    for change in changes:
+        if change.change_type == ChangeType.UPDATE:
+            update_keys[change.entity_type].append(change.entity_key)
+    canonicals = {
+        entity_type: await get_canonical_jsons(session, entity_type, keys)
+        for entity_type, keys in update_keys.items()
+    }
 
     files: list[dict[str, str | bool]] = []
 
@@ -188,7 +207,7 @@ async def build_files_from_draft_v2(
                 )
 
         elif change.change_type == ChangeType.UPDATE:
-            canonical = await get_canonical_json(session, change.entity_type, change.entity_key)
+            canonical = canonicals[change.entity_type].get(change.entity_key)
             if canonical and change.patch:
                 try:
                     patch = jsonpatch.JsonPatch(change.patch)
@@ -34,6 +34,15 @@ RESERVED_KEYS_WITH_INTERNAL = RESERVED_KEYS | frozenset(
     {"_change_status", "_deleted", "_patch_error"}
 )
 
+# Effective properties of a category from the materialized view
+_CATEGORY_PROPERTY_KEYS_QUERY = text("""
+    SELECT p.entity_key
+    FROM category_property_effective cpe
+    JOIN properties p ON p.id = cpe.property_id
+    JOIN categories c ON c.id = cpe.category_id
+    WHERE c.entity_key = :category_key
+""")
+
 
 def get_entity_categories(data: dict) -> list[str]:
     """Extract categories from an entity dict, handling legacy "category" fallback.
@@ -91,16 +100,8 @@ async def get_category_effective_properties(
 
     # 2. Query canonical via materialized view
     # Join with properties table to get entity_key (property name)
-    query = text("""
-        SELECT p.entity_key
-        FROM category_property_effective cpe
-        JOIN properties p ON p.id = cpe.property_id
-        JOIN categories c ON c.id = cpe.category_id
-        WHERE c.entity_key = :category_key
-    """)
-    result = await session.execute(query, {"category_key": category_key})
-    for row in result.fetchall():
-        properties.add(row[0])
+    result = await session.execute(_CATEGORY_PROPERTY_KEYS_QUERY, {"category_key": category_key})
+    properties.update(result.scalars())
 
     # 3. If draft modifies the category (UPDATE), we'd need to apply patches
     # For now, we use the canonical + inherited properties from the view
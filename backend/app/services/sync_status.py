@@ -82,16 +82,13 @@ async def run_sync_with_lock() -> bool:
     async with _sync_lock, async_session_maker() as session:
         try:
             # Get previous commit SHA for draft rebase
-            prev_version = (
-                (
-                    await session.execute(
-                        select(OntologyVersion).order_by(col(OntologyVersion.created_at).desc())
-                    )
+            old_commit_sha = (
+                await session.execute(
+                    select(col(OntologyVersion.commit_sha))
+                    .order_by(col(OntologyVersion.created_at).desc())
+                    .limit(1)
                 )
-                .scalars()
-                .first()
-            )
-            old_commit_sha = prev_version.commit_sha if prev_version else None
+            ).scalar_one_or_none()
 
             # Run sync
             result = await sync_repository_v2(
@@ -42,27 +42,27 @@ async def check_references_v2(
     # Query canonical entity_keys
     category_query = select(Category.entity_key)
     category_result = await session.execute(category_query)
-    canonical_categories = {row[0] for row in category_result.all()}
+    canonical_categories = set(category_result.scalars())
 
     property_query = select(Property.entity_key)
     property_result = await session.execute(property_query)
-    canonical_properties = {row[0] for row in property_result.all()}
+    canonical_properties = set(property_result.scalars())
 
     subobject_query = select(Subobject.entity_key)
     subobject_result = await session.execute(subobject_query)
-    canonical_subobjects = {row[0] for row in subobject_result.all()}
+    canonical_subobjects = set(subobject_result.scalars())
 
     module_query = select(Module.entity_key)
     module_result = await session.execute(module_query)
-    canonical_modules = {row[0] for row in module_result.all()}
+    canonical_modules = set(module_result.scalars())
 
     bundle_query = select(Bundle.entity_key)
     bundle_result = await session.execute(bundle_query)
-    canonical_bundles = {row[0] for row in bundle_result.all()}
+    canonical_bundles = set(bundle_result.scalars())
 
     template_query = select(Template.entity_key)
     template_result = await session.execute(template_query)
-    canonical_templates = {row[0] for row in template_result.all()}
+    canonical_templates = set(template_result.scalars())
 
     # Build sets of effective entity_keys (includes draft changes)
     effective_categories = set(effective_entities.get("category", {}).keys())
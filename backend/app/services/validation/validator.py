@@ -30,6 +30,7 @@ from app.services.validation.schema_v2 import check_schema_v2
 async def validate_draft_v2(
     draft_id: UUID,
     session: AsyncSession,
+    draft_changes: list[DraftChange] | None = None,
 ) -> DraftValidationReportV2:
     """Validate v2 draft by reconstructing effective entities from DraftChanges.
 
@@ -43,14 +44,16 @@ async def validate_draft_v2(
     Args:
         draft_id: UUID of draft to validate
         session: Async database session
+        draft_changes: The draft's changes, if the caller has already loaded them
 
     Returns:
         DraftValidationReportV2 with all findings
     """
     # 1. Load draft changes and build effective entities
-    draft_changes_query = select(DraftChange).where(DraftChange.draft_id == draft_id)
-    result = await session.execute(draft_changes_query)
-    draft_changes = list(result.scalars().all())
+    if draft_changes is None:
+        draft_changes_query = select(DraftChange).where(DraftChange.draft_id == draft_id)
+        result = await session.execute(draft_changes_query)
+        draft_changes = list(result.scalars().all())
 
     effective_entities = await build_effective_entities(draft_changes, session)
 
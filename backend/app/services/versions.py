@@ -4,11 +4,21 @@ Provides functionality to fetch entity snapshots at specific git refs
 and compute field-level diffs between versions.
 """
 
+import re
+from collections import OrderedDict
 from typing import Any
 
 from app.config import settings
 from app.services.github import ENTITY_DIRECTORIES, GitHubClient
 
+# Max cached snapshots. Each holds every entity file of one version
+_MAX_SNAPSHOTS = 8
+
+# A full commit SHA names an immutable tree, unlike branch or tag names
+_COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+_snapshots: OrderedDict[tuple[str, str], dict[str, dict[str, Any]]] = OrderedDict()
+
 
 async def get_entities_at_version(
     github_client: GitHubClient,
@@ -16,15 +26,26 @@ async def get_entities_at_version(
 ) -> dict[str, dict[str, Any]]:
     """Fetch all entities at a specific git ref.
 
+    Snapshots fetched by full commit SHA are kept in an LRU, since the tree
+    behind a commit never changes. Branch and tag refs can move and are
+    always fetched.
+
     Args:
         github_client: GitHub API client
         ref: Git ref (tag, branch, or commit SHA)
 
     Returns:
-        Dict mapping "type/entity_id" to entity data
+        Dict mapping "type/entity_id" to entity data. Cached snapshots are
+        shared between callers and must not be mutated.
     """
     owner, repo = settings.github_repo.split("/")
 
+    cache_key = (settings.github_repo, ref)
+    cacheable = _COMMIT_SHA_RE.fullmatch(ref) is not None
+    if cacheable and (cached := _snapshots.get(cache_key)) is not None:
+        _snapshots.move_to_end(cache_key)
+        return cached
+
     # Get tree at this ref
     tree = await github_client.get_repository_tree(owner, repo, sha=ref)
 
@@ -44,6 +65,10 @@ async def get_entities_at_version(
         content = await github_client.get_file_at_ref(owner, repo, path, ref)
         entities[f"{entity_type}/{entity_id}"] = content
 
+    if cacheable:
+        _snapshots[cache_key] = entities
+        if len(_snapshots) > _MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
     return entities
 
 
@@ -63,17 +88,21 @@ def compute_entity_diff(
         - modified: [{"key": "...", "entity_type": "...", "entity_id": "...", "old": {...}, "new": {...}}]
         - deleted: [{"key": "...", "entity_type": "...", "entity_id": "...", "old": {...}}]
     """
-    all_keys = set(old_entities.keys()) | set(new_entities.keys())
+    all_keys = old_entities.keys() | new_entities.keys()
 
     added: list[dict[str, Any]] = []
     modified: list[dict[str, Any]] = []
     deleted: list[dict[str, Any]] = []
 
     for key in all_keys:
-        entity_type, entity_id = key.split("/", 1)
         old = old_entities.get(key)
         new = new_entities.get(key)
+        # Most entities are unchanged between versions; skip them before
+        # doing any per-change work
+        if old == new:
+            continue
 
+        entity_type, entity_id = key.split("/", 1)
         if old is None and new is not None:
             added.append(
                 {
@@ -92,7 +121,7 @@ def compute_entity_diff(
                     "old": old,
                 }
             )
-        elif old != new:
+        else:
             modified.append(
                 {
                     "key": key,
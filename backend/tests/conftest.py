@@ -44,6 +44,11 @@ async def test_engine():
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+
+    # Each test gets a fresh database, so drop rows cached by earlier tests
+    from app.services.canonical_cache import invalidate_canonical_cache
+
+    invalidate_canonical_cache()
     yield engine
     await engine.dispose()
 
@@ -0,0 +1,125 @@
+"""Tests for the in-process canonical row cache.
+
+Tests verify:
+- Repeat lookups are served without querying the database
+- invalidate_canonical_cache() forces a fresh read
+- Missing entities are not cached
+- Derived lookups are memoized per key until invalidated
+- An ingest completed by another process drops the cache on the next request
+"""
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.v2 import Category, IngestStatus, OntologyVersion
+from app.services.canonical_cache import (
+    get_canonical_commit_sha,
+    get_canonical_derived,
+    get_canonical_row,
+    invalidate_canonical_cache,
+)
+
+
+async def _add_category(session: AsyncSession, entity_key: str, label: str) -> Category:
+    category = Category(
+        entity_key=entity_key,
+        source_path=f"categories/{entity_key}.json",
+        label=label,
+        canonical_json={"id": entity_key, "label": label},
+    )
+    session.add(category)
+    await session.commit()
+    return category
+
+
+class TestGetCanonicalRow:
+    """Tests for get_canonical_row."""
+
+    async def test_returns_snapshot(self, test_session: AsyncSession):
+        """A canonical row is returned as a snapshot of its columns."""
+        category = await _add_category(test_session, "Person", "Person")
+
+        row = await get_canonical_row(test_session, Category, "Person")
+
+        assert row is not None
+        assert row.id == category.id
+        assert row.entity_key == "Person"
+        assert row.label == "Person"
+        assert row.canonical_json == {"id": "Person", "label": "Person"}
+
+    async def test_repeat_lookup_served_from_cache(self, test_session: AsyncSession):
+        """A second lookup does not see database changes until invalidated."""
+        category = await _add_category(test_session, "Person", "Person")
+        await get_canonical_row(test_session, Category, "Person")
+
+        category.label = "Human"
+        test_session.add(category)
+        await test_session.commit()
+
+        cached = await get_canonical_row(test_session, Category, "Person")
+        assert cached is not None
+        assert cached.label == "Person"
+
+        invalidate_canonical_cache()
+
+        fresh = await get_canonical_row(test_session, Category, "Person")
+        assert fresh is not None
+        assert fresh.label == "Human"
+
+    async def test_miss_is_not_cached(self, test_session: AsyncSession):
+        """An entity created after a miss is found on the next lookup."""
+        assert await get_canonical_row(test_session, Category, "Person") is None
+
+        await _add_category(test_session, "Person", "Person")
+
+        assert await get_canonical_row(test_session, Category, "Person") is not None
+
+
+class TestGetCanonicalDerived:
+    """Tests for get_canonical_derived."""
+
+    async def test_memoized_until_invalidated(self, test_session: AsyncSession):
+        """The loader runs once per key, and again after invalidation."""
+        calls: list[str] = []
+
+        async def load(key: str) -> str:
+            calls.append(key)
+            return key.upper()
+
+        assert await get_canonical_derived(test_session, ("test", "a"), lambda: load("a")) == "A"
+        assert await get_canonical_derived(test_session, ("test", "a"), lambda: load("a")) == "A"
+        assert await get_canonical_derived(test_session, ("test", "b"), lambda: load("b")) == "B"
+        assert calls == ["a", "b"]
+
+        invalidate_canonical_cache()
+
+        assert await get_canonical_derived(test_session, ("test", "a"), lambda: load("a")) == "A"
+        assert calls == ["a", "b", "a"]
+
+
+class TestVersionCheck:
+    """Tests for detecting ingests completed outside this process."""
+
+    async def test_new_version_drops_cache(self, test_engine, test_session: AsyncSession):
+        """A newly completed version invalidates the cache for later sessions."""
+        category = await _add_category(test_session, "Person", "Person")
+        await get_canonical_row(test_session, Category, "Person")
+
+        # Another process rewrites the row and records its completed ingest,
+        # without calling invalidate_canonical_cache() here
+        category.label = "Human"
+        test_session.add(category)
+        test_session.add(OntologyVersion(commit_sha="def456", ingest_status=IngestStatus.COMPLETED))
+        await test_session.commit()
+
+        # The session that already checked keeps its view
+        cached = await get_canonical_row(test_session, Category, "Person")
+        assert cached is not None
+        assert cached.label == "Person"
+
+        session_maker = async_sessionmaker(test_engine, class_=AsyncSession)
+        async with session_maker() as next_request:
+            fresh = await get_canonical_row(next_request, Category, "Person")
+            assert fresh is not None
+            assert fresh.label == "Human"
+            assert await get_canonical_commit_sha(next_request) == "def456"
@@ -0,0 +1,393 @@
+"""Tests for the v2 entity detail endpoints.
+
+Tests verify:
+- Draft-created entities are served from the draft's replacement JSON
+- Draft property lists resolve labels from canonical properties
+- Draft-patched property values are validated
+- Detail responses carry an ETag and answer If-None-Match with 304
+- Unknown entities return 404 even with a matching If-None-Match
+- Module parent categories come from the category_ancestor closure
+- Draft-patched module category lists are validated
+- Bundle modules fall back to canonical rows when a draft leaves them alone
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.dependencies.capability import generate_capability_token, hash_token
+from app.models.v2 import (
+    Bundle,
+    BundleModule,
+    Category,
+    CategoryAncestor,
+    ChangeType,
+    Draft,
+    DraftChange,
+    DraftSource,
+    DraftStatus,
+    IngestStatus,
+    Module,
+    ModuleEntity,
+    OntologyVersion,
+    Property,
+)
+
+
+@pytest_asyncio.fixture
+async def subobject_draft(test_session: AsyncSession) -> Draft:
+    """Create a draft that creates subobject Address using canonical Has_street."""
+    test_session.add(
+        Property(
+            entity_key="Has_street",
+            source_path="properties/Has_street.json",
+            label="Has street",
+            canonical_json={"id": "Has_street", "label": "Has street"},
+        )
+    )
+    draft = Draft(
+        capability_hash=hash_token(generate_capability_token()),
+        base_commit_sha="abc123",
+        status=DraftStatus.DRAFT,
+        source=DraftSource.HUB_UI,
+        expires_at=datetime.utcnow() + timedelta(days=7),
+    )
+    test_session.add(draft)
+    await test_session.flush()
+
+    test_session.add(
+        DraftChange(
+            draft_id=draft.id,
+            change_type=ChangeType.CREATE,
+            entity_type="subobject",
+            entity_key="Address",
+            replacement_json={
+                "id": "Address",
+                "label": "Address",
+                "required_properties": ["Has_street"],
+                "optional_properties": ["Has_postcode"],
+            },
+        )
+    )
+    await test_session.commit()
+    return draft
+
+
+class TestGetSubobject:
+    """Tests for GET /api/v2/subobjects/{entity_key}."""
+
+    async def test_draft_created_subobject(self, client: AsyncClient, subobject_draft: Draft):
+        """Draft property lists are returned with canonical labels where known."""
+        response = await client.get(
+            "/api/v2/subobjects/Address", params={"draft_id": str(subobject_draft.id)}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["change_status"] == "added"
+        assert data["required_properties"] == [
+            {"entity_key": "Has_street", "label": "Has street", "is_required": True}
+        ]
+        assert data["optional_properties"] == [
+            {"entity_key": "Has_postcode", "label": "Has_postcode", "is_required": False}
+        ]
+
+    async def test_unknown_subobject_returns_404(self, client: AsyncClient):
+        """A subobject that is neither canonical nor draft-created is not found."""
+        response = await client.get("/api/v2/subobjects/Missing")
+        assert response.status_code == 404
+
+
+class TestGetProperty:
+    """Tests for GET /api/v2/properties/{entity_key}."""
+
+    async def test_malformed_draft_patch_is_rejected(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        subobject_draft: Draft,
+    ):
+        """Draft-patched values are validated instead of being returned as-is."""
+        test_session.add(
+            DraftChange(
+                draft_id=subobject_draft.id,
+                change_type=ChangeType.UPDATE,
+                entity_type="property",
+                entity_key="Has_street",
+                patch=[{"op": "add", "path": "/display_precision", "value": "two"}],
+            )
+        )
+        await test_session.commit()
+
+        with pytest.raises(ValidationError):
+            await client.get(
+                "/api/v2/properties/Has_street", params={"draft_id": str(subobject_draft.id)}
+            )
+
+
+class TestDetailETag:
+    """Tests for conditional GET on detail endpoints."""
+
+    async def test_not_modified_until_draft_changes(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        subobject_draft: Draft,
+    ):
+        """A matching If-None-Match returns 304 until the draft is edited."""
+        test_session.add(OntologyVersion(commit_sha="abc123", ingest_status=IngestStatus.COMPLETED))
+        await test_session.commit()
+
+        canonical = await client.get("/api/v2/properties/Has_street")
+        assert canonical.status_code == 200
+        etag = canonical.headers["etag"]
+        assert etag.startswith('W/"abc123-')
+
+        params = {"draft_id": str(subobject_draft.id)}
+        first = await client.get("/api/v2/subobjects/Address", params=params)
+        assert first.status_code == 200
+        assert first.headers["etag"] != etag
+
+        cached = await client.get(
+            "/api/v2/subobjects/Address",
+            params=params,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        subobject_draft.modified_at = datetime.utcnow() + timedelta(seconds=1)
+        test_session.add(subobject_draft)
+        await test_session.commit()
+
+        edited = await client.get(
+            "/api/v2/subobjects/Address",
+            params=params,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert edited.status_code == 200
+
+    async def test_unknown_entity_is_not_modified_404(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        subobject_draft: Draft,  # noqa: ARG002
+    ):
+        """A matching If-None-Match does not turn a missing entity into a 304."""
+        test_session.add(OntologyVersion(commit_sha="abc123", ingest_status=IngestStatus.COMPLETED))
+        await test_session.commit()
+
+        etag = (await client.get("/api/v2/properties/Has_street")).headers["etag"]
+
+        response = await client.get("/api/v2/properties/Missing", headers={"If-None-Match": etag})
+        assert response.status_code == 404
+
+    async def test_no_etag_before_ingest(
+        self,
+        client: AsyncClient,
+        subobject_draft: Draft,  # noqa: ARG002
+    ):
+        """Without a completed ingest there is no version to tag responses with."""
+        response = await client.get("/api/v2/properties/Has_street")
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+
+@pytest_asyncio.fixture
+async def category_hierarchy(test_session: AsyncSession) -> Module:
+    """Create Student -> Person -> Agent and module People containing Student."""
+    categories = {
+        key: Category(
+            entity_key=key,
+            source_path=f"categories/{key}.wikitext",
+            label=key,
+            canonical_json={"id": key, "label": key},
+        )
+        for key in ("Student", "Person", "Agent")
+    }
+    module = Module(
+        entity_key="People",
+        source_path="modules/People.json",
+        label="People",
+        canonical_json={"id": "People", "label": "People", "categories": ["Student"]},
+    )
+    test_session.add_all([*categories.values(), module])
+    await test_session.flush()
+
+    test_session.add_all(
+        [
+            CategoryAncestor(
+                category_id=categories["Student"].id,
+                ancestor_id=categories["Person"].id,
+                depth=1,
+            ),
+            CategoryAncestor(
+                category_id=categories["Student"].id,
+                ancestor_id=categories["Agent"].id,
+                depth=2,
+            ),
+            CategoryAncestor(
+                category_id=categories["Person"].id,
+                ancestor_id=categories["Agent"].id,
+                depth=1,
+            ),
+            ModuleEntity(module_id=module.id, entity_type="category", entity_key="Student"),
+        ]
+    )
+    await test_session.commit()
+    return module
+
+
+class TestGetModule:
+    """Tests for GET /api/v2/modules/{entity_key}."""
+
+    async def test_module_parent_categories(
+        self,
+        client: AsyncClient,
+        category_hierarchy: Module,  # noqa: ARG002
+    ):
+        """All ancestors of a module's categories are listed as parents."""
+        response = await client.get("/api/v2/modules/People")
+        assert response.status_code == 200
+        assert response.json()["parent_categories"] == ["Agent", "Person"]
+
+    async def test_parent_category_membership(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_hierarchy: Module,  # noqa: ARG002
+    ):
+        """Parent categories report the modules they already belong to."""
+        agents = Module(
+            entity_key="Agents",
+            source_path="modules/Agents.json",
+            label="Agents",
+            canonical_json={"id": "Agents", "label": "Agents", "categories": ["Agent"]},
+        )
+        test_session.add(agents)
+        await test_session.flush()
+        test_session.add(
+            ModuleEntity(module_id=agents.id, entity_type="category", entity_key="Agent")
+        )
+        await test_session.commit()
+
+        response = await client.get("/api/v2/modules/People")
+        assert response.status_code == 200
+        assert response.json()["parent_category_membership"] == {"Agent": ["Agents"]}
+
+    async def test_draft_modified_categories(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_hierarchy: Module,  # noqa: ARG002
+    ):
+        """Parents follow the draft's category list, not the canonical one."""
+        draft = Draft(
+            capability_hash=hash_token(generate_capability_token()),
+            base_commit_sha="abc123",
+            status=DraftStatus.DRAFT,
+            source=DraftSource.HUB_UI,
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+        test_session.add(draft)
+        await test_session.flush()
+        test_session.add(
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ChangeType.UPDATE,
+                entity_type="module",
+                entity_key="People",
+                patch=[{"op": "replace", "path": "/categories", "value": ["Person"]}],
+            )
+        )
+        await test_session.commit()
+
+        canonical = await client.get("/api/v2/modules/People")
+        assert canonical.json()["parent_categories"] == ["Agent", "Person"]
+
+        drafted = await client.get("/api/v2/modules/People", params={"draft_id": str(draft.id)})
+        assert drafted.status_code == 200
+        assert drafted.json()["categories"] == ["Person"]
+        assert drafted.json()["parent_categories"] == ["Agent"]
+
+    async def test_draft_categories_are_validated(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_hierarchy: Module,  # noqa: ARG002
+    ):
+        """A draft category list that is not a list of keys is rejected."""
+        draft = Draft(
+            capability_hash=hash_token(generate_capability_token()),
+            base_commit_sha="abc123",
+            status=DraftStatus.DRAFT,
+            source=DraftSource.HUB_UI,
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+        test_session.add(draft)
+        await test_session.flush()
+        test_session.add(
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ChangeType.UPDATE,
+                entity_type="module",
+                entity_key="People",
+                patch=[{"op": "replace", "path": "/categories", "value": [{"id": "Person"}]}],
+            )
+        )
+        await test_session.commit()
+
+        with pytest.raises(ValidationError):
+            await client.get("/api/v2/modules/People", params={"draft_id": str(draft.id)})
+
+
+class TestGetBundle:
+    """Tests for GET /api/v2/bundles/{entity_key}."""
+
+    async def test_draft_label_change_keeps_canonical_modules(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_hierarchy: Module,
+    ):
+        """A draft that only relabels the bundle still lists its canonical modules."""
+        bundle = Bundle(
+            entity_key="Lab",
+            source_path="bundles/Lab.json",
+            label="Lab",
+            canonical_json={"id": "Lab", "label": "Lab", "modules": ["People"]},
+        )
+        draft = Draft(
+            capability_hash=hash_token(generate_capability_token()),
+            base_commit_sha="abc123",
+            status=DraftStatus.DRAFT,
+            source=DraftSource.HUB_UI,
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+        test_session.add_all([bundle, draft])
+        await test_session.flush()
+        test_session.add_all(
+            [
+                BundleModule(bundle_id=bundle.id, module_id=category_hierarchy.id),
+                DraftChange(
+                    draft_id=draft.id,
+                    change_type=ChangeType.UPDATE,
+                    entity_type="bundle",
+                    entity_key="Lab",
+                    patch=[{"op": "replace", "path": "/label", "value": "Research lab"}],
+                ),
+            ]
+        )
+        await test_session.commit()
+
+        response = await client.get("/api/v2/bundles/Lab", params={"draft_id": str(draft.id)})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["label"] == "Research lab"
+        assert data["change_status"] == "modified"
+        assert data["modules"] == ["People"]
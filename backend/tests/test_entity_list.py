@@ -0,0 +1,263 @@
+"""Tests for the v2 entity list endpoints.
+
+Tests verify:
+- Canonical rows are returned as list items with unchanged status
+- Row columns back-fill entity_key/label missing from canonical_json
+- Draft overlay marks modified/deleted rows and merges draft creates
+- Pages merged with draft creates keep a cursor that skips nothing
+- Draft creates and patched rows are validated against the list item schema
+- Property used-by results are cursor-paginated
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.dependencies.capability import generate_capability_token, hash_token
+from app.models.v2 import (
+    Category,
+    CategoryProperty,
+    ChangeType,
+    Draft,
+    DraftChange,
+    DraftSource,
+    DraftStatus,
+    Property,
+)
+
+
+@pytest_asyncio.fixture
+async def seeded_categories(test_session: AsyncSession) -> list[Category]:
+    """Create three canonical categories: Alpha, Gamma, Epsilon."""
+    categories = [
+        Category(
+            entity_key="Alpha",
+            source_path="categories/Alpha.json",
+            label="Alpha",
+            canonical_json={"id": "Alpha", "label": "Alpha", "parents": []},
+        ),
+        # No label/id in canonical_json: row columns must back-fill them
+        Category(
+            entity_key="Gamma",
+            source_path="categories/Gamma.json",
+            label="Gamma label",
+            canonical_json={"parents": ["Alpha"]},
+        ),
+        Category(
+            entity_key="Epsilon",
+            source_path="categories/Epsilon.json",
+            label="Epsilon",
+            canonical_json={"id": "Epsilon", "label": "Epsilon", "parents": ["Alpha"]},
+        ),
+    ]
+    test_session.add_all(categories)
+    await test_session.commit()
+    return categories
+
+
+@pytest_asyncio.fixture
+async def category_draft(
+    test_session: AsyncSession,
+    seeded_categories: list[Category],
+) -> Draft:
+    """Create a draft that modifies Alpha, deletes Epsilon and creates Beta."""
+    draft = Draft(
+        capability_hash=hash_token(generate_capability_token()),
+        base_commit_sha="abc123",
+        status=DraftStatus.DRAFT,
+        source=DraftSource.HUB_UI,
+        expires_at=datetime.utcnow() + timedelta(days=7),
+    )
+    test_session.add(draft)
+    await test_session.flush()
+
+    test_session.add_all(
+        [
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ChangeType.UPDATE,
+                entity_type="category",
+                entity_key="Alpha",
+                patch=[{"op": "add", "path": "/label", "value": "Alpha (edited)"}],
+            ),
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ChangeType.DELETE,
+                entity_type="category",
+                entity_key="Epsilon",
+            ),
+            DraftChange(
+                draft_id=draft.id,
+                change_type=ChangeType.CREATE,
+                entity_type="category",
+                entity_key="Beta",
+                replacement_json={"id": "Beta", "label": "Beta", "parents": []},
+            ),
+        ]
+    )
+    await test_session.commit()
+    return draft
+
+
+class TestListCategories:
+    """Tests for GET /api/v2/categories."""
+
+    async def test_canonical_items(
+        self,
+        client: AsyncClient,
+        seeded_categories: list[Category],  # noqa: ARG002
+    ):
+        """Canonical list returns every row with unchanged status."""
+        response = await client.get("/api/v2/categories")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [item["entity_key"] for item in data["items"]] == ["Alpha", "Epsilon", "Gamma"]
+        assert all(item["change_status"] == "unchanged" for item in data["items"])
+        assert data["has_next"] is False
+        assert data["next_cursor"] is None
+
+    async def test_row_columns_backfill_missing_json_fields(
+        self,
+        client: AsyncClient,
+        seeded_categories: list[Category],  # noqa: ARG002
+    ):
+        """entity_key and label come from the row when canonical_json omits them."""
+        response = await client.get("/api/v2/categories", params={"search": "Gamma"})
+        assert response.status_code == 200
+
+        items = response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["entity_key"] == "Gamma"
+        assert items[0]["label"] == "Gamma label"
+        assert items[0]["parents"] == ["Alpha"]
+
+    async def test_draft_overlay(self, client: AsyncClient, category_draft: Draft):
+        """Draft context marks modified/deleted rows and merges creates in order."""
+        response = await client.get(
+            "/api/v2/categories", params={"draft_id": str(category_draft.id)}
+        )
+        assert response.status_code == 200
+
+        items = {item["entity_key"]: item for item in response.json()["items"]}
+        assert list(items) == ["Alpha", "Beta", "Epsilon", "Gamma"]
+        assert items["Alpha"]["change_status"] == "modified"
+        assert items["Alpha"]["label"] == "Alpha (edited)"
+        assert items["Beta"]["change_status"] == "added"
+        assert items["Epsilon"]["change_status"] == "deleted"
+        assert items["Epsilon"]["deleted"] is True
+        assert items["Gamma"]["change_status"] == "unchanged"
+
+    async def test_draft_pages_interleave_creates(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_draft: Draft,
+    ):
+        """Paging with draft creates visits every entity exactly once, in order."""
+        test_session.add(
+            DraftChange(
+                draft_id=category_draft.id,
+                change_type=ChangeType.CREATE,
+                entity_type="category",
+                entity_key="Zeta",
+                replacement_json={"id": "Zeta", "label": "Zeta", "parents": []},
+            )
+        )
+        await test_session.commit()
+
+        pages = []
+        params = {"draft_id": str(category_draft.id), "limit": 2}
+        while True:
+            data = (await client.get("/api/v2/categories", params=params)).json()
+            pages.append([item["entity_key"] for item in data["items"]])
+            if not data["has_next"]:
+                assert data["next_cursor"] is None
+                break
+            params["cursor"] = data["next_cursor"]
+
+        assert pages == [["Alpha", "Beta"], ["Epsilon", "Gamma"], ["Zeta"]]
+
+    async def test_malformed_draft_create_is_rejected(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_draft: Draft,
+    ):
+        """A draft create that does not match the schema is not returned as-is."""
+        test_session.add(
+            DraftChange(
+                draft_id=category_draft.id,
+                change_type=ChangeType.CREATE,
+                entity_type="category",
+                entity_key="Zeta",
+                replacement_json={"id": "Zeta", "label": 123, "parents": "Alpha"},
+            )
+        )
+        await test_session.commit()
+
+        with pytest.raises(ValidationError):
+            await client.get("/api/v2/categories", params={"draft_id": str(category_draft.id)})
+
+    async def test_malformed_draft_patch_is_rejected(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        category_draft: Draft,
+    ):
+        """A draft patch that breaks the schema is not returned as-is."""
+        test_session.add(
+            DraftChange(
+                draft_id=category_draft.id,
+                change_type=ChangeType.UPDATE,
+                entity_type="category",
+                entity_key="Gamma",
+                patch=[{"op": "add", "path": "/parents", "value": {"x": 1}}],
+            )
+        )
+        await test_session.commit()
+
+        with pytest.raises(ValidationError):
+            await client.get("/api/v2/categories", params={"draft_id": str(category_draft.id)})
+
+
+class TestPropertyUsedBy:
+    """Tests for GET /api/v2/properties/{entity_key}/used-by."""
+
+    async def test_paginates_categories(
+        self, client: AsyncClient, test_session: AsyncSession, seeded_categories: list[Category]
+    ):
+        """Used-by results are paged by entity_key with a working cursor."""
+        prop = Property(
+            entity_key="Has_name",
+            source_path="properties/Has_name.json",
+            label="Has name",
+            canonical_json={"id": "Has_name", "label": "Has name"},
+        )
+        test_session.add(prop)
+        await test_session.flush()
+        test_session.add_all(
+            [CategoryProperty(category_id=cat.id, property_id=prop.id) for cat in seeded_categories]
+        )
+        await test_session.commit()
+
+        first = (
+            await client.get("/api/v2/properties/Has_name/used-by", params={"limit": 2})
+        ).json()
+        assert [item["entity_key"] for item in first["items"]] == ["Alpha", "Epsilon"]
+        assert first["has_next"] is True
+        assert first["next_cursor"] == "Epsilon"
+
+        second = (
+            await client.get(
+                "/api/v2/properties/Has_name/used-by",
+                params={"limit": 2, "cursor": first["next_cursor"]},
+            )
+        ).json()
+        assert [item["entity_key"] for item in second["items"]] == ["Gamma"]
+        assert second["has_next"] is False
+        assert second["next_cursor"] is None
@@ -0,0 +1,71 @@
+"""Tests for the v2 graph endpoints.
+
+Tests verify:
+- Resource neighborhoods list the resource's categories in order with
+  their module membership and change status
+"""
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.v2 import Category, Module, ModuleEntity, Resource
+
+
+@pytest_asyncio.fixture
+async def categorized_resource(test_session: AsyncSession) -> Resource:
+    """Create resource John_doe in categories Student and Person (Person in People)."""
+    for key in ("Person", "Student"):
+        test_session.add(
+            Category(
+                entity_key=key,
+                source_path=f"categories/{key}.wikitext",
+                label=key,
+                canonical_json={"id": key, "label": key},
+            )
+        )
+    module = Module(
+        entity_key="People",
+        source_path="modules/People.json",
+        label="People",
+        canonical_json={"id": "People", "label": "People", "categories": ["Person"]},
+    )
+    resource = Resource(
+        entity_key="John_doe",
+        source_path="resources/Person/John_doe.wikitext",
+        label="John Doe",
+        category_keys=["Student", "Missing", "Person"],
+        canonical_json={"id": "John_doe", "label": "John Doe"},
+    )
+    test_session.add_all([module, resource])
+    await test_session.flush()
+    test_session.add(ModuleEntity(module_id=module.id, entity_type="category", entity_key="Person"))
+    await test_session.commit()
+    return resource
+
+
+class TestResourceNeighborhood:
+    """Tests for GET /api/v2/graph/neighborhood with entity_type=resource."""
+
+    async def test_category_nodes(
+        self,
+        client: AsyncClient,
+        categorized_resource: Resource,  # noqa: ARG002
+    ):
+        """Known categories become nodes in resource order; unknown keys are skipped."""
+        response = await client.get(
+            "/api/v2/graph/neighborhood",
+            params={"entity_key": "John_doe", "entity_type": "resource"},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [(node["id"], node["modules"], node["change_status"]) for node in data["nodes"]] == [
+            ("John_doe", [], "unchanged"),
+            ("Student", [], "unchanged"),
+            ("Person", ["People"], "unchanged"),
+        ]
+        assert [(edge["source"], edge["target"]) for edge in data["edges"]] == [
+            ("Student", "John_doe"),
+            ("Person", "John_doe"),
+        ]
@@ -184,6 +184,22 @@ class TestDashboardPRFiles:
         assert files[0]["path"] == "dashboards/Existing_Dashboard.wikitext"
         assert files[0].get("delete") is True
 
+    @pytest.mark.asyncio
+    async def test_preloaded_changes_are_used(self, test_session: AsyncSession, test_draft: Draft):
+        """Changes passed in by the caller are used instead of being reloaded."""
+        change = DraftChange(
+            draft_id=test_draft.id,
+            change_type=ChangeType.DELETE,
+            entity_type="dashboard",
+            entity_key="Preloaded_Dashboard",
+        )
+
+        # Not added to the session, so only the passed-in list can produce it
+        files = await build_files_from_draft_v2(test_draft.id, test_session, [change])
+
+        assert len(files) == 1
+        assert files[0]["path"] == "dashboards/Preloaded_Dashboard.wikitext"
+
 
 # ============================================================================
 # Resource PR File Tests
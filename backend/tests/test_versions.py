@@ -0,0 +1,54 @@
+"""Tests for version snapshot fetching.
+
+Tests verify:
+- Snapshots fetched by full commit SHA are served from memory on repeat
+- Branch and tag refs are fetched every time
+"""
+
+from typing import Any
+
+from app.services import versions
+from app.services.versions import get_entities_at_version
+
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+class _FakeGitHubClient:
+    """Stands in for GitHubClient, counting tree fetches."""
+
+    def __init__(self) -> None:
+        self.tree_calls = 0
+
+    async def get_repository_tree(self, *_args: Any, **_kwargs: Any) -> list[dict[str, Any]]:
+        self.tree_calls += 1
+        return [{"path": "categories/Person.json"}, {"path": "README.md"}]
+
+    async def get_file_at_ref(self, *args: Any) -> dict[str, Any]:
+        # Called as (owner, repo, path, ref)
+        return {"id": "Person", "ref": args[-1]}
+
+
+class TestGetEntitiesAtVersion:
+    """Tests for get_entities_at_version."""
+
+    async def test_commit_sha_snapshot_is_cached(self):
+        """A second fetch of the same commit does not hit GitHub."""
+        versions._snapshots.clear()
+        client = _FakeGitHubClient()
+
+        first = await get_entities_at_version(client, COMMIT_SHA)  # type: ignore[arg-type]
+        second = await get_entities_at_version(client, COMMIT_SHA)  # type: ignore[arg-type]
+
+        assert first == {"categories/Person": {"id": "Person", "ref": COMMIT_SHA}}
+        assert second is first
+        assert client.tree_calls == 1
+
+    async def test_branch_ref_is_not_cached(self):
+        """Movable refs are fetched on every call."""
+        versions._snapshots.clear()
+        client = _FakeGitHubClient()
+
+        await get_entities_at_version(client, "main")  # type: ignore[arg-type]
+        await get_entities_at_version(client, "main")  # type: ignore[arg-type]
+
+        assert client.tree_calls == 2
@@ -52,10 +52,14 @@ async function fetchEntityV2(
 
 async function fetchPropertyUsedBy(
   entityKey: string,
-  draftId?: string
-): Promise<EntityWithStatus[]> {
+  draftId?: string,
+  cursor?: string,
+  limit?: number
+): Promise<EntityListResponseV2> {
   const params = new URLSearchParams()
   if (draftId) params.set('draft_id', draftId)
+  if (cursor) params.set('cursor', cursor)
+  if (limit) params.set('limit', String(limit))
 
   const queryString = params.toString()
   const endpoint = `/properties/${entityKey}/used-by${queryString ? `?${queryString}` : ''}`
@@ -182,10 +186,15 @@ export function useTemplate(entityKey: string, draftId?: string) {
   })
 }
 
-export function usePropertyUsedBy(entityKey: string, draftId?: string) {
+export function usePropertyUsedBy(
+  entityKey: string,
+  draftId?: string,
+  cursor?: string,
+  limit: number = 200
+) {
   return useQuery({
-    queryKey: ['v2', 'property-used-by', entityKey, { draftId }],
-    queryFn: () => fetchPropertyUsedBy(entityKey, draftId),
+    queryKey: ['v2', 'property-used-by', entityKey, { draftId, cursor, limit }],
+    queryFn: () => fetchPropertyUsedBy(entityKey, draftId, cursor, limit),
     enabled: !!entityKey,
   })
 }
@@ -888,7 +888,7 @@ export function PropertyDetail({
       <AccordionSection
         id="used-by"
         title="Used By"
-        count={usedByData?.length}
+        count={usedByData?.items.length}
         defaultOpen
       >
         {usedByLoading ? (
@@ -896,9 +896,9 @@ export function PropertyDetail({
             <Skeleton className="h-8 w-full" />
             <Skeleton className="h-8 w-full" />
           </div>
-        ) : usedByData && usedByData.length > 0 ? (
+        ) : usedByData && usedByData.items.length > 0 ? (
           <div className="space-y-2">
-            {usedByData.map((category: EntityWithStatus) => (
+            {usedByData.items.map((category: EntityWithStatus) => (
               <div
                 key={category.entity_key}
                 className="flex items-center justify-between p-2 rounded hover:bg-muted/50 cursor-pointer"
@@ -925,6 +925,11 @@ export function PropertyDetail({
                 )}
               </div>
             ))}
+            {usedByData.has_next && (
+              <p className="text-xs text-muted-foreground/60">
+                Showing the first {usedByData.items.length} categories
+              </p>
+            )}
           </div>
         ) : (
           <p className="text-xs text-muted-foreground/60">